@@ -0,0 +1,78 @@
+"""
+CSV parse engine karşılaştırması (C parser / pyarrow).
+
+analysis-service/data altındaki CSV'ler satırları tekrarlanarak istenen boyuta büyütülür
+ve her engine için DataLoader.load_data süresi ölçülür.
+
+Kullanım (analysis-service klasöründen):
+    PYTHONPATH=.:src python benchmarks/csv_engine_benchmark.py --rows 1000000 10000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "src")]
+
+import pandas as pd
+from config.config import DataConfig
+from data.loader import DataLoader, PYARROW_AVAILABLE
+
+ENGINES = {
+    "c": {"csv_engine": "c"},
+    "pyarrow": {"csv_engine": "pyarrow"},
+}
+
+
+def scale_csv(source: str, n_rows: int, target_dir: str) -> str:
+    """Kaynak CSV'nin satırlarını tekrarlayarak n_rows satırlık dosya üret"""
+    base = pd.read_csv(source)
+    target = os.path.join(target_dir, f"{os.path.splitext(os.path.basename(source))[0]}_{n_rows}.csv")
+    full, rest = divmod(n_rows, len(base))
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(",".join(map(str, base.columns)) + "\n")
+        for _ in range(full):
+            base.to_csv(f, index=False, header=False)
+        base.head(rest).to_csv(f, index=False, header=False)
+    return target
+
+
+def bench(path: str, engine: str, repeat: int) -> float:
+    config = DataConfig()
+    for key, value in ENGINES[engine].items():
+        setattr(config, key, value)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = DataLoader(path, config=config).load_data(optimize_memory=False)
+        best = min(best, time.perf_counter() - start)
+        del df
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--data-dir", default=os.path.join(ROOT, "data"))
+    args = parser.parse_args()
+
+    engines = list(ENGINES) if PYARROW_AVAILABLE else ["c"]
+    sources = [os.path.join(args.data_dir, name) for name in sorted(os.listdir(args.data_dir)) if name.endswith(".csv")]
+    print(f"{'dosya':<40} {'satır':>10} {'MB':>8} {'engine':<22} {'süre (s)':>9} {'satır/s':>12} {'MB/s':>8}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for source in sources:
+            for n_rows in args.rows:
+                path = scale_csv(source, n_rows, tmp_dir)
+                size_mb = os.path.getsize(path) / 1024 / 1024
+                for engine in engines:
+                    seconds = bench(path, engine, args.repeat)
+                    print(f"{os.path.basename(source):<40} {n_rows:>10} {size_mb:>8.1f} {engine:<22} "
+                          f"{seconds:>9.2f} {n_rows / seconds:>12,.0f} {size_mb / seconds:>8.1f}")
+                os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
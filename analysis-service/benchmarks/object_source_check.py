@@ -0,0 +1,89 @@
+"""
+s3:// kaynaklardan Feather/Arrow okuma kontrolü: kayıt batch'leri RANGE_BLOCK_SIZE'dan büyük olduğunda
+MinIOObjectReader tamponu birden fazla ranged GET ile doldurmalı (pyarrow kısa okumayı hata sayar).
+
+MinIO yerine bellekteki nesneleri ranged GET ile döndüren sahte istemci kullanılır; nesneden tam ve parçalı
+okunan frame'ler yazılan frame ile karşılaştırılır, fark varsa çıkış kodu 1 olur.
+
+Kullanım (analysis-service klasöründen):
+    PYTHONPATH=.:src python benchmarks/object_source_check.py --rows 400000
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "src")]
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from config.config import DataConfig
+from data.loader import DataLoader
+from storage.object_source import RANGE_BLOCK_SIZE
+
+
+class _RangeResponse(io.BytesIO):
+    def release_conn(self):
+        pass
+
+
+class InMemoryObjectClient:
+    """get_object_range ve stat_object'i bellekteki baytlarla karşılayan sahte MinIO istemcisi"""
+    def __init__(self, objects):
+        self.objects = objects
+
+    def stat_object(self, key, bucket_name=None):
+        return SimpleNamespace(size=len(self.objects[key]), etag=str(hash(self.objects[key])))
+
+    def get_object_range(self, key, offset=0, length=0, bucket_name=None):
+        data = self.objects[key]
+        end = len(data) if length == 0 else offset + length
+        return _RangeResponse(data[offset:end])
+
+
+def write_arrow(df: pd.DataFrame, path: str, batch_rows: int, feather: bool):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if feather:
+        import pyarrow.feather as feather_module
+        feather_module.write_feather(table, path, chunksize=batch_rows, compression="uncompressed")
+        return
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=batch_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=400_000)
+    parser.add_argument("--cols", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.standard_normal((args.rows, args.cols)), columns=[f"c{i}" for i in range(args.cols)])
+    batch_rows = args.rows
+    batch_bytes = batch_rows * args.cols * 8
+    print(f"batch boyutu: {batch_bytes} bayt (RANGE_BLOCK_SIZE={RANGE_BLOCK_SIZE})")
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for ext, feather in ((".feather", True), (".arrow", False)):
+            path = os.path.join(tmp_dir, f"data{ext}")
+            write_arrow(df, path, batch_rows, feather)
+            with open(path, "rb") as f:
+                client = InMemoryObjectClient({f"data{ext}": f.read()})
+            config = DataConfig(streaming_threshold_mb=1 << 20)
+            loader = DataLoader(f"s3://bucket/data{ext}", config=config, minio_client=client)
+            loaded = loader.load_data()
+            ok = loaded is not None and loaded.equals(df)
+            chunks = list(DataLoader(f"s3://bucket/data{ext}", config=config, minio_client=client).load_data(streaming=True, chunksize=50_000))
+            chunked_ok = bool(chunks) and pd.concat(chunks, ignore_index=True).equals(df)
+            failed |= not (ok and chunked_ok)
+            print(f"{ext:<10} tam okuma: {'evet' if ok else 'hayır'}  parçalı okuma: {'evet' if chunked_ok else 'hayır'}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
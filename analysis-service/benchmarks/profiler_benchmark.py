@@ -0,0 +1,179 @@
+"""
+Tek geçişlik profiler ile eski analyze_data_structure + suggest_preprocessing_steps karşılaştırması.
+
+Her iki yol için sütun taraması sayısı (pandas tarama çağrıları, DataFrame düzeyindeki çağrılar sütun
+sayısı kadar sayılır) ve süre ölçülür. Veri, analysis-service/data altındaki CSV'lerden örneklenerek büyütülür.
+
+Kullanım (analysis-service klasöründen):
+    PYTHONPATH=.:src python benchmarks/profiler_benchmark.py --rows 100000 1000000
+"""
+import argparse
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "src")]
+
+import numpy as np
+import pandas as pd
+from data.loader import DataLoader
+
+# Tam veri taraması yapan pandas metotları: (sınıf, metot adı)
+SCAN_METHODS = [
+    (pd.Series, "isnull"), (pd.Series, "isna"), (pd.Series, "nunique"), (pd.Series, "unique"),
+    (pd.Series, "value_counts"), (pd.Series, "quantile"), (pd.Series, "__lt__"), (pd.Series, "__gt__"),
+    (pd.DataFrame, "isnull"), (pd.DataFrame, "isna"), (pd.DataFrame, "duplicated"), (pd.DataFrame, "memory_usage"),
+]
+
+
+@contextmanager
+def count_scans():
+    """Tarama çağrılarını say (iç içe çağrılar yalnızca en dıştaki için sayılır)"""
+    counter = {"scans": 0, "depth": 0}
+    originals = []
+
+    def wrap(cls, name, original):
+        def wrapper(self, *args, **kwargs):
+            if counter["depth"] == 0:
+                counter["scans"] += len(self.columns) if isinstance(self, pd.DataFrame) else 1
+            counter["depth"] += 1
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                counter["depth"] -= 1
+        return wrapper
+
+    for cls, name in SCAN_METHODS:
+        original = getattr(cls, name)
+        originals.append((cls, name, original))
+        setattr(cls, name, wrap(cls, name, original))
+    original_hash = pd.util.hash_pandas_object
+
+    def hash_wrapper(obj, *args, **kwargs):
+        if counter["depth"] == 0:
+            counter["scans"] += len(obj.columns) if isinstance(obj, pd.DataFrame) else 1
+        counter["depth"] += 1
+        try:
+            return original_hash(obj, *args, **kwargs)
+        finally:
+            counter["depth"] -= 1
+    pd.util.hash_pandas_object = hash_wrapper
+    try:
+        yield counter
+    finally:
+        for cls, name, original in originals:
+            setattr(cls, name, original)
+        pd.util.hash_pandas_object = original_hash
+
+
+def legacy_analyze(df):
+    """Profiler öncesi analyze_data_structure"""
+    analysis = {
+        'shape': tuple(int(x) for x in df.shape),
+        'columns': list(df.columns),
+        'data_types': {col: str(dtype) for col, dtype in df.dtypes.items()},
+        'missing_values': {col: int(df[col].isnull().sum()) for col in df.columns},
+        'missing_percentage': {col: float((df[col].isnull().sum() / len(df) * 100)) for col in df.columns},
+        'numeric_columns': list(df.select_dtypes(include=[np.number]).columns),
+        'categorical_columns': list(df.select_dtypes(include=['object', 'category']).columns),
+        'datetime_columns': list(df.select_dtypes(include=['datetime64']).columns),
+        'unique_values': {col: int(df[col].nunique()) for col in df.columns},
+        'memory_usage': int(df.memory_usage(deep=True).sum()),
+        'duplicated_rows': int(df.duplicated().sum())
+    }
+    potential_targets = []
+    for col in df.columns:
+        unique_count = int(df[col].nunique())
+        if 2 <= unique_count <= 10:
+            potential_targets.append({'column': col, 'unique_count': unique_count,
+                                      'unique_values': [str(val) for val in df[col].unique()]})
+    analysis['potential_target_columns'] = potential_targets
+    return analysis
+
+
+def legacy_suggest(df):
+    """Profiler öncesi suggest_preprocessing_steps"""
+    suggestions = []
+    missing_percent = df.isnull().sum() / len(df) * 100
+    high_missing_cols = missing_percent[missing_percent > 50].index.tolist()
+    if len(high_missing_cols) > 0:
+        suggestions.append(f"Yüksek eksik değerli sütunları kaldırın: {high_missing_cols}")
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+    high_cardinality_cols = [col for col in categorical_cols if df[col].nunique() > 50]
+    if len(high_cardinality_cols) > 0:
+        suggestions.append(f"Yüksek kardinaliteli kategorik sütunları işleyin: {high_cardinality_cols}")
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    if len(numeric_cols) > 0:
+        suggestions.append("Sayısal sütunları standartlaştırın")
+    if df.duplicated().sum() > 0:
+        suggestions.append(f"Duplicate satırları kaldırın: {df.duplicated().sum()} adet")
+    for col in numeric_cols:
+        Q1 = df[col].quantile(0.25)
+        Q3 = df[col].quantile(0.75)
+        IQR = Q3 - Q1
+        outliers = df[(df[col] < Q1 - 1.5 * IQR) | (df[col] > Q3 + 1.5 * IQR)]
+        if len(outliers) > len(df) * 0.05:
+            suggestions.append(f"'{col}' sütununda outlier kontrolü yapın")
+    return suggestions
+
+
+def run_legacy(df, loader):
+    return legacy_analyze(df), legacy_suggest(df)
+
+
+def run_profiler(df, loader):
+    profile = loader.profile(df)
+    return loader.analyze_data_structure(profile), loader.suggest_preprocessing_steps(profile)
+
+
+def measure(func, df, loader, repeat):
+    with count_scans() as counter:
+        result = func(df, loader)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df, loader)
+        best = min(best, time.perf_counter() - start)
+    return result, counter["scans"], best
+
+
+def same_result(legacy, profiled):
+    """Ortak anahtarlarda sonuçlar aynı mı (potansiyel hedeflerde değer sırası önemsiz)"""
+    (old_analysis, old_suggestions), (new_analysis, new_suggestions) = legacy, profiled
+    for key, value in old_analysis.items():
+        if key == 'potential_target_columns':
+            old = {t['column']: (t['unique_count'], sorted(v for v in t['unique_values'] if v != 'nan')) for t in value}
+            new = {t['column']: (t['unique_count'], sorted(t['unique_values'])) for t in new_analysis[key]}
+            if old != new:
+                return False
+        elif new_analysis[key] != value:
+            return False
+    return old_suggestions == new_suggestions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--data-dir", default=os.path.join(ROOT, "data"))
+    args = parser.parse_args()
+
+    sources = [os.path.join(args.data_dir, name) for name in sorted(os.listdir(args.data_dir)) if name.endswith(".csv")]
+    print(f"{'dosya':<40} {'satır':>10} {'yol':<10} {'tarama':>8} {'süre (s)':>9} {'aynı sonuç':>11}")
+    for source in sources:
+        base = pd.read_csv(source)
+        loader = DataLoader(source)
+        for n_rows in args.rows:
+            df = base.sample(n_rows, replace=True, random_state=0).reset_index(drop=True)
+            legacy, legacy_scans, legacy_time = measure(run_legacy, df, loader, args.repeat)
+            profiled, profiler_scans, profiler_time = measure(run_profiler, df, loader, args.repeat)
+            same = "evet" if same_result(legacy, profiled) else "hayır"
+            name = os.path.basename(source)
+            print(f"{name:<40} {n_rows:>10} {'eski':<10} {legacy_scans:>8} {legacy_time:>9.2f}")
+            print(f"{name:<40} {n_rows:>10} {'profiler':<10} {profiler_scans:>8} {profiler_time:>9.2f} {same:>11}")
+
+
+if __name__ == "__main__":
+    main()
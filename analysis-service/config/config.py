@@ -38,10 +38,84 @@ class ModelConfig:
         )
 
 
+@dataclass
+class DataConfig:
+    chunk_size: int = int(os.getenv("DATA_CHUNK_SIZE", "100000"))
+    streaming_threshold_mb: int = int(os.getenv("DATA_STREAMING_THRESHOLD_MB", "512"))
+    sample_size: int = int(os.getenv("DATA_SAMPLE_SIZE", "100000"))
+    train_max_rows: int = int(os.getenv("DATA_TRAIN_MAX_ROWS", "1000000"))
+    train_max_memory_mb: int = int(os.getenv("DATA_TRAIN_MAX_MEMORY_MB", "2048"))
+    optimize_memory: bool = os.getenv("DATA_OPTIMIZE_MEMORY", "false").lower() == "true"
+    category_threshold: float = float(os.getenv("DATA_CATEGORY_THRESHOLD", "0.5"))
+    dataset_cache_dir: str = os.getenv("DATASET_CACHE_DIR", "/tmp/dataset_cache")
+    dataset_cache_max_mb: int = int(os.getenv("DATASET_CACHE_MAX_MB", "20480"))
+    dataset_cache_ttl_seconds: int = int(os.getenv("DATASET_CACHE_TTL_SECONDS", "604800"))
+    csv_engine: str = os.getenv("CSV_ENGINE", "c")
+    excel_cache_dir: str = os.getenv("EXCEL_CACHE_DIR", "/tmp/excel_cache")
+    excel_cache_max_mb: int = int(os.getenv("EXCEL_CACHE_MAX_MB", "4096"))
+    excel_cache_ttl_seconds: int = int(os.getenv("EXCEL_CACHE_TTL_SECONDS", "604800"))
+    source_buckets: str = os.getenv("DATA_SOURCE_BUCKETS", "")
+    approximate_profile: bool = os.getenv("DATA_APPROXIMATE_PROFILE", "false").lower() == "true"
+    hll_precision: int = int(os.getenv("DATA_HLL_PRECISION", "14"))
+    kll_k: int = int(os.getenv("DATA_KLL_K", "200"))
+    duplicate_memory_mb: int = int(os.getenv("DATA_DUPLICATE_MEMORY_MB", "256"))
+    spill_dir: str = os.getenv("DATA_SPILL_DIR", "/tmp/spill")
+    profile_workers: int = int(os.getenv("DATA_PROFILE_WORKERS", "0"))
+    parallel_min_columns: int = int(os.getenv("DATA_PARALLEL_MIN_COLUMNS", "200"))
+    correlation_sample_rows: int = int(os.getenv("DATA_CORRELATION_SAMPLE_ROWS", "500000"))
+    sparse_features: bool = os.getenv("DATA_SPARSE_FEATURES", "false").lower() == "true"
+    preprocess_inplace: bool = os.getenv("DATA_PREPROCESS_INPLACE", "false").lower() == "true"
+    feature_dtype: str = os.getenv("DATA_FEATURE_DTYPE", "float64")
+    gzip_max_decompressed_mb: int = int(os.getenv("GZIP_MAX_DECOMPRESSED_MB", "10240"))
+    gzip_max_ratio: float = float(os.getenv("GZIP_MAX_RATIO", "1000"))
+    analysis_cache_entries: int = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "128"))
+    analysis_cache_max_mb: int = int(os.getenv("ANALYSIS_CACHE_MAX_MB", "64"))
+    analysis_cache_ttl_seconds: int = int(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", "86400"))
+    analysis_cache_persist: bool = os.getenv("ANALYSIS_CACHE_PERSIST", "true").lower() == "true"
+
+    @staticmethod
+    def from_env() -> "DataConfig":
+        return DataConfig(
+            chunk_size=int(os.getenv("DATA_CHUNK_SIZE", "100000")),
+            streaming_threshold_mb=int(os.getenv("DATA_STREAMING_THRESHOLD_MB", "512")),
+            sample_size=int(os.getenv("DATA_SAMPLE_SIZE", "100000")),
+            train_max_rows=int(os.getenv("DATA_TRAIN_MAX_ROWS", "1000000")),
+            train_max_memory_mb=int(os.getenv("DATA_TRAIN_MAX_MEMORY_MB", "2048")),
+            optimize_memory=os.getenv("DATA_OPTIMIZE_MEMORY", "false").lower() == "true",
+            category_threshold=float(os.getenv("DATA_CATEGORY_THRESHOLD", "0.5")),
+            dataset_cache_dir=os.getenv("DATASET_CACHE_DIR", "/tmp/dataset_cache"),
+            dataset_cache_max_mb=int(os.getenv("DATASET_CACHE_MAX_MB", "20480")),
+            dataset_cache_ttl_seconds=int(os.getenv("DATASET_CACHE_TTL_SECONDS", "604800")),
+            csv_engine=os.getenv("CSV_ENGINE", "c"),
+            excel_cache_dir=os.getenv("EXCEL_CACHE_DIR", "/tmp/excel_cache"),
+            excel_cache_max_mb=int(os.getenv("EXCEL_CACHE_MAX_MB", "4096")),
+            excel_cache_ttl_seconds=int(os.getenv("EXCEL_CACHE_TTL_SECONDS", "604800")),
+            source_buckets=os.getenv("DATA_SOURCE_BUCKETS", ""),
+            approximate_profile=os.getenv("DATA_APPROXIMATE_PROFILE", "false").lower() == "true",
+            hll_precision=int(os.getenv("DATA_HLL_PRECISION", "14")),
+            kll_k=int(os.getenv("DATA_KLL_K", "200")),
+            duplicate_memory_mb=int(os.getenv("DATA_DUPLICATE_MEMORY_MB", "256")),
+            spill_dir=os.getenv("DATA_SPILL_DIR", "/tmp/spill"),
+            profile_workers=int(os.getenv("DATA_PROFILE_WORKERS", "0")),
+            parallel_min_columns=int(os.getenv("DATA_PARALLEL_MIN_COLUMNS", "200")),
+            correlation_sample_rows=int(os.getenv("DATA_CORRELATION_SAMPLE_ROWS", "500000")),
+            sparse_features=os.getenv("DATA_SPARSE_FEATURES", "false").lower() == "true",
+            preprocess_inplace=os.getenv("DATA_PREPROCESS_INPLACE", "false").lower() == "true",
+            feature_dtype=os.getenv("DATA_FEATURE_DTYPE", "float64"),
+            gzip_max_decompressed_mb=int(os.getenv("GZIP_MAX_DECOMPRESSED_MB", "10240")),
+            gzip_max_ratio=float(os.getenv("GZIP_MAX_RATIO", "1000")),
+            analysis_cache_entries=int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "128")),
+            analysis_cache_max_mb=int(os.getenv("ANALYSIS_CACHE_MAX_MB", "64")),
+            analysis_cache_ttl_seconds=int(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", "86400")),
+            analysis_cache_persist=os.getenv("ANALYSIS_CACHE_PERSIST", "true").lower() == "true",
+        )
+
+
 @dataclass
 class Config:
     minio: MinIOConfig = field(default_factory=MinIOConfig)
     model: ModelConfig = field(default_factory=ModelConfig) 
+    data: DataConfig = field(default_factory=DataConfig)
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     data_path: str = os.getenv("DATA_PATH", "/app/data")
 
@@ -50,6 +124,7 @@ class Config:
         return Config(
             minio=MinIOConfig.from_env(),
             model=ModelConfig.from_env(),
+            data=DataConfig.from_env(),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             data_path=os.getenv("DATA_PATH", "/app/data"),
         )
@@ -6,8 +6,16 @@ import tempfile
 import pandas as pd
 from fastapi.responses import JSONResponse
 from .data_analysis_api import router as data_analysis_router
+from .dataset_api import router as dataset_router
+from .middleware import GzipRequestMiddleware
+from config.config import DataConfig
 
 app = FastAPI()
+# Sıkıştırılmış (Content-Encoding: gzip) istek gövdeleri akış halinde, boyut ve oran sınırıyla açılır
+_data_config = DataConfig.from_env()
+app.add_middleware(GzipRequestMiddleware, max_decompressed_bytes=_data_config.gzip_max_decompressed_mb * 1024 * 1024,
+                   max_ratio=_data_config.gzip_max_ratio)
 app.include_router(report_router, prefix="/api", tags=["Report Upload"])
 app.include_router(model_router, prefix="/api/models", tags=["Models"])
-app.include_router(data_analysis_router, prefix="/api/data", tags=["Data Analysis"]) 
\ No newline at end of file
+app.include_router(data_analysis_router, prefix="/api/data", tags=["Data Analysis"])
+app.include_router(dataset_router, prefix="/api/data", tags=["Datasets"]) 
\ No newline at end of file
@@ -1,73 +1,417 @@
-from fastapi import APIRouter, UploadFile, File, Form
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query
 from data.loader import DataLoader
 from data.preprocessor import DataPreprocessor
-import tempfile
+from data.aggregates import chart_aggregates
+from data.correlation import correlation_summary
+from data.sketches import Reservoir
+from data.profiler import DataProfiler
+import numpy as np
 import pandas as pd
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Optional
 import os
 import json
 from utils.logger import logger
+from storage.analysis_cache import get_analysis_cache
+from storage.dataset_registry import get_dataset_registry
+from storage.profile_store import get_profile_store
+from utils.upload import save_upload_to_tempfile
+from .dataset_api import resolve_dataset, load_options
 
 router = APIRouter()
 
+
+def _analysis_cache_key(loader: DataLoader, options: dict, optimize_memory: bool, approximate, **extra) -> Optional[str]:
+    """Analiz sonucunu etkileyen her şey anahtara girer: içerik, okuma seçenekleri ve ilgili ayarlar"""
+    config = loader.config
+    content_hash = loader.source_hash()
+    if content_hash is None:
+        return None
+    return get_analysis_cache().make_key(content_hash, {
+        **options,
+        "optimize_memory": optimize_memory,
+        "approximate": config.approximate_profile if approximate is None else approximate,
+        "sample_size": config.sample_size,
+        "streaming_threshold_mb": config.streaming_threshold_mb,
+        "csv_engine": config.csv_engine,
+        "category_threshold": config.category_threshold,
+        "hll_precision": config.hll_precision,
+        "kll_k": config.kll_k,
+        **extra
+    })
+
+def _analysis_result(metadata: dict, loader: DataLoader, profile: DataProfiler, memory_report=None) -> dict:
+    # Analiz ve öneriler aynı tek geçişlik profilden üretilir
+    return {
+        "dataset_id": metadata["dataset_id"],
+        "data_analysis": loader.analyze_data_structure(profile),
+        "preprocessing_suggestions": loader.suggest_preprocessing_steps(profile),
+        "memory_optimization": memory_report
+    }
+
+def _sse(event: str, payload) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+def _schema_event(df: pd.DataFrame, n_rows: Optional[int] = None) -> dict:
+    return {
+        "columns": [str(col) for col in df.columns],
+        "data_types": {str(col): str(dtype) for col, dtype in df.dtypes.items()},
+        "numeric_columns": [str(col) for col in df.select_dtypes(include=[np.number]).columns],
+        "categorical_columns": [str(col) for col in df.select_dtypes(include=['object', 'category']).columns],
+        "datetime_columns": [str(col) for col in df.select_dtypes(include=['datetime64']).columns],
+        "n_rows": n_rows
+    }
+
+def _missing_event(missing: dict, columns, n_rows: int) -> dict:
+    return {
+        "shape": [int(n_rows), len(columns)],
+        "missing_values": {str(col): int(missing.get(col, 0)) for col in columns},
+        "missing_percentage": {str(col): float(missing.get(col, 0) / n_rows * 100) if n_rows else 0.0 for col in columns}
+    }
+
+def _analysis_events(loader: DataLoader, metadata: dict, options: dict, optimize_memory: bool, approximate,
+                     cache_key: Optional[str], correlation_top_k: int):
+    """
+    /analyze/stream olayları: schema -> progress -> missing -> distributions -> correlations -> result.
+    Parçalı okumada eksik sayıları her parçada progress olayıyla güncellenir; korelasyon profil örnekleminden hesaplanır.
+    """
+    try:
+        cached = get_analysis_cache().get(cache_key) if cache_key else None
+        if cached is not None:
+            yield _sse("result", cached)
+            return
+        memory_report = None
+        if loader.should_stream():
+            profile = DataProfiler(**loader.profile_options(approximate))
+            for chunk in loader.iter_chunks(**options):
+                if profile.schema is None:
+                    yield _sse("schema", _schema_event(chunk))
+                profile.update(chunk)
+                yield _sse("progress", {"stage": "profile", "rows_processed": int(profile.n_rows),
+                                        "missing_values": {str(col): int(count) for col, count in profile.missing.items()}})
+            columns = list(profile.schema.columns) if profile.schema is not None else []
+            yield _sse("missing", _missing_event(profile.missing, columns, profile.n_rows))
+            correlation_source, n_rows = profile.source_frame(), profile.n_rows
+        else:
+            df = loader.load_data(optimize_memory=False, **options)
+            if df is None:
+                yield _sse("error", {"error": "Veri yüklenemedi"})
+                return
+            if optimize_memory:
+                # Profil eğitimin yüklediği frame üzerinden çıkarılır; optimizasyon yalnızca rapor için sığ kopyada yapılır
+                memory_report = loader.optimize_memory(df.copy(deep=False))[1]
+            yield _sse("schema", _schema_event(df, len(df)))
+            yield _sse("missing", _missing_event(df.isna().sum().to_dict(), df.columns, len(df)))
+            yield _sse("progress", {"stage": "profile", "rows_processed": 0})
+            profile = loader.profile(df, approximate=approximate)
+            correlation_source, n_rows = df, None
+        result = _analysis_result(metadata, loader, profile, memory_report)
+        yield _sse("distributions", {"data_analysis": result["data_analysis"],
+                                     "preprocessing_suggestions": result["preprocessing_suggestions"]})
+        yield _sse("progress", {"stage": "correlation", "rows_processed": int(profile.n_rows)})
+        if correlation_source is not None:
+            yield _sse("correlations", correlation_summary(correlation_source, top_k=correlation_top_k,
+                                                           sample_rows=loader.config.correlation_sample_rows, n_rows=n_rows))
+        if cache_key:
+            get_analysis_cache().put(cache_key, result)
+        yield _sse("result", result)
+    except Exception as e:
+        logger.error(f"Akışlı analiz hatası: {e}")
+        yield _sse("error", {"error": str(e)})
+
 @router.post("/analyze")
-async def analyze_data(file: UploadFile = File(...)):
+async def analyze_data(
+    file: UploadFile = File(None),
+    dataset_id: str = Form(None),
+    optimize_memory: bool = Form(None),
+    sheet_name: str = Form(None),
+    source_uri: str = Form(None),
+    usecols: str = Form(None),
+    drop_columns: str = Form(None),
+    row_filters: str = Form(None),
+    approximate: bool = Form(None)
+):
     """
-    Yüklenen veri dosyasını analiz eder ve önişleme önerileri sunar.
+    Yüklenen veri dosyasını (ya da kayıtlı dataset_id'yi) analiz eder ve önişleme önerileri sunar.
+    optimize_memory açıksa (verilmezse DATA_OPTIMIZE_MEMORY) veri tipleri küçültülünce kazanılacak bellek raporlanır;
+    profil, eğitimin yüklediği haliyle frame üzerinden çıkarılır.
+    Excel dosyalarında sheet_name ile yalnızca istenen sayfa okunur.
+    source_uri (s3://bucket/key) verilirse veri indirilmeden doğrudan MinIO'dan okunur.
+    usecols/drop_columns (JSON liste) ve row_filters ([[sütun, operatör, değer], ...]) okuma sırasında uygulanır.
+    approximate=true ile farklı değer, duplicate ve outlier sayıları sketch'lerle tahmin edilir;
+    data_analysis.error_bounds tahminlerin güven aralıklarını içerir.
+    Aynı içerik ve seçeneklerle tekrarlanan analizler önbellekten döner.
     """
     try:
-        # Dosyayı geçici olarak kaydet
-        suffix = '.' + file.filename.split('.')[-1]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
+        data_path, metadata = await resolve_dataset(file, dataset_id, source_uri)
+        options = load_options(metadata, sheet_name, usecols, drop_columns, row_filters)
         # DataLoader ile yükle
-        loader = DataLoader(tmp_path)
-        df = loader.load_data()
+        loader = DataLoader(data_path, content_hash=metadata["dataset_id"])
+        if optimize_memory is None:
+            optimize_memory = loader.config.optimize_memory
+        cache_key = _analysis_cache_key(loader, options, optimize_memory, approximate)
+        cached = get_analysis_cache().get(cache_key) if cache_key else None
+        if cached is not None:
+            logger.info(f"Analiz sonucu önbellekten döndü: {cache_key}")
+            return cached
+        memory_report = None
+        if loader.should_stream():
+            # Büyük dosyalar parça parça okunur, bellek kullanımı parça boyutuyla sınırlı kalır
+            logger.info("Büyük dosya algılandı, analiz parçalı okuma ile yapılıyor")
+            profile = loader.profile(loader.iter_chunks(**options), approximate=approximate)
+        else:
+            df = loader.load_data(optimize_memory=False, **options)
+            if df is None:
+                return JSONResponse(status_code=400, content={"error": "Veri yüklenemedi"})
+            if optimize_memory:
+                # Profil eğitimin yüklediği frame üzerinden çıkarılır; optimizasyon yalnızca rapor için sığ kopyada yapılır
+                memory_report = loader.optimize_memory(df.copy(deep=False))[1]
+            profile = loader.profile(df, approximate=approximate)
+        result = _analysis_result(metadata, loader, profile, memory_report)
+        if cache_key:
+            get_analysis_cache().put(cache_key, result)
+        return result
+    except HTTPException as e:
+        return JSONResponse(status_code=e.status_code, content={"error": e.detail})
+    except Exception as e:
+        return JSONResponse(status_code=500, content={"error": str(e)})
+
+@router.post("/analyze/stream")
+async def analyze_data_stream(
+    file: UploadFile = File(None),
+    dataset_id: str = Form(None),
+    optimize_memory: bool = Form(None),
+    sheet_name: str = Form(None),
+    source_uri: str = Form(None),
+    usecols: str = Form(None),
+    drop_columns: str = Form(None),
+    row_filters: str = Form(None),
+    approximate: bool = Form(None),
+    correlation_top_k: int = Form(0)
+):
+    """
+    /analyze'ın Server-Sent Events sürümü. Parametreler /analyze ile aynıdır; sonuç hazır olana kadar
+    aşama aşama olaylar gönderilir: schema, progress, missing, distributions, correlations ve son olarak
+    /analyze yanıtıyla aynı içerikte result (hata durumunda error). correlation_top_k > 0 ise
+    correlations olayı tam matris yerine en güçlü çiftleri taşır.
+    """
+    try:
+        data_path, metadata = await resolve_dataset(file, dataset_id, source_uri)
+        options = load_options(metadata, sheet_name, usecols, drop_columns, row_filters)
+        loader = DataLoader(data_path, content_hash=metadata["dataset_id"])
+        if optimize_memory is None:
+            optimize_memory = loader.config.optimize_memory
+        cache_key = _analysis_cache_key(loader, options, optimize_memory, approximate)
+    except HTTPException as e:
+        return JSONResponse(status_code=e.status_code, content={"error": e.detail})
+    except Exception as e:
+        return JSONResponse(status_code=500, content={"error": str(e)})
+    # Senkron üreteç thread havuzunda çalışır, olay döngüsü bloklanmaz
+    return StreamingResponse(_analysis_events(loader, metadata, options, optimize_memory, approximate, cache_key, correlation_top_k),
+                             media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@router.get("/profile/{dataset_id}")
+async def chart_profile(
+    dataset_id: str,
+    bins: int = Query(30, ge=1, le=500),
+    top_k: int = Query(10, ge=1, le=100),
+    sheet_name: str = None,
+    usecols: str = None,
+    drop_columns: str = None,
+    row_filters: str = None
+):
+    """
+    Veri analizi grafikleri için önceden toplanmış veriler döner: histogram kenarları ve sayıları,
+    beş sayı özetleri, "other" kovalı top-k değer frekansları ve korelasyon matrisi.
+    Arayüz grafikleri ham satırlar yerine bu birkaç KB'lık özetten çizer. Sonuç analiz önbelleğinde tutulur.
+    """
+    try:
+        data_path, metadata = await resolve_dataset(dataset_id=dataset_id)
+        options = load_options(metadata, sheet_name, usecols, drop_columns, row_filters)
+        loader = DataLoader(data_path, content_hash=metadata["dataset_id"])
+        cache_key = _analysis_cache_key(loader, options, False, False, kind="chart_aggregates", bins=bins, top_k=top_k)
+        cached = get_analysis_cache().get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+        if loader.should_stream():
+            # Profil ilk geçişte, histogram ve korelasyon ikinci geçişte parça parça hesaplanır
+            profile = loader.profile(loader.iter_chunks(**options), approximate=False)
+            frames = loader.iter_chunks(**options)
+        else:
+            df = loader.load_data(optimize_memory=False, **options)
+            if df is None:
+                return JSONResponse(status_code=400, content={"error": "Veri yüklenemedi"})
+            profile = loader.profile(df, approximate=False)
+            frames = [df]
+        result = {"dataset_id": metadata["dataset_id"], **chart_aggregates(profile, frames, bins=bins, top_k=top_k)}
+        if cache_key:
+            get_analysis_cache().put(cache_key, result)
+        return result
+    except HTTPException as e:
+        return JSONResponse(status_code=e.status_code, content={"error": e.detail})
+    except Exception as e:
+        return JSONResponse(status_code=500, content={"error": str(e)})
+
+@router.get("/correlation/{dataset_id}")
+async def correlation(
+    dataset_id: str,
+    method: str = Query("pearson", pattern="^(pearson|spearman)$"),
+    top_k: int = Query(0, ge=0, le=10000),
+    threshold: float = Query(0.0, ge=0.0, le=1.0),
+    sheet_name: str = None,
+    usecols: str = None,
+    drop_columns: str = None,
+    row_filters: str = None
+):
+    """
+    Sayısal sütunların korelasyonu (float32 BLAS, Pearson ya da sıra tabanlı Spearman).
+    top_k > 0 ise tam matris yerine mutlak korelasyonu threshold'u aşan en güçlü top_k çift döner.
+    Satır sayısı DATA_CORRELATION_SAMPLE_ROWS'u aşarsa hesap rastgele örneklem üzerinden yapılır.
+    """
+    try:
+        data_path, metadata = await resolve_dataset(dataset_id=dataset_id)
+        options = load_options(metadata, sheet_name, usecols, drop_columns, row_filters)
+        loader = DataLoader(data_path, content_hash=metadata["dataset_id"])
+        sample_rows = loader.config.correlation_sample_rows
+        cache_key = _analysis_cache_key(loader, options, False, False, kind="correlation", method=method,
+                                        top_k=top_k, threshold=threshold, correlation_sample_rows=sample_rows)
+        cached = get_analysis_cache().get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+        if loader.should_stream():
+            # Büyük dosyada örneklem okuma sırasında alınır, tüm veri belleğe gelmez
+            reservoir = Reservoir(sample_rows)
+            for chunk in loader.iter_chunks(**options):
+                reservoir.update(chunk)
+            df, n_rows = reservoir.frame(), reservoir.seen
+        else:
+            df = loader.load_data(optimize_memory=False, **options)
+            n_rows = None
         if df is None:
             return JSONResponse(status_code=400, content={"error": "Veri yüklenemedi"})
-        # Analiz ve öneriler
-        analysis = loader.analyze_data_structure(df)
-        suggestions = loader.suggest_preprocessing_steps(df)
-        # Geçici dosyayı sil
-        os.unlink(tmp_path)
+        result = {"dataset_id": metadata["dataset_id"],
+                  **correlation_summary(df, method=method, top_k=top_k, threshold=threshold, sample_rows=sample_rows, n_rows=n_rows)}
+        if cache_key:
+            get_analysis_cache().put(cache_key, result)
+        return result
+    except HTTPException as e:
+        return JSONResponse(status_code=e.status_code, content={"error": e.detail})
+    except Exception as e:
+        return JSONResponse(status_code=500, content={"error": str(e)})
+
+@router.post("/profile/{dataset_id}/append")
+async def append_profile(dataset_id: str, file: UploadFile = File(...)):
+    """
+    Kayıtlı veri setine gelen yeni satırları saklanan profile ekler.
+    Profil yoksa veri setinden bir kez (approximate modda) çıkarılır; sonraki çağrılarda yalnızca yeni
+    satırlar profillenip birleştirilir, maliyet eklenen veriyle orantılıdır. Aynı dosya tekrar gönderilirse profil değişmez.
+    Eklenen partiler veri setinin yanında saklanır; saklanan profil uyumsuz hale gelirse (profiler sürümü ya da
+    sketch ayarları değiştiyse) profil veri setinden yeniden çıkarılıp partiler sırayla tekrar uygulanır.
+    """
+    tmp_path = None
+    try:
+        registry = get_dataset_registry()
+        try:
+            metadata = registry.get_metadata(dataset_id)
+        except KeyError as e:
+            raise HTTPException(status_code=404, detail=e.args[0])
+        store = get_profile_store()
+        loader = DataLoader(registry.get_path(dataset_id, metadata), content_hash=dataset_id)
+        options = loader.profile_options(approximate=True)
+        appends = registry.list_appends(dataset_id)
+        record = store.load(dataset_id, options)
+        if record is not None and record["batches"] != [entry["batch_hash"] for entry in appends]:
+            logger.info(f"Saklanan profil eklenen partilerle uyuşmuyor, yeniden çıkarılacak: {dataset_id}")
+            record = None
+        changed = record is None
+        if record is None:
+            logger.info(f"Veri seti için güncel profil yok, profil çıkarılıp {len(appends)} parti yeniden uygulanıyor: {dataset_id}")
+            record = {"profile": loader.profile(loader.iter_chunks(**load_options(metadata)), approximate=True), "batches": []}
+            for entry in appends:
+                replay_loader = DataLoader(registry.get_append_path(dataset_id, entry), content_hash=entry["batch_hash"])
+                record["profile"].merge(replay_loader.profile(replay_loader.iter_chunks(), approximate=True))
+                record["batches"].append(entry["batch_hash"])
+        profile = record["profile"]
+        tmp_path, batch_hash, _ = await save_upload_to_tempfile(file)
+        appended_rows = 0
+        if batch_hash in record["batches"]:
+            logger.info(f"Parti daha önce eklenmiş, profil değişmedi: {batch_hash}")
+        else:
+            batch_loader = DataLoader(tmp_path, content_hash=batch_hash)
+            batch = batch_loader.profile(batch_loader.iter_chunks(), approximate=True)
+            if batch.schema is None:
+                return JSONResponse(status_code=400, content={"error": "Eklenen veri yüklenemedi"})
+            if profile.schema is not None and set(batch.schema.columns) != set(profile.schema.columns):
+                return JSONResponse(status_code=400, content={"error": "Eklenen verinin sütunları veri setiyle uyuşmuyor"})
+            # Parti profilden önce kalıcı hale getirilir; profil kaybolsa da satırlar yeniden uygulanabilir
+            registry.add_append(dataset_id, tmp_path, batch_hash, file.filename)
+            appended_rows = batch.n_rows
+            profile.merge(batch)
+            record["batches"].append(batch_hash)
+            changed = True
+        if changed:
+            store.save(dataset_id, profile, record["batches"], options)
         return {
-            "data_analysis": analysis,
-            "preprocessing_suggestions": suggestions
+            "dataset_id": dataset_id,
+            "appended_rows": int(appended_rows),
+            "batches": len(record["batches"]),
+            "data_analysis": loader.analyze_data_structure(profile),
+            "preprocessing_suggestions": loader.suggest_preprocessing_steps(profile)
         }
+    except HTTPException as e:
+        return JSONResponse(status_code=e.status_code, content={"error": e.detail})
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
+    finally:
+        if tmp_path:
+            os.unlink(tmp_path)
+
+@router.get("/analyze/cache/stats")
+def analysis_cache_stats():
+    """
+    Analiz önbelleğinin isabet/ıska sayaçlarını, doluluğunu ve sınırlarını döner.
+    """
+    return get_analysis_cache().stats()
 
 @router.post("/preprocess")
 async def preprocess_data(
-    file: UploadFile = File(...),
+    file: UploadFile = File(None),
+    dataset_id: str = Form(None),
     config: str = Form(None),
-    target_column: str = Form(None)
+    target_column: str = Form(None),
+    sheet_name: str = Form(None),
+    source_uri: str = Form(None),
+    usecols: str = Form(None),
+    drop_columns: str = Form(None),
+    row_filters: str = Form(None)
 ):
     """
-    Yüklenen veri dosyasını ve önişleme ayarlarını alır, önişleme uygular ve sonucu döner.
+    Yüklenen veri dosyasını (ya da kayıtlı dataset_id'yi) ve önişleme ayarlarını alır, önişleme uygular ve sonucu döner.
+    Sütun seçimi ve satır filtreleri /analyze ile aynıdır; kaldırılan sütunlar hiç parse edilmez.
     """
     try:
-        suffix = '.' + file.filename.split('.')[-1]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-        df = pd.read_csv(tmp_path)
+        data_path, metadata = await resolve_dataset(file, dataset_id, source_uri)
+        df = DataLoader(data_path, content_hash=metadata["dataset_id"]).load_data(**load_options(metadata, sheet_name, usecols, drop_columns, row_filters))
+        if df is None:
+            return JSONResponse(status_code=400, content={"error": "Veri yüklenemedi"})
         config_dict = json.loads(config) if config else {}
         preprocessor = DataPreprocessor(config=config_dict)
         # Target sütunu kullanıcıdan alınabilir veya otomatik tespit edilir
         X_train, X_test, y_train, y_test = preprocessor.preprocess(df, target_column=target_column)
         info = preprocessor.get_preprocessing_info()
+        if hasattr(X_train, 'toarray'):
+            # Seyrek modun CSR çıktısı JSON için yoğunlaştırılır
+            X_train = X_train.toarray()
         # Sonuçları DataFrame olarak birleştir (örnek: sadece train setini dönebiliriz)
         processed_df = pd.DataFrame(X_train, columns=info['feature_names'][:X_train.shape[1]])
         # Sonuçları JSON olarak döndür
-        os.unlink(tmp_path)
         return {
+            "dataset_id": metadata["dataset_id"],
             "preprocessing_info": info,
             "processed_data": processed_df.to_dict(orient="records"),  # TÜM SATIRLAR
             "y_train": y_train.tolist()
         }
+    except HTTPException as e:
+        return JSONResponse(status_code=e.status_code, content={"error": e.detail})
     except Exception as e:
-        return JSONResponse(status_code=500, content={"error": str(e)}) 
\ No newline at end of file
+        return JSONResponse(status_code=500, content={"error": str(e)})
@@ -0,0 +1,140 @@
+from fastapi import APIRouter, UploadFile, File, HTTPException
+from typing import Optional, Tuple, Dict, Any
+import json
+import os
+from data.loader import DataLoader, normalize_row_filters
+from data.compression import split_compression
+from storage.object_source import is_object_uri, parse_object_uri
+from storage.dataset_registry import get_dataset_registry
+from utils.logger import logger
+from utils.upload import save_upload_to_tempfile
+
+router = APIRouter()
+
+
+def _resolve_source_uri(registry, source_uri: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    s3://bucket/key kaynağını doğrular. Nesne indirilmez; DataLoader doğrudan MinIO'dan okur.
+    Yalnızca DATA_SOURCE_BUCKETS (boşsa varsayılan bucket) içindeki nesnelere izin verilir.
+    """
+    if not is_object_uri(source_uri):
+        raise HTTPException(status_code=400, detail=f"Geçersiz nesne adresi: {source_uri}")
+    bucket, key = parse_object_uri(source_uri)
+    allowed = [b.strip() for b in registry.config.source_buckets.split(",") if b.strip()] or [registry.minio_client.config.bucket_name]
+    if bucket not in allowed:
+        raise HTTPException(status_code=403, detail=f"Bu bucket'tan okumaya izin verilmiyor: {bucket}")
+    metadata = {
+        "dataset_id": None,
+        "original_filename": os.path.basename(key),
+        "source_format": split_compression(key)[0],
+        "source_uri": source_uri
+    }
+    return source_uri, metadata
+
+
+async def resolve_dataset(file: Optional[UploadFile] = None, dataset_id: Optional[str] = None,
+                          source_uri: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+    """
+    Multipart dosya, dataset_id ya da s3://bucket/key kaynağından veri setini çözümler.
+    Dosya gönderilmişse kayıt defterine eklenir; dönüş: (dosya yolu ya da nesne adresi, metadata)
+    """
+    registry = get_dataset_registry()
+    if source_uri:
+        return _resolve_source_uri(registry, source_uri)
+    if dataset_id:
+        try:
+            metadata = registry.get_metadata(dataset_id)
+        except KeyError as e:
+            raise HTTPException(status_code=404, detail=e.args[0])
+    elif file is not None:
+        # Hash yükleme sırasında hesaplanır; aynı içerik için kayıt defteri dosyayı tekrar okumaz
+        tmp_path, content_hash, _ = await save_upload_to_tempfile(file)
+        try:
+            metadata = registry.register(tmp_path, file.filename, content_hash=content_hash)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        finally:
+            os.unlink(tmp_path)
+    else:
+        raise HTTPException(status_code=400, detail="Veri dosyası, dataset_id ya da source_uri gönderilmelidir")
+    return registry.get_path(metadata["dataset_id"], metadata), metadata
+
+
+def _parse_json_list(value: Optional[str], name: str) -> Optional[list]:
+    if not value:
+        return None
+    try:
+        parsed = json.loads(value)
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail=f"{name} geçerli bir JSON listesi olmalı")
+    if not isinstance(parsed, list):
+        raise HTTPException(status_code=400, detail=f"{name} geçerli bir JSON listesi olmalı")
+    return parsed
+
+
+def load_options(metadata: Dict[str, Any], sheet_name: Optional[str] = None, usecols: Optional[str] = None,
+                 drop_columns: Optional[str] = None, row_filters: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Uç noktalardan gelen okuma seçeneklerini DataLoader.load_data parametrelerine çevirir.
+    usecols/drop_columns JSON sütun listesi, row_filters [[sütun, operatör, değer], ...] biçiminde JSON'dur.
+    """
+    options = {}
+    if sheet_name and metadata.get("source_format") in ('.xlsx', '.xls'):
+        options['sheet_name'] = sheet_name
+    parsed_usecols = _parse_json_list(usecols, "usecols")
+    if parsed_usecols is not None:
+        options['usecols'] = parsed_usecols
+    parsed_drop = _parse_json_list(drop_columns, "drop_columns")
+    if parsed_drop:
+        options['drop_columns'] = parsed_drop
+    try:
+        parsed_filters = normalize_row_filters(_parse_json_list(row_filters, "row_filters"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if parsed_filters:
+        options['row_filters'] = parsed_filters
+    return options
+
+
+@router.post("/datasets")
+async def register_dataset(file: UploadFile = File(...)):
+    """
+    Veri dosyasını kaydeder ve diğer uç noktalarda kullanılabilecek dataset_id döner.
+    """
+    try:
+        _, metadata = await resolve_dataset(file=file)
+        return metadata
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Veri seti kayıt hatası: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/datasets/{dataset_id}")
+def get_dataset(dataset_id: str):
+    """
+    Kayıtlı veri setinin metadata'sını döner.
+    """
+    try:
+        return get_dataset_registry().get_metadata(dataset_id)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=e.args[0])
+
+
+@router.get("/datasets/{dataset_id}/sheets")
+def get_dataset_sheets(dataset_id: str):
+    """
+    Excel veri setindeki sayfa adlarını döner (hücreler parse edilmez).
+    """
+    registry = get_dataset_registry()
+    try:
+        metadata = registry.get_metadata(dataset_id)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=e.args[0])
+    if metadata.get("source_format") not in ('.xlsx', '.xls'):
+        raise HTTPException(status_code=400, detail="Veri seti bir Excel dosyası değil")
+    sheets = metadata.get("sheets")
+    if sheets is None:
+        sheets = DataLoader(registry.get_path(dataset_id, metadata), content_hash=dataset_id).list_sheets()
+    return {"dataset_id": dataset_id, "sheets": sheets}
@@ -0,0 +1,96 @@
+import zlib
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from utils.logger import logger
+
+
+# Tek decompress çağrısında üretilecek en fazla bayt; kalan girdi unconsumed_tail ile sonraki çağrıya taşınır
+DECOMPRESS_BLOCK_SIZE = 1024 * 1024
+# Sıkıştırma oranı sınırı bu kadar açılmış veriden sonra uygulanır (küçük gövdelerde oran anlamsızdır)
+RATIO_CHECK_MIN_BYTES = 16 * 1024 * 1024
+
+
+class DecompressedBodyTooLarge(Exception):
+    pass
+
+
+class GzipRequestMiddleware:
+    """
+    Content-Encoding: gzip ile gönderilen istek gövdelerini akış halinde açar.
+    Gövde belleğe alınmaz; her parça geldikçe en fazla DECOMPRESS_BLOCK_SIZE'lık bloklar halinde açılıp uygulamaya iletilir.
+    Açılmış boyut max_decompressed_bytes'ı ya da sıkıştırma oranı max_ratio'yu aşarsa (gzip bombası) istek 413 ile reddedilir.
+    """
+    def __init__(self, app, max_decompressed_bytes: int = 10 * 1024 ** 3, max_ratio: float = 1000.0):
+        self.app = app
+        self.max_decompressed_bytes = max_decompressed_bytes
+        self.max_ratio = max_ratio
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or Headers(scope=scope).get("content-encoding", "").lower() != "gzip":
+            await self.app(scope, receive, send)
+            return
+        # Açılmış gövdenin uzunluğu bilinmediğinden content-length da kaldırılır
+        scope = dict(scope)
+        scope["headers"] = [(k, v) for k, v in scope["headers"] if k not in (b"content-encoding", b"content-length")]
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        response_started = False
+        state = {"pending": b"", "more_body": True, "finished": False, "compressed": 0, "decompressed": 0, "rejected": None}
+
+        def check_limits():
+            if state["decompressed"] > self.max_decompressed_bytes:
+                state["rejected"] = f"açılmış gövde {self.max_decompressed_bytes} baytı aşıyor"
+            elif state["decompressed"] > RATIO_CHECK_MIN_BYTES and state["decompressed"] > self.max_ratio * max(state["compressed"], 1):
+                state["rejected"] = f"sıkıştırma oranı {self.max_ratio} sınırını aşıyor"
+            if state["rejected"]:
+                raise DecompressedBodyTooLarge(state["rejected"])
+
+        async def receive_decompressed():
+            if state["finished"]:
+                # Gövde bitti; sonraki mesajlar (ör. http.disconnect) olduğu gibi iletilir
+                return await receive()
+            # Önceki parçadan açılmamış girdi kaldıysa yeni mesaj beklemeden devam edilir
+            if not state["pending"]:
+                message = await receive()
+                if message["type"] != "http.request":
+                    return message
+                state["pending"] = message.get("body", b"")
+                state["more_body"] = message.get("more_body", False)
+                state["compressed"] += len(state["pending"])
+            body = decompressor.decompress(state["pending"], DECOMPRESS_BLOCK_SIZE)
+            state["pending"] = decompressor.unconsumed_tail
+            state["decompressed"] += len(body)
+            check_limits()
+            more_body = bool(state["pending"]) or state["more_body"]
+            if not more_body:
+                body += decompressor.flush()
+                state["finished"] = True
+            return {"type": "http.request", "body": body, "more_body": more_body}
+
+        async def send_tracked(message):
+            nonlocal response_started
+            if state["rejected"]:
+                # Form ayrıştırıcısı hatayı yakalayıp kendi yanıtını üretebilir; yerine 413 gönderilir
+                if message["type"] == "http.response.start" and not response_started:
+                    response_started = True
+                    await too_large_response(scope, receive, send)
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        def too_large_response(scope, receive, send):
+            logger.error(f"gzip istek gövdesi reddedildi: {state['rejected']}")
+            return JSONResponse(status_code=413, content={"error": f"Açılmış istek gövdesi çok büyük: {state['rejected']}"})(scope, receive, send)
+
+        try:
+            await self.app(scope, receive_decompressed, send_tracked)
+        except DecompressedBodyTooLarge:
+            if response_started:
+                raise
+            response_started = True
+            await too_large_response(scope, receive, send)
+        except zlib.error as e:
+            logger.error(f"gzip istek gövdesi açılamadı: {e}")
+            if response_started:
+                raise
+            await JSONResponse(status_code=400, content={"error": "Geçersiz gzip istek gövdesi"})(scope, receive, send)
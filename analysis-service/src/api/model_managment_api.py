@@ -7,6 +7,8 @@ from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 from services.training_service import train_model_pipeline
 from utils.logger import logger
+from data.compression import full_suffix
+from .dataset_api import resolve_dataset, load_options
 
 router = APIRouter()
 # logger = logging.getLogger("analysis-service")  # Artık loguru kullanılacak
@@ -54,32 +56,41 @@ async def train_model(
     random_state: Optional[int] = Form(None),
     target_column: str = Form(...),
     problem_type: str = Form(None),
-    data_file: UploadFile = File(...)
+    data_file: UploadFile = File(None),
+    dataset_id: str = Form(None),
+    sheet_name: str = Form(None),
+    source_uri: str = Form(None),
+    usecols: str = Form(None),
+    drop_columns: str = Form(None),
+    row_filters: str = Form(None)
 ):
     """
     API üzerinden model eğitimi başlatır.
+    Veri multipart dosya olarak, daha önce kaydedilmiş dataset_id ile ya da
+    MinIO'daki nesnenin adresiyle (source_uri=s3://bucket/key) verilebilir.
+    usecols/drop_columns ve row_filters ile yalnızca gereken sütun ve satırlar okunur.
     """
     try:
-        # Dosyayı geçici olarak kaydet
-        file_bytes = await data_file.read()
-        import tempfile
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp:
-            tmp.write(file_bytes)
-            tmp_path = tmp.name
+        data_path, metadata = await resolve_dataset(data_file, dataset_id, source_uri)
         # Yüklenen dosyanın gerçek adını (uzantısız) al
-        data_file_name = os.path.splitext(data_file.filename)[0]
-        logger.info(f"MODEL_TRAIN: data_file.filename = {data_file.filename}, data_file_name = {data_file_name}")
+        original_filename = metadata["original_filename"]
+        data_file_name = original_filename[:len(original_filename) - len(full_suffix(original_filename))]
+        logger.info(f"MODEL_TRAIN: dataset_id = {metadata['dataset_id']}, data_file_name = {data_file_name}")
         results = train_model_pipeline(
-            data_path=tmp_path,
+            data_path=data_path,
             model_name=model_name,
             model_type=model_type,
             test_size=test_size,
             random_state=random_state,
             target_column=target_column,
             problem_type=problem_type,
-            data_file_name=data_file_name
+            data_file_name=data_file_name,
+            content_hash=metadata["dataset_id"],
+            load_options=load_options(metadata, sheet_name, usecols, drop_columns, row_filters)
         )
-        return {"message": "Model(ler) eğitimi tamamlandı", "results": results}
+        return {"message": "Model(ler) eğitimi tamamlandı", "dataset_id": metadata["dataset_id"], "results": results}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Eğitim hatası: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -10,6 +10,8 @@ from pydantic import BaseModel
 import unicodedata
 import re as regex
 from typing import List
+import os
+from src.utils.upload import save_upload_to_tempfile
 
 def slugify(value: str) -> str:
     value = str(value)
@@ -32,13 +34,15 @@ async def upload_report(
     if not file.filename.endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Sadece PDF dosyaları yükleyebilirsiniz.")
 
+    tmp_path = None
     try:
-        data = await file.read()
+        # Rapor belleğe alınmadan geçici dosyaya akıtılır
+        tmp_path, _, _ = await save_upload_to_tempfile(file, suffix=".pdf")
         # Klasör yapısı: reports/{dataset_name}/{report_name}_vX.pdf (slugify)
         base_name = slugify(report_name)
         folder = f"reports/{slugify(dataset_name)}"
-        uploaded_object_name = minio_client.upload_report_bytes(
-            file_data=data,
+        uploaded_object_name = minio_client.upload_report_file(
+            file_path=tmp_path,
             base_name=base_name,
             ext="pdf",
             folder=folder
@@ -46,6 +50,9 @@ async def upload_report(
         return {"message": f"Rapor '{uploaded_object_name}' başarıyla yüklendi."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Beklenmeyen hata: {str(e)}")
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
 
 
 
@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional
+from data.profiler import DataProfiler
+
+
+def _number(value) -> Optional[float]:
+    return None if value is None or not np.isfinite(value) else float(value)
+
+
+class CorrelationAccumulator:
+    """
+    Parça parça Pearson korelasyonu (pandas corr gibi ikili tam gözlemlerle).
+    Her sütun çifti için gözlem sayısı, toplamlar ve çarpım toplamları matris çarpımlarıyla biriktirilir;
+    parçalar ve birikimler toplanarak birleştirilebilir. Büyük ortalamalı sütunlarda sayısal kaybı önlemek için
+    değerler ilk parçanın ortalaması kadar kaydırılır (korelasyon kaydırmadan etkilenmez).
+    dtype matris çarpımlarının hassasiyetidir (float32 BLAS'ta yaklaşık iki kat hızlıdır); birikimler float64 tutulur.
+    """
+    def __init__(self, columns: List[Any], dtype=np.float64):
+        self.columns = list(columns)
+        self.dtype = np.dtype(dtype)
+        self.shift = None
+        k = len(self.columns)
+        self.n = np.zeros((k, k))
+        self.sum_x = np.zeros((k, k))
+        self.sum_xx = np.zeros((k, k))
+        self.sum_xy = np.zeros((k, k))
+
+    def update(self, chunk: pd.DataFrame):
+        if not self.columns or not len(chunk):
+            return
+        self.update_values(chunk[self.columns].to_numpy(dtype=self.dtype, na_value=np.nan, copy=True))
+
+    def update_values(self, values: np.ndarray):
+        """Sütunları self.columns sırasında olan dtype matrisini biriktir (matris yerinde değiştirilir)"""
+        if not len(values):
+            return
+        present = ~np.isnan(values)
+        complete = bool(present.all())
+        if self.shift is None:
+            observed = present.sum(axis=0)
+            self.shift = np.where(observed > 0, np.nansum(values, axis=0, dtype=np.float64) / np.maximum(observed, 1), 0.0)
+        values -= self.shift.astype(self.dtype)
+        if complete:
+            # Eksik yoksa maske çarpımları gerekmez; sütun toplamları tüm çiftler için aynıdır
+            self.n += len(values)
+            self.sum_x += values.sum(axis=0, dtype=np.float64)[:, None]
+            self.sum_xx += np.einsum('ij,ij->j', values, values, dtype=np.float64)[:, None]
+        else:
+            # sum_x[i, j]: i sütununun, j sütunu da dolu olan satırlardaki toplamı
+            values[~present] = 0
+            mask = present.astype(self.dtype)
+            self.n += mask.T @ mask
+            self.sum_x += values.T @ mask
+            self.sum_xx += np.square(values).T @ mask
+        self.sum_xy += values.T @ values
+
+    def merge(self, other: "CorrelationAccumulator"):
+        # Birikimler yalnızca aynı kaydırmayla toplanabilir
+        if other.shift is None:
+            return
+        if self.shift is None:
+            self.shift = other.shift
+        if not np.array_equal(self.shift, other.shift):
+            raise ValueError("Farklı kaydırmayla biriktirilmiş korelasyonlar birleştirilemez")
+        self.n += other.n
+        self.sum_x += other.sum_x
+        self.sum_xx += other.sum_xx
+        self.sum_xy += other.sum_xy
+
+    def matrix(self) -> np.ndarray:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            covariance = self.n * self.sum_xy - self.sum_x * self.sum_x.T
+            variance = (self.n * self.sum_xx - self.sum_x ** 2) * (self.n * self.sum_xx - self.sum_x ** 2).T
+            corr = covariance / np.sqrt(variance)
+        corr[(self.n < 2) | ~(variance > 0)] = np.nan
+        corr = np.clip(corr, -1.0, 1.0)
+        # Sabit olmayan sütunların köşegeni tanım gereği 1
+        diagonal = np.flatnonzero(np.isfinite(np.diag(corr)))
+        corr[diagonal, diagonal] = 1.0
+        return corr
+
+
+class HistogramAccumulator:
+    """Sabit kenarlı histogramlar; kenarlar profilin min/max değerlerinden gelir"""
+    def __init__(self, ranges: Dict[Any, tuple], bins: int = 30):
+        self.edges = {}
+        for col, (low, high) in ranges.items():
+            if low == high:
+                low, high = low - 0.5, high + 0.5
+            self.edges[col] = np.linspace(low, high, bins + 1)
+        self.counts = {col: np.zeros(bins, dtype=np.int64) for col in self.edges}
+
+    def update(self, chunk: pd.DataFrame):
+        for col, edges in self.edges.items():
+            values = chunk[col].to_numpy(dtype='float64', na_value=np.nan)
+            self.counts[col] += np.histogram(values[~np.isnan(values)], bins=edges)[0]
+
+
+def chart_aggregates(profile: DataProfiler, frames: Iterable[pd.DataFrame], bins: int = 30, top_k: int = 10) -> Dict[str, Any]:
+    """
+    Veri analizi sekmelerindeki grafikler için önceden toplanmış veriler.
+    Beş sayı özeti ve değer frekansları profilden, histogram ve korelasyon frames üzerinden tek geçişte
+    hesaplanır (frames tam DataFrame ya da parça iterator'ı olabilir).
+    """
+    analysis_schema = profile.schema if profile.schema is not None else pd.DataFrame()
+    numeric_cols = list(analysis_schema.select_dtypes(include=[np.number]).columns)
+    categorical_cols = list(analysis_schema.select_dtypes(include=['object', 'category', 'bool']).columns)
+    stats = profile.outlier_stats()
+    histograms = HistogramAccumulator({col: profile.ranges[col] for col in numeric_cols if col in profile.ranges}, bins=bins)
+    correlation = CorrelationAccumulator(numeric_cols)
+    for frame in frames:
+        histograms.update(frame)
+        correlation.update(frame)
+    corr = correlation.matrix()
+    return {
+        'n_rows': int(profile.n_rows),
+        'histograms': {
+            str(col): {'edges': histograms.edges[col].tolist(), 'counts': histograms.counts[col].tolist()}
+            for col in histograms.edges
+        },
+        'five_number_summary': {
+            str(col): {key: stats[col][key] for key in ('min', 'q1', 'median', 'q3', 'max', 'lower_fence', 'upper_fence', 'source')}
+            for col in numeric_cols if col in stats
+        },
+        'top_values': {str(col): _top_values(profile, col, top_k) for col in categorical_cols},
+        'correlation': {
+            'columns': [str(col) for col in numeric_cols],
+            'matrix': [[_number(value) for value in row] for row in corr]
+        },
+        # Parçalı okumada beş sayı özetinin quantile'ları örneklemden gelir (min/max tüm veriden)
+        'sampled_summary': bool(profile.sampled)
+    }
+
+
+def _top_values(profile: DataProfiler, col, top_k: int) -> Dict[str, Any]:
+    """En sık top_k değer ve geri kalanların toplamı ("other"); frekanslar tutulmuyorsa örneklemden ölçeklenir"""
+    observed = profile.n_rows - profile.missing.get(col, 0)
+    counts = profile.value_counts.get(col)
+    estimated = counts is None
+    if estimated:
+        sample = profile.source_frame()
+        if sample is None or not len(sample):
+            return {'values': [], 'counts': [], 'other': 0, 'missing': int(profile.missing.get(col, 0)), 'estimated': True}
+        counts = sample[col].value_counts(dropna=True)
+        counts = counts * (observed / counts.sum()) if counts.sum() else counts
+    top = counts.sort_values(ascending=False, kind='stable').head(top_k)
+    top_counts = [int(round(value)) for value in top.to_numpy()]
+    return {
+        'values': [str(value) for value in top.index],
+        'counts': top_counts,
+        'other': int(max(0, observed - sum(top_counts))),
+        'missing': int(profile.missing.get(col, 0)),
+        'estimated': estimated
+    }
@@ -0,0 +1,57 @@
+import bz2
+import gzip
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Dosya uzantısı -> pandas compression adı
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.zst': 'zstd'}
+# Sıkıştırılmış halde okunabilen (satır bazlı) formatlar
+COMPRESSIBLE_FORMATS = {'.csv', '.txt', '.json'}
+# Parçalı okuma kararında açılmış boyut tahmini için kullanılan oran
+COMPRESSION_RATIO_ESTIMATE = 5
+
+
+def split_compression(path: str) -> Tuple[str, Optional[str]]:
+    """Dosya adından (format uzantısı, sıkıştırma) döndür: data.csv.gz -> ('.csv', 'gzip')"""
+    suffix = Path(path).suffix.lower()
+    compression = COMPRESSION_SUFFIXES.get(suffix)
+    if compression is None:
+        return suffix, None
+    return Path(Path(path).stem).suffix.lower(), compression
+
+
+def full_suffix(path: str) -> str:
+    """Sıkıştırma uzantısı dahil tam uzantı: data.csv.gz -> '.csv.gz'"""
+    file_ext, compression = split_compression(path)
+    return file_ext + Path(path).suffix.lower() if compression else file_ext
+
+
+def open_decompressed(fileobj: BinaryIO, compression: str) -> BinaryIO:
+    """Sıkıştırılmış akışı, içeriği parça parça açarak okuyan dosya nesnesine çevir"""
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=fileobj, mode='rb')
+    if compression == 'bz2':
+        return bz2.BZ2File(fileobj, mode='rb')
+    if compression == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd dosyaları için zstandard paketi kurulu olmalı")
+        return zstandard.ZstdDecompressor().stream_reader(fileobj)
+    raise ValueError(f"Desteklenmeyen sıkıştırma: {compression}")
+
+
+def read_decompressed_head(fileobj: BinaryIO, compression: str, n: int) -> bytes:
+    """Sıkıştırılmış akışın açılmış halinin ilk n baytını oku (dosyanın geri kalanı açılmaz)"""
+    reader = open_decompressed(fileobj, compression)
+    parts, size = [], 0
+    while size < n:
+        block = reader.read(n - size)
+        if not block:
+            break
+        parts.append(block)
+        size += len(block)
+    return b''.join(parts)
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+from data.aggregates import CorrelationAccumulator
+
+CORRELATION_METHODS = ('pearson', 'spearman')
+
+
+def correlation_matrix(df: pd.DataFrame, method: str = 'pearson', sample_rows: Optional[int] = None,
+                       random_state: int = 42, dtype=np.float32) -> pd.DataFrame:
+    """
+    Sayısal sütunların korelasyon matrisi (CorrelationAccumulator ile, varsayılan float32 matris çarpımı).
+    /profile grafik verileriyle aynı hesaplama kullanılır; eksik değer yoksa tek bir X^T X çarpımı yeterlidir,
+    eksik değer varsa pandas corr gibi ikili tam gözlemler üzerinden maske matrisleriyle hesaplanır.
+    spearman: sütunlar sıralarına (rank) çevrilip Pearson uygulanır; sıralar eksikler hariç tüm sütun üzerinden alınır.
+    sample_rows: satır sayısı bunu aşarsa korelasyon rastgele satır örneklemi üzerinden hesaplanır.
+    """
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"Desteklenmeyen korelasyon yöntemi: {method}")
+    numeric = df.select_dtypes(include=[np.number])
+    if sample_rows and len(numeric) > sample_rows:
+        rows = np.sort(np.random.default_rng(random_state).choice(len(numeric), sample_rows, replace=False))
+        numeric = numeric.iloc[rows]
+    if method == 'spearman':
+        numeric = numeric.rank()
+    accumulator = CorrelationAccumulator(numeric.columns, dtype=dtype)
+    accumulator.update_values(numeric.to_numpy(dtype=dtype, na_value=np.nan, copy=True))
+    return pd.DataFrame(accumulator.matrix(), index=numeric.columns, columns=numeric.columns)
+
+
+def top_pairs(corr: pd.DataFrame, k: int = 20, threshold: float = 0.0) -> List[Dict[str, Any]]:
+    """Mutlak değeri threshold'u aşan en güçlü k sütun çifti (köşegen ve tekrar eden çiftler hariç)"""
+    values = corr.to_numpy()
+    i, j = np.triu_indices(len(values), k=1)
+    strength = np.abs(values[i, j])
+    keep = np.flatnonzero(np.nan_to_num(strength, nan=-1.0) >= threshold)
+    keep = keep[np.argsort(-strength[keep], kind='stable')[:k]]
+    return [
+        {'column_1': str(corr.columns[i[p]]), 'column_2': str(corr.columns[j[p]]), 'correlation': float(values[i[p], j[p]])}
+        for p in keep
+    ]
+
+
+def correlation_summary(df: pd.DataFrame, method: str = 'pearson', top_k: int = 0, threshold: float = 0.0,
+                        sample_rows: Optional[int] = None, n_rows: Optional[int] = None) -> Dict[str, Any]:
+    """
+    API çıktısı: top_k > 0 ise yalnızca en güçlü çiftler, değilse tam matris (tanımsız değerler None).
+    Geniş verilerde n x n matris yerine birkaç KB'lık çift listesi döner.
+    n_rows: df parçalı okumadan alınmış bir örneklemse tüm verinin satır sayısı.
+    """
+    corr = correlation_matrix(df, method=method, sample_rows=sample_rows)
+    result = {
+        'method': method,
+        'columns': [str(col) for col in corr.columns],
+        'n_rows': int(len(df) if n_rows is None else n_rows),
+        'sampled_rows': int(min(len(df), sample_rows)) if sample_rows else int(len(df))
+    }
+    if top_k > 0:
+        result['pairs'] = top_pairs(corr, k=top_k, threshold=threshold)
+    else:
+        result['matrix'] = [[None if np.isnan(value) else float(value) for value in row] for row in corr.to_numpy()]
+    return result
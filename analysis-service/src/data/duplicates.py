@@ -0,0 +1,159 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import List, Optional
+from utils.logger import logger
+
+# Her satır için bellekte tutulan bayt: 64 bit hash + 64 bit satır numarası
+BYTES_PER_ROW = 16
+
+
+def row_hashes(chunk: pd.DataFrame) -> np.ndarray:
+    """
+    Satırların 64 bit hash'leri (index hariç).
+    Sayısal sütunlar parçadan parçaya int/float değişebildiği için hash öncesi float64'e çevrilir.
+    """
+    numeric = chunk.select_dtypes(include=[np.number]).columns
+    normalized = chunk.astype({col: 'float64' for col in numeric}) if len(numeric) else chunk
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+
+@dataclass
+class DuplicateResult:
+    count: int = 0
+    # Daha önce görülmüş bir satırın tekrarı olan satırların (0 tabanlı, okuma sırasındaki) numaraları
+    sample_indices: List[int] = field(default_factory=list)
+    spilled: bool = False
+
+
+class DuplicateDetector:
+    """
+    Satır hash'leriyle parça parça duplicate tespiti.
+    Hash'ler ve satır numaraları bellekte memory_limit_mb'a kadar tutulur; sınır aşılınca hash'e göre
+    bölümlenerek diske yazılır ve sonuç her bölüm ayrı ayrı okunarak hesaplanır.
+    64 bit hash çakışması ihmal edilir (milyarlarca satırda bile olasılığı çok düşüktür).
+    """
+    def __init__(self, memory_limit_mb: int = 256, spill_dir: Optional[str] = None,
+                 partitions: int = 64, sample_size: int = 20):
+        self.memory_limit = memory_limit_mb * 1024 * 1024
+        self.spill_dir = spill_dir
+        self.partitions = partitions
+        self.sample_size = sample_size
+        self.n_rows = 0
+        self._hashes = []
+        self._indices = []
+        self._buffered = 0
+        self._spill_path = None
+        self._result = None
+
+    def update(self, chunk: pd.DataFrame):
+        self.add_hashes(row_hashes(chunk))
+
+    def add_hashes(self, hashes: np.ndarray):
+        if len(hashes) == 0:
+            return
+        self._append(hashes.astype(np.uint64, copy=False), np.arange(self.n_rows, self.n_rows + len(hashes), dtype=np.int64))
+        self.n_rows += len(hashes)
+
+    def merge(self, other: "DuplicateDetector"):
+        """Sonraki satırlardan çıkarılmış tespitçinin hash'lerini ekle (satır numaraları bu tespitçinin sonrasına kaydırılır)"""
+        offset = self.n_rows
+        if other._spill_path is not None:
+            other._spill()
+            for p in range(other.partitions):
+                if os.path.exists(other._partition_file(p, "hash")):
+                    self._append(np.fromfile(other._partition_file(p, "hash"), dtype=np.uint64),
+                                 np.fromfile(other._partition_file(p, "index"), dtype=np.int64) + offset)
+        else:
+            for hashes, indices in zip(other._hashes, other._indices):
+                self._append(hashes, indices + offset)
+        self.n_rows = offset + other.n_rows
+
+    def _append(self, hashes: np.ndarray, indices: np.ndarray):
+        if len(hashes) == 0:
+            return
+        self._result = None
+        self._hashes.append(hashes)
+        self._indices.append(indices)
+        self._buffered += len(hashes)
+        if self._buffered * BYTES_PER_ROW > self.memory_limit:
+            self._spill()
+
+    def _partition_file(self, partition: int, kind: str) -> str:
+        return os.path.join(self._spill_path, f"{partition:04d}.{kind}")
+
+    def _spill(self):
+        """Bellekteki hash'leri bölümlere ayırıp disk dosyalarının sonuna ekle"""
+        if self._spill_path is None:
+            if self.spill_dir:
+                os.makedirs(self.spill_dir, exist_ok=True)
+            self._spill_path = tempfile.mkdtemp(prefix="duplicates_", dir=self.spill_dir)
+            logger.info(f"Duplicate tespiti bellek sınırını aştı, hash'ler diske yazılıyor: {self._spill_path}")
+        hashes, indices = self._take_buffer()
+        # Bölüm hash'ten belirlenir; aynı satırlar her zaman aynı bölüme düşer
+        partition = (hashes % np.uint64(self.partitions)).astype(np.int64)
+        order = np.argsort(partition, kind='stable')
+        bounds = np.searchsorted(partition[order], np.arange(self.partitions + 1))
+        for p in range(self.partitions):
+            rows = order[bounds[p]:bounds[p + 1]]
+            if len(rows) == 0:
+                continue
+            with open(self._partition_file(p, "hash"), "ab") as f:
+                hashes[rows].tofile(f)
+            with open(self._partition_file(p, "index"), "ab") as f:
+                indices[rows].tofile(f)
+
+    def _take_buffer(self):
+        hashes = np.concatenate(self._hashes) if self._hashes else np.empty(0, dtype=np.uint64)
+        indices = np.concatenate(self._indices) if self._indices else np.empty(0, dtype=np.int64)
+        self._hashes, self._indices, self._buffered = [], [], 0
+        return hashes, indices
+
+    def _duplicates(self, hashes: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """İlk görülmesinden sonraki tekrarların satır numaraları"""
+        if len(hashes) == 0:
+            return np.empty(0, dtype=np.int64)
+        order = np.lexsort((indices, hashes))
+        sorted_hashes = hashes[order]
+        repeated = np.empty(len(order), dtype=bool)
+        repeated[0] = False
+        repeated[1:] = sorted_hashes[1:] == sorted_hashes[:-1]
+        return indices[order[repeated]]
+
+    def result(self) -> DuplicateResult:
+        if self._result is not None:
+            return self._result
+        if self._spill_path is None:
+            duplicates = self._duplicates(*self._merged_buffer())
+            self._result = DuplicateResult(int(len(duplicates)), np.sort(duplicates)[:self.sample_size].tolist())
+            return self._result
+        self._spill()
+        count, sample = 0, np.empty(0, dtype=np.int64)
+        for p in range(self.partitions):
+            if not os.path.exists(self._partition_file(p, "hash")):
+                continue
+            duplicates = self._duplicates(np.fromfile(self._partition_file(p, "hash"), dtype=np.uint64),
+                                          np.fromfile(self._partition_file(p, "index"), dtype=np.int64))
+            count += len(duplicates)
+            sample = np.sort(np.concatenate([sample, duplicates]))[:self.sample_size]
+        self._result = DuplicateResult(int(count), sample.tolist(), spilled=True)
+        return self._result
+
+    def _merged_buffer(self):
+        # Sonuç tekrar istenebileceği için tampon boşaltılmadan birleştirilir
+        hashes = np.concatenate(self._hashes) if len(self._hashes) > 1 else (self._hashes[0] if self._hashes else np.empty(0, dtype=np.uint64))
+        indices = np.concatenate(self._indices) if len(self._indices) > 1 else (self._indices[0] if self._indices else np.empty(0, dtype=np.int64))
+        self._hashes, self._indices = [hashes], [indices]
+        return hashes, indices
+
+    def close(self):
+        """Diske yazılmış bölümleri sil"""
+        if self._spill_path is not None:
+            shutil.rmtree(self._spill_path, ignore_errors=True)
+            self._spill_path = None
+
+    def __del__(self):
+        self.close()
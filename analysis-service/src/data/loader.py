@@ -1,13 +1,82 @@
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Tuple, Union
 from utils.logger import logger
+from config.config import DataConfig
+from data.profiler import DataProfiler
+from data.parallel_profiler import profile_frame
+from data.sketches import Reservoir
+from data.sniffer import sniff_csv, CSV_DELIMITERS, TXT_DELIMITERS
+from data.compression import (split_compression, read_decompressed_head, COMPRESSIBLE_FORMATS,
+                              COMPRESSION_RATIO_ESTIMATE, ZSTD_AVAILABLE)
+from storage.object_source import is_object_uri, parse_object_uri, MinIOObjectReader
+from utils.hashing import file_sha256
+from utils import disk_cache
+from contextlib import contextmanager
+import hashlib
+import io
+import operator
 import os
-from pathlib import Path
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.feather as feather
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+ROW_FILTER_OPS = ('==', '!=', '<', '<=', '>', '>=', 'in', 'not in')
+
+
+def normalize_row_filters(row_filters) -> Optional[List[Tuple[str, str, Any]]]:
+    """
+    [[sütun, operatör, değer], ...] biçimindeki filtreleri doğrular (filtreler AND ile birleşir).
+    Biçim pyarrow.parquet filtreleriyle aynıdır; Parquet'te doğrudan okuyucuya iletilir.
+    """
+    if not row_filters:
+        return None
+    normalized = []
+    for item in row_filters:
+        if not isinstance(item, (list, tuple)) or len(item) != 3:
+            raise ValueError(f"Geçersiz satır filtresi: {item}")
+        column, op, value = item
+        if op == '=':
+            op = '=='
+        if op not in ROW_FILTER_OPS:
+            raise ValueError(f"Desteklenmeyen filtre operatörü: {op}")
+        if op in ('in', 'not in') and not isinstance(value, (list, tuple, set)):
+            raise ValueError(f"'{op}' operatörü liste değer bekler: {column}")
+        normalized.append((column, op, list(value) if op in ('in', 'not in') else value))
+    return normalized
+
+
+def select_columns(names: List[Any], usecols: Optional[List[Any]] = None, drop_columns: Optional[List[Any]] = None) -> List[Any]:
+    """Dosyadaki sütun sırasını koruyarak usecols/drop_columns seçimini uygula (adlar metin olarak karşılaştırılır)"""
+    keys = [str(name) for name in names]
+    if usecols is not None:
+        missing = [col for col in usecols if str(col) not in keys]
+        if missing:
+            raise ValueError(f"Sütun bulunamadı: {missing}")
+        wanted = {str(col) for col in usecols}
+        names = [name for name in names if str(name) in wanted]
+    if drop_columns:
+        dropped = {str(col) for col in drop_columns}
+        names = [name for name in names if str(name) not in dropped]
+    return names
+
 
 class DataLoader:
-    def __init__(self, data_path: str):
+    def __init__(self, data_path: str, config: DataConfig = None, content_hash: str = None, minio_client=None):
+        # data_path yerel dosya/klasör ya da s3://bucket/key biçiminde MinIO nesnesi olabilir
         self.data_path = data_path
+        self.config = config or DataConfig()
+        # Verilirse CSV ayar tespiti bu hash ile önbelleğe alınır
+        self.content_hash = content_hash
+        self.minio_client = minio_client
+        self._object_stat = None
         self.supported_formats = {
             '.csv': self._load_csv,
             '.json': self._load_json,
@@ -15,28 +84,157 @@ class DataLoader:
             '.xls': self._load_excel,
             '.txt': self._load_txt
         }
-    
-    def load_data(self, filename: str = None, **kwargs) -> Optional[pd.DataFrame]:
-        """
-        Dosya uzantısına göre otomatik veri yükleme
-        """
-        try:
-            # Eğer self.data_path bir dosya ise doğrudan onu kullan
-            if os.path.isfile(self.data_path):
-                file_path = self.data_path
-            else:
-                if filename is None:
-                    logger.error("Klasör yolu verildi ancak dosya adı belirtilmedi.")
-                    return None
-                file_path = os.path.join(self.data_path, filename)
+        # Parça parça okunabilen formatlar
+        self.chunked_formats = {
+            '.csv': self._iter_csv,
+            '.txt': self._iter_txt
+        }
+        self.filter_pushdown_formats = set()
+        # Kolon bazlı formatlar (sütun seçimi ve memory-map destekli)
+        if PYARROW_AVAILABLE:
+            self.supported_formats.update({
+                '.parquet': self._load_parquet,
+                '.feather': self._load_feather,
+                '.arrow': self._load_arrow,
+                '.ipc': self._load_arrow
+            })
+            # Satır filtresini okuyucuda uygulayabilen formatlar (diğerlerinde okuma sonrası pandas ile uygulanır)
+            self.filter_pushdown_formats.add('.parquet')
+            self.chunked_formats.update({
+                '.parquet': self._iter_parquet,
+                '.feather': self._iter_arrow,
+                '.arrow': self._iter_arrow,
+                '.ipc': self._iter_arrow
+            })
+
+    def _resolve_path(self, filename: str = None) -> Optional[str]:
+        """Yüklenecek dosyanın yolunu bul ve doğrula"""
+        if is_object_uri(self.data_path):
+            file_path = self.data_path
+            try:
+                self._stat_object(file_path)
+            except Exception as e:
+                logger.error(f"Nesne bulunamadı: {file_path} ({e})")
+                return None
+        # Eğer self.data_path bir dosya ise doğrudan onu kullan
+        elif os.path.isfile(self.data_path):
+            file_path = self.data_path
+        else:
+            if filename is None:
+                logger.error("Klasör yolu verildi ancak dosya adı belirtilmedi.")
+                return None
+            file_path = os.path.join(self.data_path, filename)
             if not os.path.exists(file_path):
                 logger.error(f"Dosya bulunamadı: {file_path}")
                 return None
-            file_ext = Path(file_path).suffix.lower()
-            if file_ext not in self.supported_formats:
-                logger.error(f"Desteklenmeyen dosya formatı: {file_ext}")
+        file_ext, compression = split_compression(file_path)
+        if file_ext not in self.supported_formats:
+            logger.error(f"Desteklenmeyen dosya formatı: {file_ext}")
+            return None
+        if compression and file_ext not in COMPRESSIBLE_FORMATS:
+            logger.error(f"{file_ext} dosyaları sıkıştırılmış olarak desteklenmiyor")
+            return None
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            logger.error("zstd dosyaları için zstandard paketi kurulu olmalı")
+            return None
+        return file_path
+
+    def should_stream(self, filename: str = None) -> bool:
+        """Dosya boyutu eşiği aşıyorsa ve format destekliyorsa parçalı okuma önerilir"""
+        file_path = self._resolve_path(filename)
+        if file_path is None:
+            return False
+        file_ext, compression = split_compression(file_path)
+        if file_ext not in self.chunked_formats:
+            return False
+        size = self._source_size(file_path)
+        if compression:
+            # Eşik açılmış veri boyutuna göredir; sıkıştırılmış boyut tahmini oranla büyütülür
+            size *= COMPRESSION_RATIO_ESTIMATE
+        return size >= self.config.streaming_threshold_mb * 1024 * 1024
+
+    def _get_minio_client(self):
+        if self.minio_client is None:
+            # MinIO bağlantısı yalnızca nesne kaynağı kullanıldığında kurulur
+            from storage.minio_client import get_minio_client
+            self.minio_client = get_minio_client()
+        return self.minio_client
+
+    def _stat_object(self, uri: str):
+        if self._object_stat is None:
+            bucket, key = parse_object_uri(uri)
+            self._object_stat = self._get_minio_client().stat_object(key, bucket_name=bucket)
+            if self.content_hash is None:
+                # İçerik hash'i yerine etag kullanılır; nesne değişirse önbellek anahtarları da değişir
+                self.content_hash = hashlib.sha256(f"{uri}:{self._object_stat.etag}".encode('utf-8')).hexdigest()
+        return self._object_stat
+
+    def source_hash(self, filename: str = None) -> Optional[str]:
+        """Kaynağın içerik hash'i (nesne kaynaklarında adres + etag); önbellek anahtarlarında kullanılır"""
+        file_path = self._resolve_path(filename)
+        if file_path is not None and is_object_uri(file_path):
+            self._stat_object(file_path)
+        return self.content_hash
+
+    def _source_size(self, file_path: str) -> int:
+        if is_object_uri(file_path):
+            return self._stat_object(file_path).size
+        return os.path.getsize(file_path)
+
+    @contextmanager
+    def _open_source(self, file_path: str, sequential: bool = True):
+        """
+        Yerel dosyada yolun kendisini, MinIO nesnesinde ise diske yazmadan okunan dosya nesnesini verir.
+        sequential=False rastgele erişimli (ranged GET) okuma içindir.
+        """
+        if not is_object_uri(file_path):
+            yield file_path
+            return
+        bucket, key = parse_object_uri(file_path)
+        reader = MinIOObjectReader(self._get_minio_client(), bucket, key, self._source_size(file_path), sequential=sequential)
+        source = io.BufferedReader(reader) if sequential else reader
+        try:
+            yield source
+        finally:
+            source.close()
+            logger.info(f"Nesneden {reader.bytes_read} bayt, {reader.requests} istekle okundu: {file_path}")
+
+    @contextmanager
+    def _arrow_source(self, file_path: str, memory_map: bool = True):
+        """Arrow IPC okuması için kaynak (yerelde memory-map, nesnede ranged okuma)"""
+        if is_object_uri(file_path):
+            with self._open_source(file_path, sequential=False) as source:
+                yield pa.PythonFile(source, mode='r')
+        else:
+            source = pa.memory_map(file_path, 'r') if memory_map else pa.OSFile(file_path, 'rb')
+            with source:
+                yield source
+
+    def load_data(self, filename: str = None, streaming: bool = False, chunksize: int = None, optimize_memory: bool = None,
+                  usecols: List[Any] = None, drop_columns: List[Any] = None, row_filters: List[Any] = None, **kwargs) -> Optional[Union[pd.DataFrame, Iterator[pd.DataFrame]]]:
+        """
+        Dosya uzantısına göre otomatik veri yükleme.
+        streaming=True verilirse DataFrame parçaları üreten bir iterator döner.
+        optimize_memory verilmezse DATA_OPTIMIZE_MEMORY ayarı kullanılır.
+        usecols/drop_columns verilirse yalnızca gereken sütunlar parse edilir,
+        row_filters ([[sütun, operatör, değer], ...]) ile yalnızca eşleşen satırlar döner.
+        """
+        try:
+            file_path = self._resolve_path(filename)
+            if file_path is None:
                 return None
-            df = self.supported_formats[file_ext](file_path, **kwargs)
+            if streaming:
+                return self.iter_chunks(filename, chunksize=chunksize, usecols=usecols, drop_columns=drop_columns,
+                                        row_filters=row_filters, **kwargs)
+            file_ext = split_compression(file_path)[0]
+            row_filters = normalize_row_filters(row_filters)
+            read_columns, keep_columns = self._projection(file_path, usecols, drop_columns, row_filters)
+            df = self.supported_formats[file_ext](file_path, **self._pushdown_params(file_ext, read_columns, row_filters), **kwargs)
+            df = self._finish_pushdown(df, file_ext, usecols, drop_columns, row_filters, keep_columns)
+            if optimize_memory is None:
+                optimize_memory = self.config.optimize_memory
+            if df is not None and optimize_memory:
+                df, _ = self.optimize_memory(df)
             if df is not None:
                 logger.info(f"Veri yüklendi: {df.shape} boyutunda")
                 logger.info(f"Sütunlar: {list(df.columns)}")
@@ -47,123 +245,434 @@ class DataLoader:
             logger.error(f"Veri yükleme hatası: {e}")
             return None
     
-    def _load_csv(self, file_path: str, **kwargs) -> pd.DataFrame:
-        """CSV dosyası yükleme"""
+    def read_columns(self, filename: str = None) -> Optional[List[Any]]:
+        """
+        Sütun adlarını veriyi okumadan döndürür (CSV/TXT'de başlık satırı, kolon bazlı formatlarda şema).
+        Adlar ancak tüm veri okunarak bilinebiliyorsa (JSON, Excel) None döner.
+        """
+        file_path = self._resolve_path(filename)
+        if file_path is None:
+            return None
+        file_ext = split_compression(file_path)[0]
+        if file_ext in ('.csv', '.txt'):
+            params = self._csv_params(file_path, delimiters=TXT_DELIMITERS if file_ext == '.txt' else CSV_DELIMITERS)
+            with self._open_source(file_path) as source:
+                return list(pd.read_csv(source, nrows=0, **params).columns)
+        if file_ext == '.parquet':
+            with self._open_source(file_path, sequential=False) as source:
+                return list(pq.ParquetFile(source).schema_arrow.names)
+        if file_ext in ('.feather', '.arrow', '.ipc'):
+            with self._arrow_source(file_path) as source:
+                return list(self._open_ipc(source).schema.names)
+        return None
+
+    def _projection(self, file_path: str, usecols: List[Any], drop_columns: List[Any],
+                    row_filters: Optional[List[Tuple[str, str, Any]]]) -> Tuple[Optional[List[Any]], Optional[List[Any]]]:
+        """
+        (okunacak sütunlar, sonuçta kalacak sütunlar) döndürür.
+        Filtrede kullanılan sütunlar da okunur, filtreden sonra atılır.
+        Sütun adları önceden bilinemiyorsa seçim okumadan sonra yapılır: (None, None).
+        """
+        if usecols is None and not drop_columns:
+            return None, None
+        names = self.read_columns(file_path)
+        if names is None:
+            return None, None
+        keep = select_columns(names, usecols, drop_columns)
+        keep_keys = {str(name) for name in keep}
+        keep_keys.update(str(column) for column, _, _ in row_filters or [])
+        return [name for name in names if str(name) in keep_keys], keep
+
+    def _pushdown_params(self, file_ext: str, columns: Optional[List[Any]], row_filters) -> Dict[str, Any]:
+        params = {}
+        if columns is not None:
+            params['columns'] = columns
+        if row_filters and file_ext in self.filter_pushdown_formats:
+            params['filters'] = row_filters
+        return params
+
+    def _finish_pushdown(self, df: pd.DataFrame, file_ext: str, usecols, drop_columns, row_filters, keep_columns) -> pd.DataFrame:
+        """Okuyucuda uygulanamayan satır filtresini ve sütun seçimini okunan veriye uygula"""
+        if df is None:
+            return df
+        if row_filters and file_ext not in self.filter_pushdown_formats:
+            df = self._apply_row_filters(df, row_filters)
+        if usecols is not None or drop_columns:
+            keep = keep_columns if keep_columns is not None else select_columns(list(df.columns), usecols, drop_columns)
+            if len(keep) != len(df.columns):
+                df = df[keep]
+        return df
+
+    def _apply_row_filters(self, df: pd.DataFrame, row_filters: List[Tuple[str, str, Any]]) -> pd.DataFrame:
+        """Filtreleri AND ile uygula; Arrow'daki gibi eksik değerli satırlar hiçbir koşulu sağlamaz"""
+        comparisons = {'==': operator.eq, '!=': operator.ne, '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+        columns = {str(col): col for col in df.columns}
+        mask = np.ones(len(df), dtype=bool)
+        for column, op, value in row_filters:
+            if str(column) not in columns:
+                raise ValueError(f"Filtre sütunu bulunamadı: {column}")
+            series = df[columns[str(column)]]
+            if op == 'in':
+                condition = series.isin(value)
+            elif op == 'not in':
+                condition = ~series.isin(value)
+            else:
+                try:
+                    condition = comparisons[op](series, value)
+                except TypeError as e:
+                    raise ValueError(f"'{column}' sütunu {value!r} ile karşılaştırılamıyor: {e}")
+            mask &= (condition & series.notna()).to_numpy(dtype=bool, na_value=False)
+        if mask.all():
+            return df
+        return df[mask].reset_index(drop=True)
+
+    def _csv_params(self, file_path: str, delimiters: str = CSV_DELIMITERS, **kwargs) -> Dict[str, Any]:
+        """
+        Örnek üzerinden tespit edilen ayarlarla read_csv parametrelerini oluştur.
+        Sıkıştırılmış dosyalar (.gz/.bz2/.zst) okuma sırasında parça parça açılır, diske açılmaz.
+        """
+        compression = split_compression(file_path)[1]
         default_params = {
             'encoding': 'utf-8',
             'sep': ',',
             'na_values': ['', ' ', 'null', 'NULL', 'nan', 'NaN', 'NA', 'n/a', 'N/A']
         }
+        if compression:
+            default_params['compression'] = compression
+        read_sample = None
+        if is_object_uri(file_path):
+            def read_sample(n):
+                with self._open_source(file_path, sequential=compression is not None) as source:
+                    return read_decompressed_head(source, compression, n) if compression else source.read(n)
+        default_params.update(sniff_csv(file_path, content_hash=self.content_hash, delimiters=delimiters,
+                                        read_sample=read_sample, compression=compression))
         default_params.update(kwargs)
+        return default_params
+
+    def _csv_engine_params(self) -> Dict[str, Any]:
+        """
+        CSV_ENGINE=pyarrow ise çok iş parçacıklı Arrow parser kullanılır; sonuç numpy tipleriyle döner
+        (profil, önişleme ve eğitim numpy/object tiplerini bekler). pyarrow kurulu değilse mevcut C parser'a dönülür.
+        """
+        params = {}
+        if self.config.csv_engine == 'pyarrow':
+            if PYARROW_AVAILABLE:
+                params['engine'] = 'pyarrow'
+            else:
+                logger.warning("pyarrow kurulu değil, C parser kullanılıyor")
+        return params
+
+    def _load_csv(self, file_path: str, delimiters: str = CSV_DELIMITERS, columns: List[Any] = None, **kwargs) -> pd.DataFrame:
+        """CSV dosyası yükleme (encoding/delimiter/header örnekten tespit edilir, columns verilirse yalnızca onlar parse edilir)"""
+        default_params = self._csv_engine_params()
+        default_params.update(self._csv_params(file_path, delimiters=delimiters, **kwargs))
+        if columns is not None:
+            default_params['usecols'] = columns
         
-        # Encoding problemlerini çözme
         try:
-            return pd.read_csv(file_path, **default_params)
+            return self._read_csv(file_path, default_params)
+        except ValueError as e:
+            # Arrow parser'ın desteklemediği bir parametre ya da girdi varsa C parser ile tekrar dene
+            if default_params.get('engine') != 'pyarrow':
+                raise
+            logger.warning(f"pyarrow engine kullanılamadı ({e}), C parser deneniyor...")
+            default_params.pop('engine')
+            return self._read_csv(file_path, default_params)
+
+    def _read_csv(self, file_path: str, params: Dict[str, Any]) -> pd.DataFrame:
+        # Örnek UTF-8 görünse de dosyanın devamı farklı olabilir; nadir durumda latin-1 ile tekrar dene
+        try:
+            with self._open_source(file_path) as source:
+                return pd.read_csv(source, **params)
         except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding başarısız, latin-1 deneniyor...")
-            default_params['encoding'] = 'latin-1'
-            return pd.read_csv(file_path, **default_params)
+            logger.warning(f"{params['encoding']} encoding başarısız, latin-1 deneniyor...")
+            params['encoding'] = 'latin-1'
+            with self._open_source(file_path) as source:
+                return pd.read_csv(source, **params)
     
+    def optimize_memory(self, df: pd.DataFrame, category_threshold: float = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Sayısal sütunları değer aralığına uyan en küçük tipe düşürür (float sütunlar yalnızca değer kaybı
+        olmadan float32'ye iner), düşük kardinaliteli object sütunlarını category tipine çevirir.
+        DataFrame yerinde güncellenir; önce/sonra bellek raporu döner.
+        """
+        if category_threshold is None:
+            category_threshold = self.config.category_threshold
+        memory_before = int(df.memory_usage(deep=True).sum())
+        converted = {}
+        for col in df.columns:
+            series = df[col]
+            if pd.api.types.is_bool_dtype(series):
+                continue
+            if pd.api.types.is_integer_dtype(series):
+                optimized = pd.to_numeric(series, downcast='integer')
+            elif pd.api.types.is_float_dtype(series):
+                optimized = pd.to_numeric(series, downcast='float')
+                # float32'ye yalnızca tüm değerler aynen temsil edilebiliyorsa düşülür (1.45 gibi değerler float64 kalır)
+                if optimized.dtype != series.dtype and not np.array_equal(
+                        series.to_numpy(dtype='float64', na_value=np.nan),
+                        optimized.to_numpy(dtype='float64', na_value=np.nan), equal_nan=True):
+                    continue
+            elif series.dtype == 'object' and len(series) > 0 and series.nunique() / len(series) < category_threshold:
+                optimized = series.astype('category')
+            else:
+                continue
+            if optimized.dtype != series.dtype:
+                df[col] = optimized
+                converted[col] = f"{series.dtype} -> {optimized.dtype}"
+        memory_after = int(df.memory_usage(deep=True).sum())
+        report = {
+            'memory_before': memory_before,
+            'memory_after': memory_after,
+            'reduction_percentage': float((1 - memory_after / memory_before) * 100) if memory_before else 0.0,
+            'converted_columns': converted
+        }
+        logger.info(f"Bellek optimizasyonu: {memory_before} -> {memory_after} byte ({len(converted)} sütun dönüştürüldü)")
+        return df, report
+
+    def iter_chunks(self, filename: str = None, chunksize: int = None, usecols: List[Any] = None,
+                    drop_columns: List[Any] = None, row_filters: List[Any] = None, **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Veriyi en fazla chunksize satırlık DataFrame parçaları halinde üretir.
+        Bellek kullanımı dosya boyutuna değil parça boyutuna bağlıdır.
+        Sütun seçimi ve satır filtreleri load_data ile aynıdır; filtre sonrası parçalar daha küçük olabilir.
+        """
+        file_path = self._resolve_path(filename)
+        if file_path is None:
+            return
+        chunksize = chunksize or self.config.chunk_size
+        file_ext = split_compression(file_path)[0]
+        row_filters = normalize_row_filters(row_filters)
+        read_columns, keep_columns = self._projection(file_path, usecols, drop_columns, row_filters)
+        kwargs.update(self._pushdown_params(file_ext, read_columns, row_filters))
+        if file_ext in self.chunked_formats:
+            n_chunks = 0
+            for chunk in self.chunked_formats[file_ext](file_path, chunksize, **kwargs):
+                n_chunks += 1
+                yield self._finish_pushdown(chunk, file_ext, usecols, drop_columns, row_filters, keep_columns)
+            logger.info(f"Veri {n_chunks} parça halinde okundu (parça boyutu: {chunksize})")
+        else:
+            # Parçalı okumayı desteklemeyen formatlar tek seferde yüklenip dilimlenir
+            logger.warning(f"{file_ext} formatı parçalı okumayı desteklemiyor, dosya tamamen yükleniyor")
+            df = self.supported_formats[file_ext](file_path, **kwargs)
+            df = self._finish_pushdown(df, file_ext, usecols, drop_columns, row_filters, keep_columns)
+            for start in range(0, len(df), chunksize):
+                yield df.iloc[start:start + chunksize]
+
+    def _iter_csv(self, file_path: str, chunksize: int, delimiters: str = CSV_DELIMITERS, columns: List[Any] = None, **kwargs) -> Iterator[pd.DataFrame]:
+        """CSV dosyasını parça parça okuma"""
+        default_params = self._csv_params(file_path, delimiters=delimiters, **kwargs)
+        default_params['chunksize'] = chunksize
+        if columns is not None:
+            default_params['usecols'] = columns
+        yielded = False
+        try:
+            with self._open_source(file_path) as source, pd.read_csv(source, **default_params) as reader:
+                for chunk in reader:
+                    yielded = True
+                    yield chunk
+        except UnicodeDecodeError:
+            # Parça üretildikten sonra baştan okumak veriyi tekrarlar
+            if yielded:
+                raise
+            logger.warning(f"{default_params['encoding']} encoding başarısız, latin-1 deneniyor...")
+            default_params['encoding'] = 'latin-1'
+            with self._open_source(file_path) as source, pd.read_csv(source, **default_params) as reader:
+                yield from reader
+
+    def _iter_txt(self, file_path: str, chunksize: int, **kwargs) -> Iterator[pd.DataFrame]:
+        """TXT dosyasını parça parça okuma (boşluk da delimiter adayıdır)"""
+        return self._iter_csv(file_path, chunksize, delimiters=TXT_DELIMITERS, **kwargs)
+
+    def sample_rows(self, chunks: Iterable[pd.DataFrame], n: int, random_state: int = 42) -> Optional[pd.DataFrame]:
+        """Parçalardan en fazla n satırlık düzgün dağılımlı örneklem al"""
+        reservoir = Reservoir(n, random_state=random_state)
+        for chunk in chunks:
+            reservoir.update(chunk)
+        return reservoir.frame()
+
+    def profile(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame]], approximate: Optional[bool] = None) -> DataProfiler:
+        """
+        Veriyi tek geçişte profille. Dönen profil analyze_data_structure ve
+        suggest_preprocessing_steps'e verilerek veri yeniden taranmadan paylaşılabilir.
+        approximate=True ile sketch tabanlı (HyperLogLog/KLL) sabit bellekli profil çıkarılır;
+        verilmezse DATA_APPROXIMATE_PROFILE ayarı kullanılır.
+        """
+        options = self.profile_options(approximate)
+        if isinstance(df, pd.DataFrame):
+            # Geniş frame'lerde sütunlar süreç havuzunda paralel profillenir
+            return profile_frame(df, workers=self.config.profile_workers, min_columns=self.config.parallel_min_columns, **options)
+        return DataProfiler.from_chunks(df, **options)
+
+    def profile_options(self, approximate: Optional[bool] = None) -> Dict[str, Any]:
+        """DataProfiler parametreleri (ayarlardan)"""
+        return {
+            'sample_size': self.config.sample_size,
+            'approximate': self.config.approximate_profile if approximate is None else approximate,
+            'hll_precision': self.config.hll_precision,
+            'kll_k': self.config.kll_k,
+            'duplicate_memory_mb': self.config.duplicate_memory_mb,
+            'spill_dir': self.config.spill_dir
+        }
+
     def _load_json(self, file_path: str, **kwargs) -> pd.DataFrame:
         """JSON dosyası yükleme"""
         default_params = {'orient': 'records'}
+        compression = split_compression(file_path)[1]
+        if compression:
+            default_params['compression'] = compression
         default_params.update(kwargs)
-        return pd.read_json(file_path, **default_params)
+        with self._open_source(file_path) as source:
+            return pd.read_json(source, **default_params)
     
-    def _load_excel(self, file_path: str, **kwargs) -> pd.DataFrame:
-        """Excel dosyası yükleme"""
-        default_params = {'sheet_name': 0}
-        default_params.update(kwargs)
-        return pd.read_excel(file_path, **default_params)
+    def list_sheets(self, filename: str = None) -> List[str]:
+        """Excel çalışma kitabındaki sayfa adları (yalnızca kitap yapısı okunur, hücreler parse edilmez)"""
+        file_path = self._resolve_path(filename)
+        if file_path is None:
+            return []
+        with self._open_source(file_path, sequential=False) as source:
+            if split_compression(file_path)[0] == '.xlsx':
+                from openpyxl import load_workbook
+                workbook = load_workbook(source, read_only=True)
+                try:
+                    return list(workbook.sheetnames)
+                finally:
+                    workbook.close()
+            with pd.ExcelFile(source) as excel_file:
+                return list(excel_file.sheet_names)
+
+    def _resolve_sheet(self, file_path: str, sheet_name: Union[str, int]) -> str:
+        """Sayfa indeksini ya da adını sayfa adına çevir (önbellek anahtarı indeks/ad farkından etkilenmesin)"""
+        sheets = self.list_sheets(file_path)
+        if isinstance(sheet_name, str) and sheet_name not in sheets and sheet_name.isdigit():
+            sheet_name = int(sheet_name)
+        if isinstance(sheet_name, int):
+            if not 0 <= sheet_name < len(sheets):
+                raise ValueError(f"Sayfa bulunamadı: {sheet_name}")
+            return sheets[sheet_name]
+        if sheet_name not in sheets:
+            raise ValueError(f"Sayfa bulunamadı: {sheet_name}")
+        return sheet_name
+
+    def _excel_cache_path(self, file_path: str, sheet: str) -> str:
+        content_hash = self.content_hash or file_sha256(file_path)
+        sheet_key = hashlib.sha1(sheet.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.config.excel_cache_dir, f"{content_hash}_{sheet_key}.parquet")
+
+    def _load_excel(self, file_path: str, sheet_name: Union[str, int] = 0, columns: List[str] = None, **kwargs) -> pd.DataFrame:
+        """
+        Excel dosyası yükleme.
+        Yalnızca istenen sayfa parse edilir; ilk okumada sayfa içerik hash'i + sayfa adıyla Parquet olarak
+        önbelleğe yazılır, sonraki okumalar openpyxl yerine bu kopyadan yapılır.
+        """
+        # Birden çok sayfa (None/liste) ya da ek read_excel parametreleri önbelleği atlar
+        if not PYARROW_AVAILABLE or kwargs or not isinstance(sheet_name, (str, int)):
+            with self._open_source(file_path, sequential=False) as source:
+                return pd.read_excel(source, sheet_name=sheet_name, usecols=columns, **kwargs)
+        sheet = self._resolve_sheet(file_path, sheet_name)
+        cache_path = self._excel_cache_path(file_path, sheet)
+        if os.path.exists(cache_path):
+            logger.info(f"Excel sayfası önbellekten okunuyor: {sheet}")
+            disk_cache.touch(cache_path)
+            return self._load_parquet(cache_path, columns=columns)
+        with self._open_source(file_path, sequential=False) as source:
+            df = pd.read_excel(source, sheet_name=sheet)
+        tmp_path = f"{cache_path}.{os.getpid()}.part"
+        try:
+            os.makedirs(self.config.excel_cache_dir, exist_ok=True)
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, cache_path)
+            # Kopyalar LRU olarak tutulur; boyut ya da yaş sınırını aşanlar silinir
+            disk_cache.evict(self.config.excel_cache_dir, self.config.excel_cache_max_mb, self.config.excel_cache_ttl_seconds)
+        except (TypeError, ValueError, OSError) as e:
+            # Karışık tipli sütunlar Arrow'a yazılamayabilir; önbellek olmadan devam edilir
+            logger.warning(f"Excel önbelleği yazılamadı: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        return df[columns] if columns is not None else df
 
     def _load_txt(self, file_path: str, **kwargs) -> pd.DataFrame:
-        """TXT dosyası yükleme (delimiter otomatik algılama)"""
-        # Delimiter otomatik algılama
-        with open(file_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline()
-        
-        # Olası delimiter'ları kontrol et
-        delimiters = [',', '\t', ';', '|', ' ']
-        delimiter_counts = {d: first_line.count(d) for d in delimiters}
-        best_delimiter = max(delimiter_counts, key=delimiter_counts.get)
-        
-        default_params = {'sep': best_delimiter}
-        default_params.update(kwargs)
-        return self._load_csv(file_path, **default_params)
+        """TXT dosyası yükleme (boşluk da delimiter adayıdır)"""
+        return self._load_csv(file_path, delimiters=TXT_DELIMITERS, **kwargs)
     
-    def analyze_data_structure(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """
-        Veri yapısını analiz et
-        """
-        analysis = {
-            'shape': tuple(int(x) for x in df.shape),
-            'columns': list(df.columns),
-            'data_types': {col: str(dtype) for col, dtype in df.dtypes.items()},
-            'missing_values': {col: int(df[col].isnull().sum()) for col in df.columns},
-            'missing_percentage': {col: float((df[col].isnull().sum() / len(df) * 100)) for col in df.columns},
-            'numeric_columns': list(df.select_dtypes(include=[np.number]).columns),
-            'categorical_columns': list(df.select_dtypes(include=['object', 'category']).columns),
-            'datetime_columns': list(df.select_dtypes(include=['datetime64']).columns),
-            'unique_values': {col: int(df[col].nunique()) for col in df.columns},
-            'memory_usage': int(df.memory_usage(deep=True).sum()),
-            'duplicated_rows': int(df.duplicated().sum())
-        }
-        
-        # Potansiyel target sütunlarını tespit et
-        potential_targets = []
-        for col in df.columns:
-            unique_count = int(df[col].nunique())
-            # Binary veya az sayıda unique değere sahip sütunlar
-            if 2 <= unique_count <= 10:
-                potential_targets.append({
-                    'column': col,
-                    'unique_count': unique_count,
-                    'unique_values': [str(val) for val in df[col].unique()]
-                })
-        
-        analysis['potential_target_columns'] = potential_targets
-        
-        return analysis
+    def _load_parquet(self, file_path: str, columns: List[str] = None, filters: List[Tuple[str, str, Any]] = None,
+                      memory_map: bool = True, **kwargs) -> pd.DataFrame:
+        """Parquet dosyası yükleme (yalnızca istenen sütunlar okunur, filtreler row group istatistikleriyle uygulanır)"""
+        if is_object_uri(file_path):
+            # Nesnede yalnızca footer ve istenen sütunların column chunk'ları ranged GET ile indirilir
+            with self._open_source(file_path, sequential=False) as source:
+                table = pq.read_table(source, columns=columns, filters=filters, pre_buffer=True)
+            return self._arrow_to_pandas(table)
+        table = pq.read_table(file_path, columns=columns, filters=filters, memory_map=memory_map, **kwargs)
+        return self._arrow_to_pandas(table)
+
+    def _load_feather(self, file_path: str, columns: List[str] = None, memory_map: bool = True, **kwargs) -> pd.DataFrame:
+        """Feather dosyası yükleme"""
+        with self._open_source(file_path, sequential=False) as source:
+            table = feather.read_table(source, columns=columns, memory_map=memory_map)
+        return self._arrow_to_pandas(table)
+
+    def _load_arrow(self, file_path: str, columns: List[str] = None, memory_map: bool = True, **kwargs) -> pd.DataFrame:
+        """Arrow IPC dosyası yükleme (file ve stream formatları)"""
+        with self._arrow_source(file_path, memory_map) as source:
+            table = self._open_ipc(source).read_all()
+        # Memory-map edilmiş tabloda sütun seçimi kopyalama yapmaz, seçilmeyen buffer'lara dokunulmaz
+        if columns is not None:
+            table = table.select(columns)
+        return self._arrow_to_pandas(table)
+
+    def _iter_parquet(self, file_path: str, chunksize: int, columns: List[str] = None, filters: List[Tuple[str, str, Any]] = None,
+                      memory_map: bool = True, **kwargs) -> Iterator[pd.DataFrame]:
+        """Parquet dosyasını row group'lar üzerinden parça parça okuma (filtre varsa eşleşmeyen row group'lar atlanır)"""
+        with self._open_source(file_path, sequential=False) as source:
+            if filters:
+                # Filtre taramada uygulanır; istatistikleri eşleşmeyen row group'lar okunmaz (nesnede indirilmez)
+                parquet_format = ds.ParquetFileFormat(default_fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=is_object_uri(file_path)))
+                filesystem = pafs.LocalFileSystem(use_mmap=memory_map) if isinstance(source, str) else None
+                batches = parquet_format.make_fragment(source, filesystem=filesystem).to_batches(
+                    columns=columns, filter=pq.filters_to_expression(filters), batch_size=chunksize, use_threads=False)
+            else:
+                parquet_file = pq.ParquetFile(source, memory_map=memory_map, pre_buffer=is_object_uri(file_path))
+                batches = parquet_file.iter_batches(batch_size=chunksize, columns=columns)
+            for batch in batches:
+                yield self._arrow_to_pandas(batch)
+
+    def _iter_arrow(self, file_path: str, chunksize: int, columns: List[str] = None, memory_map: bool = True, **kwargs) -> Iterator[pd.DataFrame]:
+        """Feather/Arrow IPC dosyasını record batch'ler üzerinden parça parça okuma"""
+        with self._arrow_source(file_path, memory_map) as source:
+            reader = self._open_ipc(source)
+            batches = (reader.get_batch(i) for i in range(reader.num_record_batches)) if hasattr(reader, 'num_record_batches') else reader
+            for batch in batches:
+                if columns is not None:
+                    batch = batch.select(columns)
+                for start in range(0, batch.num_rows, chunksize):
+                    yield self._arrow_to_pandas(batch.slice(start, chunksize))
+
+    def _open_ipc(self, source):
+        """Arrow IPC kaynağını file formatında, olmazsa stream formatında aç"""
+        try:
+            return pa.ipc.open_file(source)
+        except pa.ArrowInvalid:
+            source.seek(0)
+            return pa.ipc.open_stream(source)
+
+    def _arrow_to_pandas(self, table) -> pd.DataFrame:
+        # split_blocks blok birleştirme kopyasını önler
+        return table.to_pandas(split_blocks=True)
     
-    def suggest_preprocessing_steps(self, df: pd.DataFrame) -> List[str]:
+    def analyze_data_structure(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame], DataProfiler]) -> Dict[str, Any]:
         """
-        Veri analizine göre önişleme adımları öner
+        Veri yapısını analiz et.
+        DataFrame yerine parça iterator'ı verilirse analiz tek geçişte, sınırlı bellekle yapılır.
+        Önceden hesaplanmış profil verilirse veri yeniden taranmaz.
         """
-        suggestions = []
-        
-        # Eksik değer kontrolü
-        missing_percent = df.isnull().sum() / len(df) * 100
-        high_missing_cols = missing_percent[missing_percent > 50].index.tolist()
-        
-        if len(high_missing_cols) > 0:
-            suggestions.append(f"Yüksek eksik değerli sütunları kaldırın: {high_missing_cols}")
-        
-        # Kategorik değişken kontrolü
-        categorical_cols = df.select_dtypes(include=['object']).columns
-        high_cardinality_cols = [col for col in categorical_cols if df[col].nunique() > 50]
-        
-        if len(high_cardinality_cols) > 0:
-            suggestions.append(f"Yüksek kardinaliteli kategorik sütunları işleyin: {high_cardinality_cols}")
-        
-        # Sayısal değişken kontrolü
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        if len(numeric_cols) > 0:
-            suggestions.append("Sayısal sütunları standartlaştırın")
-        
-        # Duplicate kontrolü
-        if df.duplicated().sum() > 0:
-            suggestions.append(f"Duplicate satırları kaldırın: {df.duplicated().sum()} adet")
-        
-        # Outlier kontrolü
-        for col in numeric_cols:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            outliers = df[(df[col] < Q1 - 1.5 * IQR) | (df[col] > Q3 + 1.5 * IQR)]
-            if len(outliers) > len(df) * 0.05:  # %5'ten fazla outlier varsa
-                suggestions.append(f"'{col}' sütununda outlier kontrolü yapın")
-        
-        return suggestions
-    
-    
-  
\ No newline at end of file
+        profile = df if isinstance(df, DataProfiler) else self.profile(df)
+        return profile.to_analysis()
+
+    def suggest_preprocessing_steps(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame], DataProfiler]) -> List[str]:
+        """
+        Veri analizine göre önişleme adımları öner.
+        Parça iterator'ı verilirse outlier kontrolü örneklem üzerinden yapılır.
+        """
+        profile = df if isinstance(df, DataProfiler) else self.profile(df)
+        return profile.to_suggestions()
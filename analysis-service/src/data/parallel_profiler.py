@@ -0,0 +1,165 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from data.profiler import DataProfiler
+from utils.logger import logger
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def resolve_workers(workers: int) -> int:
+    """0 ya da negatif değer sürecin çalışabildiği çekirdek sayısı anlamına gelir (cgroup/taskset sınırları dahil)"""
+    if workers > 0:
+        return workers
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _mp_context():
+    """
+    İşçiler istek thread'lerinden oluşturulduğundan fork kullanılmaz (kilitli thread durumları kopyalanabilir);
+    forkserver yoksa spawn seçilir.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["__main__", "data.parallel_profiler"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """Uzun ömürlü süreç havuzu; daha fazla işçi istenirse ya da havuz bozulmuşsa yeniden oluşturulur"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and (_pool_workers < workers or getattr(_pool, "_broken", False)):
+            # Eski havuzdaki diğer isteklerin işleri tamamlanır, yeni işler yeni havuza gider
+            _pool.shutdown(wait=False)
+            _pool = None
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context())
+            _pool_workers = workers
+        return _pool
+
+
+def _profile_partition(table_name: str, table_size: int, hash_name: str, slot: int, n_slots: int, n_rows: int,
+                       positions: List[int], profiler_options: Dict[str, Any]) -> DataProfiler:
+    """
+    İşçi süreç: paylaşılan bellekteki Arrow tablosundan yalnızca kendi sütunlarını okuyup profiller.
+    Satır hash'lerinin bu sütunlara düşen kısmı paylaşılan hash matrisinin kendi satırına yazılır.
+    """
+    table_memory = shared_memory.SharedMemory(name=table_name)
+    hash_memory = shared_memory.SharedMemory(name=hash_name)
+    try:
+        # Arrow tamponları paylaşılan belleği kopyalamadan gösterir; yalnızca seçili sütunlar pandas'a çevrilir
+        table = pa.ipc.open_stream(pa.py_buffer(table_memory.buf[:table_size])).read_all()
+        frame = table.select(positions).to_pandas()
+        del table
+        profiler = DataProfiler(**profiler_options)
+        row_hashes = profiler.update_columns(frame, positions=positions, row_hashes=True)
+        np.ndarray((n_slots, n_rows), dtype=np.uint64, buffer=hash_memory.buf)[slot] = row_hashes
+        del frame, row_hashes
+        # Geri gönderilen yalnızca sütun istatistikleridir
+        profiler.duplicates = None
+        profiler.reservoir = None
+        return profiler
+    finally:
+        table_memory.close()
+        hash_memory.close()
+
+
+def _shared_memory_available() -> int:
+    """/dev/shm'deki boş alan; konteynerlerde varsayılan 64MB'dır ve aşılırsa süreç SIGBUS ile düşer"""
+    try:
+        stats = os.statvfs("/dev/shm")
+    except OSError:
+        return -1
+    return stats.f_bavail * stats.f_frsize
+
+
+def _write_table(df: pd.DataFrame, reserve: int = 0) -> Tuple[shared_memory.SharedMemory, int]:
+    """Frame'i Arrow IPC akışı olarak paylaşılan belleğe yaz (boyut önce kopyasız ölçülür, reserve kadar yer ayrıca aranır)"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    size = sink.size()
+    available = _shared_memory_available()
+    if 0 <= available < size + reserve:
+        raise OSError(f"/dev/shm alanı yetersiz ({available} byte, gereken {size + reserve} byte)")
+    memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        with pa.ipc.new_stream(pa.FixedSizeBufferWriter(pa.py_buffer(memory.buf)), table.schema) as writer:
+            writer.write_table(table)
+    except Exception:
+        memory.close()
+        memory.unlink()
+        raise
+    return memory, size
+
+
+def profile_frame_parallel(df: pd.DataFrame, workers: int, **profiler_options) -> DataProfiler:
+    """
+    Geniş DataFrame'i sütun grupları halinde uzun ömürlü süreç havuzunda profiller.
+    Tablo bir kez Arrow IPC olarak paylaşılan belleğe yazılır; işçilere yalnızca bellek adı ve sütun
+    konumları gönderilir, frame pickle edilmez. Satır düzeyindeki işler (duplicate, örneklem, outlier)
+    ana süreçte sütun gruplarının hash toplamı ve tam frame üzerinden yapılır.
+    """
+    n_slots = min(workers, len(df.columns))
+    partitions = [list(part) for part in np.array_split(np.arange(len(df.columns)), n_slots) if len(part)]
+    hash_size = max(len(partitions) * len(df) * 8, 1)
+    table_memory, table_size = _write_table(df, reserve=hash_size)
+    hash_memory = shared_memory.SharedMemory(create=True, size=hash_size)
+    try:
+        pool = get_pool(len(partitions))
+        futures = [pool.submit(_profile_partition, table_memory.name, table_size, hash_memory.name, slot,
+                               len(partitions), len(df), [int(p) for p in positions], profiler_options)
+                   for slot, positions in enumerate(partitions)]
+        results = [future.result() for future in futures]
+        profiler = DataProfiler(**profiler_options)
+        profiler.schema = df.iloc[:0]
+        if not profiler.approximate:
+            profiler._frame = df
+        for result in results:
+            profiler.merge_columns(result)
+        # Hash'ler konum ağırlıklı toplam olduğundan sütun gruplarının toplamı tüm satırın hash'idir
+        partial_hashes = np.ndarray((len(partitions), len(df)), dtype=np.uint64, buffer=hash_memory.buf)
+        row_hashes = partial_hashes.sum(axis=0, dtype=np.uint64)
+        del partial_hashes
+        profiler.memory_usage += int(df.index.memory_usage(deep=True))
+        profiler.add_rows(df, row_hashes, sample=profiler.approximate)
+        return profiler
+    finally:
+        for memory in (table_memory, hash_memory):
+            memory.close()
+            memory.unlink()
+
+
+def profile_frame(df: pd.DataFrame, workers: int = 0, min_columns: int = 200, **profiler_options) -> DataProfiler:
+    """
+    DataFrame profili; sütun sayısı min_columns'u aşıyorsa ve birden fazla işçi varsa paralel yol kullanılır.
+    Dar frame'lerde, pyarrow yoksa ya da tablo Arrow'a çevrilemezse seri profile düşer.
+    """
+    workers = resolve_workers(workers)
+    if workers > 1 and len(df.columns) >= min_columns and PYARROW_AVAILABLE and df.columns.is_unique:
+        try:
+            return profile_frame_parallel(df, workers, **profiler_options)
+        except (pa.ArrowException, BrokenProcessPool, TypeError, ValueError, OSError) as e:
+            logger.warning(f"Paralel profil çıkarılamadı, seri profile geçiliyor: {e}")
+    return DataProfiler.from_frame(df, **profiler_options)
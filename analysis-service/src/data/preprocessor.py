@@ -4,13 +4,20 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, LabelEncoder, OneHotEncoder, MinMaxScaler, RobustScaler
 from sklearn.impute import SimpleImputer, KNNImputer
 from sklearn.feature_selection import SelectKBest, f_classif, f_regression
-from sklearn.decomposition import PCA
+from sklearn.decomposition import PCA, TruncatedSVD
+import scipy.sparse as sp
+import joblib
 from typing import Tuple, Dict, Any, List, Optional, Union
 from utils.logger import logger
 import warnings
 warnings.filterwarnings('ignore')
 
 class DataPreprocessor:
+    """
+    Eğitim verisi üzerinde fit edilen önişleme hattı (imputer, outlier sınırları, scaler, kodlayıcılar, seçici, PCA).
+    preprocess train/test'i aynı öğrenilmiş durumla dönüştürür; fit edilmiş nesne save ile tek dosyaya yazılır
+    ve transform yeni veriyi fit etmeden aynı özellik uzayına çevirir.
+    """
     def __init__(self, config: Dict[str, Any] = None):
         self.scaler = StandardScaler()
         self.label_encoders = {}
@@ -20,6 +27,15 @@ class DataPreprocessor:
         self.pca = None
         self.feature_names = None
         self.target_encoder = None
+        self.target_column = None
+        self.outlier_bounds = {}
+        # fit sırasında belirlenen sütunlar ve tipleri (transform aynılarını kullanır)
+        self.input_columns = None
+        self.input_types = None
+        self.column_types = None
+        self.encoding_types = None
+        # Kategorik/ikili sütunların fit sırasındaki tipleri; transform'da imputer sonrası bu tiplere geri çevrilir
+        self.categorical_dtypes = {}
         self.preprocessing_steps = []
         self.config = config or {}
         self.scaling_method = self.config.get('scaling_method', 'standard')
@@ -30,6 +46,15 @@ class DataPreprocessor:
         self.pca_components = self.config.get('pca_components', None)
         self.handle_outliers = self.config.get('handle_outliers', False)
         self.outlier_method = self.config.get('outlier_method', 'iqr')
+        # True: one-hot kodlama ve sonraki adımlar yoğun matris yerine CSR ile çalışır
+        self.sparse_output = self.config.get('sparse_output', False)
+        # True: adımlar frame'i kopyalamadan yerinde değiştirir; fit/ölçekleme satır partileriyle yapılır
+        self.inplace = self.config.get('inplace', False)
+        self.batch_rows = self.config.get('batch_rows', 100000)
+        # Sayısal sütunların ve üretilen özellik matrislerinin tipi: float64 ya da float32
+        self.dtype = np.dtype(self.config.get('dtype', 'float64'))
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"Desteklenmeyen dtype: {self.dtype}")
     
     def auto_detect_target_column(self, df: pd.DataFrame) -> Optional[str]:
         potential_targets = []
@@ -59,12 +84,13 @@ class DataPreprocessor:
         for col in df.columns:
             if df[col].dtype == 'datetime64[ns]':
                 column_types['datetime'].append(col)
-            elif df[col].dtype in ['int64', 'float64', 'int32', 'float32']:
+            elif pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col]):
+                # Bellek optimizasyonuyla küçültülmüş int8/int16/float32 tipleri de sayısal sayılır
                 if df[col].nunique() == 2:
                     column_types['binary'].append(col)
                 else:
                     column_types['numeric'].append(col)
-            elif df[col].dtype == 'object':
+            elif df[col].dtype == 'object' or isinstance(df[col].dtype, pd.CategoricalDtype):
                 unique_count = df[col].nunique()
                 if unique_count == 2:
                     column_types['binary'].append(col)
@@ -78,83 +104,168 @@ class DataPreprocessor:
                 column_types['categorical_low'].append(col)
         return column_types
 
-    def handle_missing_values(self, df: pd.DataFrame, column_types: Dict[str, List[str]]) -> pd.DataFrame:
-        df_processed = df.copy()
+    def _working(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Adımın üzerinde çalışacağı frame: yerinde modda gelen frame, değilse kopyası"""
+        return df if self.inplace else df.copy()
+
+    def _drop_columns(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        if not self.inplace:
+            return df.drop(columns=columns)
+        # del blokları kopyalamadan böler (drop(inplace=True) frame'i yeniden oluşturur)
+        for col in columns:
+            del df[col]
+        return df
+
+    def _row_batches(self, df: pd.DataFrame):
+        for start in range(0, len(df), self.batch_rows):
+            yield start, min(start + self.batch_rows, len(df))
+
+    def handle_missing_values(self, df: pd.DataFrame, column_types: Dict[str, List[str]], fit: bool = True) -> pd.DataFrame:
+        """Yerinde modda (knn hariç) doldurma değerleri sütun sütun hesaplanır ve fillna ile yazılır"""
+        df_processed = self._working(df)
         numeric_cols = column_types['numeric']
-        if numeric_cols:
-            if self.imputation_method == 'knn':
-                imputer = KNNImputer(n_neighbors=5)
-                df_processed[numeric_cols] = imputer.fit_transform(df_processed[numeric_cols])
-                self.imputers['numeric'] = imputer
-            else:
+        # Sayısal sütunlar imputer'dan önce hedef tipe çevrilir; sonraki adımlar (scaler, PCA) tipi korur
+        for col in numeric_cols:
+            if df_processed[col].dtype != self.dtype:
+                df_processed[col] = df_processed[col].astype(self.dtype)
+        if numeric_cols and self.inplace and self.imputation_method != 'knn':
+            if fit:
                 strategy = self.imputation_method if self.imputation_method in ['mean', 'median'] else 'median'
-                imputer = SimpleImputer(strategy=strategy)
-                df_processed[numeric_cols] = imputer.fit_transform(df_processed[numeric_cols])
-                self.imputers['numeric'] = imputer
+                self.imputers['numeric'] = {col: getattr(df_processed[col], strategy)() for col in numeric_cols}
+            df_processed.fillna(self.imputers['numeric'], inplace=True)
+        elif numeric_cols:
+            if fit:
+                if self.imputation_method == 'knn':
+                    self.imputers['numeric'] = KNNImputer(n_neighbors=5)
+                else:
+                    strategy = self.imputation_method if self.imputation_method in ['mean', 'median'] else 'median'
+                    self.imputers['numeric'] = SimpleImputer(strategy=strategy)
+                df_processed[numeric_cols] = self.imputers['numeric'].fit_transform(df_processed[numeric_cols])
+            else:
+                df_processed[numeric_cols] = self.imputers['numeric'].transform(df_processed[numeric_cols])
         categorical_cols = column_types['categorical_low'] + column_types['categorical_high'] + column_types['binary']
         if categorical_cols:
             # bool dtype olanları stringe çevir
             for col in categorical_cols:
                 if df_processed[col].dtype == bool:
                     df_processed[col] = df_processed[col].astype(str)
-            imputer = SimpleImputer(strategy='most_frequent')
-            df_processed[categorical_cols] = imputer.fit_transform(df_processed[categorical_cols])
-            self.imputers['categorical'] = imputer
-        self.preprocessing_steps.append("Missing values handled")
+            if fit:
+                self.categorical_dtypes = {col: df_processed[col].dtype for col in categorical_cols}
+            if self.inplace:
+                if fit:
+                    # mode sıralı döner; eşitlikte SimpleImputer gibi en küçük değer seçilir
+                    modes = {col: df_processed[col].mode(dropna=True) for col in categorical_cols}
+                    self.imputers['categorical'] = {col: mode.iloc[0] for col, mode in modes.items() if len(mode)}
+                df_processed.fillna(self.imputers['categorical'], inplace=True)
+            elif fit:
+                self.imputers['categorical'] = SimpleImputer(strategy='most_frequent')
+                df_processed[categorical_cols] = self.imputers['categorical'].fit_transform(df_processed[categorical_cols])
+            else:
+                df_processed[categorical_cols] = self.imputers['categorical'].transform(df_processed[categorical_cols])
+            # Karışık tipli imputer çıktısı object/float döner; ikili sayısal sütunlar fit tipine geri çevrilir
+            # (aksi halde 1 -> "1.0" olup eğitimdeki "1" koduyla eşleşmez)
+            for col in categorical_cols:
+                df_processed[col] = self._restore_dtype(df_processed[col], self.categorical_dtypes.get(col))
+        if fit:
+            self.preprocessing_steps.append("Missing values handled")
         return df_processed
 
-    def process_outliers(self, df: pd.DataFrame, column_types: Dict[str, List[str]]) -> pd.DataFrame:
+    def process_outliers(self, df: pd.DataFrame, column_types: Dict[str, List[str]], fit: bool = True) -> pd.DataFrame:
+        """Sınırlar eğitim verisinden öğrenilir (iqr: alt/üst sınır, zscore: ortalama, std, medyan)"""
         if not self.handle_outliers:
             return df
-        df_processed = df.copy()
+        df_processed = self._working(df)
         numeric_cols = column_types['numeric']
         for col in numeric_cols:
+            if fit:
+                if self.outlier_method == 'iqr':
+                    Q1 = df_processed[col].quantile(0.25)
+                    Q3 = df_processed[col].quantile(0.75)
+                    IQR = Q3 - Q1
+                    self.outlier_bounds[col] = (Q1 - 1.5 * IQR, Q3 + 1.5 * IQR)
+                elif self.outlier_method == 'zscore':
+                    self.outlier_bounds[col] = (df_processed[col].mean(), df_processed[col].std(), df_processed[col].median())
+            if col not in self.outlier_bounds:
+                continue
             if self.outlier_method == 'iqr':
-                Q1 = df_processed[col].quantile(0.25)
-                Q3 = df_processed[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
+                lower_bound, upper_bound = self.outlier_bounds[col]
                 df_processed[col] = np.clip(df_processed[col], lower_bound, upper_bound)
             elif self.outlier_method == 'zscore':
-                z_scores = np.abs((df_processed[col] - df_processed[col].mean()) / df_processed[col].std())
-                df_processed[col] = np.where(z_scores > 3, df_processed[col].median(), df_processed[col])
-        self.preprocessing_steps.append("Outliers handled")
+                mean, std, median = self.outlier_bounds[col]
+                z_scores = np.abs((df_processed[col] - mean) / std)
+                df_processed[col] = np.where(z_scores > 3, median, df_processed[col])
+        if fit:
+            self.preprocessing_steps.append("Outliers handled")
         return df_processed
 
-    def encode_categorical_variables(self, df: pd.DataFrame, column_types: Dict[str, List[str]]) -> pd.DataFrame:
-        df_processed = df.copy()
-        binary_cols = column_types['binary']
-        for col in binary_cols:
-            le = LabelEncoder()
-            df_processed[col] = le.fit_transform(df_processed[col].astype(str))
-            self.label_encoders[col] = le
+    @staticmethod
+    def _restore_dtype(values: pd.Series, dtype) -> pd.Series:
+        """Sayısal fit tipine geri çevir; çevrilemeyen değerler (ör. görülmemiş metin) olduğu gibi kalır"""
+        if dtype is None or values.dtype == dtype or not pd.api.types.is_numeric_dtype(dtype):
+            return values
+        try:
+            return values.astype(dtype)
+        except (TypeError, ValueError):
+            return values
+
+    def _label_encode(self, col, values: pd.Series) -> np.ndarray:
+        # Eğitimde görülmemiş değerler -1 olur (LabelEncoder.transform hata verir)
+        le = self.label_encoders[col]
+        mapping = {label: code for code, label in enumerate(le.classes_)}
+        values = self._restore_dtype(values, self.categorical_dtypes.get(col))
+        return values.astype(str).map(mapping).fillna(-1).astype(int).to_numpy()
+
+    def encode_categorical_variables(self, df: pd.DataFrame, column_types: Dict[str, List[str]], fit: bool = True) -> pd.DataFrame:
+        """Kodlayıcılar fit=True ile öğrenilir; fit=False aynı kodları ve one-hot sütunlarını üretir"""
+        df_processed = self._working(df)
+        label_cols = list(column_types['binary'])
         categorical_low = column_types['categorical_low']
+        one_hot_cols = []
         if categorical_low:
             if self.encoding_method == 'onehot' or (self.encoding_method == 'auto' and len(categorical_low) <= 5):
-                encoded_df = pd.get_dummies(df_processed[categorical_low], prefix=categorical_low)
-                df_processed = df_processed.drop(columns=categorical_low)
+                one_hot_cols += categorical_low
+            else:
+                label_cols += categorical_low
+                if fit:
+                    self.preprocessing_steps.append("Label encoding applied")
+        # sparse_output yalnızca saklama biçimini değiştirir; sütun seçimi yoğun modla aynıdır.
+        # encoding_method='onehot' ile seyrek modda yüksek kardinaliteli sütunlar da one-hot kodlanır
+        if self.sparse_output and self.encoding_method == 'onehot':
+            one_hot_cols += column_types['categorical_high']
+        else:
+            label_cols += column_types['categorical_high']
+        if one_hot_cols:
+            if fit:
+                self.one_hot_encoder = OneHotEncoder(sparse_output=self.sparse_output, handle_unknown='ignore', dtype=self.dtype)
+                self.one_hot_encoder.fit(df_processed[one_hot_cols].astype(str))
+                self.preprocessing_steps.append("Sparse one-hot encoding applied" if self.sparse_output else "One-hot encoding applied")
+            encoded = self.one_hot_encoder.transform(df_processed[one_hot_cols].astype(str))
+            columns = self.one_hot_encoder.get_feature_names_out(one_hot_cols)
+            if self.sparse_output:
+                encoded_df = pd.DataFrame.sparse.from_spmatrix(encoded, index=df_processed.index, columns=columns)
+            else:
+                encoded_df = pd.DataFrame(encoded, columns=columns, index=df_processed.index)
+            df_processed = self._drop_columns(df_processed, one_hot_cols)
+            if self.inplace:
+                df_processed[list(columns)] = encoded_df
+            else:
                 df_processed = pd.concat([df_processed, encoded_df], axis=1)
-                self.preprocessing_steps.append("One-hot encoding applied")
+        for col in label_cols:
+            if fit:
+                le = LabelEncoder()
+                df_processed[col] = le.fit_transform(df_processed[col].astype(str))
+                self.label_encoders[col] = le
             else:
-                for col in categorical_low:
-                    le = LabelEncoder()
-                    df_processed[col] = le.fit_transform(df_processed[col].astype(str))
-                    self.label_encoders[col] = le
-                self.preprocessing_steps.append("Label encoding applied")
-        categorical_high = column_types['categorical_high']
-        for col in categorical_high:
-            le = LabelEncoder()
-            df_processed[col] = le.fit_transform(df_processed[col].astype(str))
-            self.label_encoders[col] = le
+                df_processed[col] = self._label_encode(col, df_processed[col])
         text_cols = column_types['text']
         if text_cols:
-            df_processed = df_processed.drop(columns=text_cols)
-            logger.warning(f"Text sütunları kaldırıldı: {text_cols}")
+            df_processed = self._drop_columns(df_processed, text_cols)
+            if fit:
+                logger.warning(f"Text sütunları kaldırıldı: {text_cols}")
         return df_processed
 
     def handle_datetime_features(self, df: pd.DataFrame, column_types: Dict[str, List[str]]) -> pd.DataFrame:
-        df_processed = df.copy()
+        df_processed = self._working(df)
         datetime_cols = column_types['datetime']
         for col in datetime_cols:
             df_processed[col] = pd.to_datetime(df_processed[col], errors='coerce')
@@ -164,61 +275,100 @@ class DataPreprocessor:
             df_processed[f'{col}_dayofweek'] = df_processed[col].dt.dayofweek
             df_processed[f'{col}_hour'] = df_processed[col].dt.hour
             df_processed[f'{col}_is_weekend'] = df_processed[col].dt.dayofweek.isin([5, 6]).astype(int)
-            df_processed = df_processed.drop(columns=[col])
-        if datetime_cols:
+            df_processed = self._drop_columns(df_processed, [col])
+        if datetime_cols and "Datetime features extracted" not in self.preprocessing_steps:
             self.preprocessing_steps.append("Datetime features extracted")
         return df_processed
 
-    def scale_features(self, X_train: pd.DataFrame, X_test: pd.DataFrame, numeric_cols: list) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def scale_features(self, df: pd.DataFrame, numeric_cols: list, fit: bool = True) -> pd.DataFrame:
         if not numeric_cols:
-            return X_train, X_test
-        if self.scaling_method == 'standard':
-            scaler = StandardScaler()
-        elif self.scaling_method == 'minmax':
-            scaler = MinMaxScaler()
-        elif self.scaling_method == 'robust':
-            scaler = RobustScaler()
-        else:
-            scaler = StandardScaler()
-        X_train_scaled = X_train.copy()
-        X_test_scaled = X_test.copy()
-        X_train_scaled[numeric_cols] = scaler.fit_transform(X_train[numeric_cols])
-        X_test_scaled[numeric_cols] = scaler.transform(X_test[numeric_cols])
-        self.scaler = scaler
-        self.preprocessing_steps.append(f"Features scaled using {self.scaling_method}")
-        return X_train_scaled, X_test_scaled
+            return df
+        if fit:
+            if self.scaling_method == 'standard':
+                self.scaler = StandardScaler()
+            elif self.scaling_method == 'minmax':
+                self.scaler = MinMaxScaler()
+            elif self.scaling_method == 'robust':
+                self.scaler = RobustScaler()
+            else:
+                self.scaler = StandardScaler()
+            if self.inplace and hasattr(self.scaler, 'partial_fit'):
+                for start, stop in self._row_batches(df):
+                    self.scaler.partial_fit(df.iloc[start:stop][numeric_cols])
+            else:
+                self.scaler.fit(df[numeric_cols])
+            self.preprocessing_steps.append(f"Features scaled using {self.scaling_method}")
+        if not self.inplace:
+            df_scaled = df.copy()
+            df_scaled[numeric_cols] = self.scaler.transform(df[numeric_cols])
+            return df_scaled
+        # Sonuç parti parti mevcut bloklara yazılır; tipi farklı sütunlar önce hedef tipe çevrilir
+        for col in numeric_cols:
+            if df[col].dtype != self.dtype:
+                df[col] = df[col].astype(self.dtype)
+        positions = df.columns.get_indexer(numeric_cols)
+        for start, stop in self._row_batches(df):
+            df.iloc[start:stop, positions] = self.scaler.transform(df.iloc[start:stop][numeric_cols])
+        return df
+
+    def _feature_matrix(self, X: pd.DataFrame) -> Union[np.ndarray, sp.csr_matrix]:
+        """Kodlanmış frame'i model girdisine çevir; seyrek modda one-hot blok yoğunlaştırılmadan CSR'a eklenir"""
+        if not self.sparse_output:
+            return X.to_numpy(dtype=self.dtype)
+        is_sparse = np.array([isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes])
+        blocks = [sp.csr_matrix(X.loc[:, ~is_sparse].to_numpy(dtype=self.dtype))]
+        if is_sparse.any():
+            blocks.append(X.loc[:, is_sparse].sparse.to_coo())
+        return sp.hstack(blocks, format='csr', dtype=self.dtype)
 
-    def select_features(self, X_train: np.ndarray, y_train: np.ndarray, X_test: np.ndarray, task_type: str) -> Tuple[np.ndarray, np.ndarray]:
+    def select_features(self, X: np.ndarray, y: np.ndarray = None, task_type: str = None, fit: bool = True) -> np.ndarray:
         if not self.feature_selection:
-            return X_train, X_test
-        if self.n_features == 'auto':
-            n_features = min(20, X_train.shape[1] // 2)
-        else:
-            n_features = min(self.n_features, X_train.shape[1])
-        if task_type == 'regression':
-            score_func = f_regression
-        else:
-            score_func = f_classif
-        selector = SelectKBest(score_func=score_func, k=n_features)
-        X_train_selected = selector.fit_transform(X_train, y_train)
-        X_test_selected = selector.transform(X_test)
-        self.feature_selector = selector
-        self.preprocessing_steps.append(f"Feature selection applied: {n_features} features selected")
-        return X_train_selected, X_test_selected
+            return X
+        if fit:
+            if self.n_features == 'auto':
+                n_features = min(20, X.shape[1] // 2)
+            else:
+                n_features = min(self.n_features, X.shape[1])
+            score_func = f_regression if task_type == 'regression' else f_classif
+            self.feature_selector = SelectKBest(score_func=score_func, k=n_features).fit(X, y)
+            self.preprocessing_steps.append(f"Feature selection applied: {n_features} features selected")
+        return self.feature_selector.transform(X)
 
-    def apply_pca(self, X_train: np.ndarray, X_test: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def apply_pca(self, X: np.ndarray, fit: bool = True) -> np.ndarray:
+        """Seyrek girdide PCA yerine merkezlemeyen TruncatedSVD kullanılır (matris yoğunlaştırılmaz)"""
         if self.pca_components is None:
-            return X_train, X_test
+            return X
+        if fit:
+            if sp.issparse(X):
+                self.pca = self._fit_truncated_svd(X)
+            else:
+                if isinstance(self.pca_components, float):
+                    n_components = self.pca_components
+                else:
+                    n_components = min(self.pca_components, X.shape[1])
+                self.pca = PCA(n_components=n_components).fit(X)
+            self.preprocessing_steps.append(f"{type(self.pca).__name__} applied: {self._n_components()} components")
+        return self.pca.transform(X)
+
+    def _fit_truncated_svd(self, X: sp.csr_matrix) -> TruncatedSVD:
+        # Oran verildiyse açıklanan varyans oranına ulaşan bileşen sayısına kadar kırpılır
+        max_components = max(1, X.shape[1] - 1)
         if isinstance(self.pca_components, float):
-            n_components = self.pca_components
-        else:
-            n_components = min(self.pca_components, X_train.shape[1])
-        pca = PCA(n_components=n_components)
-        X_train_pca = pca.fit_transform(X_train)
-        X_test_pca = pca.transform(X_test)
-        self.pca = pca
-        self.preprocessing_steps.append(f"PCA applied: {pca.n_components_} components")
-        return X_train_pca, X_test_pca
+            svd = TruncatedSVD(n_components=max_components, random_state=42).fit(X)
+            n_components = int(np.searchsorted(np.cumsum(svd.explained_variance_ratio_), self.pca_components) + 1)
+            n_components = min(n_components, max_components)
+            svd.components_ = svd.components_[:n_components]
+            svd.explained_variance_ = svd.explained_variance_[:n_components]
+            svd.explained_variance_ratio_ = svd.explained_variance_ratio_[:n_components]
+            svd.singular_values_ = svd.singular_values_[:n_components]
+            svd.n_components = n_components
+            return svd
+        return TruncatedSVD(n_components=min(self.pca_components, max_components), random_state=42).fit(X)
+
+    def _n_components(self) -> Optional[int]:
+        if self.pca is None:
+            return None
+        return int(getattr(self.pca, 'n_components_', self.pca.n_components))
 
     def detect_task_type(self, y: pd.Series) -> str:
         if y.dtype == 'object' or y.nunique() <= 20:
@@ -226,6 +376,55 @@ class DataPreprocessor:
         else:
             return 'regression'
 
+    def fit_transform(self, X: pd.DataFrame, y: np.ndarray, task_type: str) -> Union[np.ndarray, sp.csr_matrix]:
+        """
+        Tüm adımları eğitim verisi üzerinde öğrenip uygula; öğrenilen durum transform'da yeniden kullanılır.
+        sparse_output açıksa sonuç CSR matristir (PCA adımı yoğun sonuç döner). inplace açıksa X değiştirilir.
+        """
+        self.input_columns = list(X.columns)
+        self.input_types = self.analyze_column_types(X)
+        X = self.handle_datetime_features(X, self.input_types)
+        self.column_types = self.analyze_column_types(X)
+        X = self.handle_missing_values(X, self.column_types)
+        X = self.process_outliers(X, self.column_types)
+        X = self.scale_features(X, self.column_types['numeric'])
+        self.encoding_types = self.analyze_column_types(X)
+        X = self.encode_categorical_variables(X, self.encoding_types)
+        self.feature_names = X.columns.tolist()
+        X = self.select_features(self._feature_matrix(X), y, task_type)
+        return self.apply_pca(X).astype(self.dtype, copy=False)
+
+    def transform(self, df: pd.DataFrame) -> Union[np.ndarray, sp.csr_matrix]:
+        """
+        Öğrenilmiş adımları yeni veriye uygula; hiçbir adım yeniden fit edilmez.
+        Hedef sütun varsa atılır, eğitimde olup burada olmayan sütunlar eksik kabul edilir.
+        """
+        if self.feature_names is None:
+            raise ValueError("Önişleme henüz fit edilmedi")
+        # Sütun hizalaması hedef sütunu da atar; yerinde modda tek çalışma kopyası budur
+        return self._transform(df.reindex(columns=self.input_columns))
+
+    def _transform(self, X: pd.DataFrame) -> Union[np.ndarray, sp.csr_matrix]:
+        X = self.handle_datetime_features(X, self.input_types)
+        X = self.handle_missing_values(X, self.column_types, fit=False)
+        X = self.process_outliers(X, self.column_types, fit=False)
+        X = self.scale_features(X, self.column_types['numeric'], fit=False)
+        X = self.encode_categorical_variables(X, self.encoding_types, fit=False)
+        if X.columns.tolist() != self.feature_names:
+            X = X.reindex(columns=self.feature_names, fill_value=0)
+        X = self.select_features(self._feature_matrix(X), fit=False)
+        return self.apply_pca(X, fit=False).astype(self.dtype, copy=False)
+
+    def save(self, filepath: str) -> str:
+        """Fit edilmiş önişlemeyi tek dosya olarak kaydet (modelle birlikte saklanır)"""
+        joblib.dump(self, filepath)
+        logger.info(f"Önişleme kaydedildi: {filepath}")
+        return filepath
+
+    @staticmethod
+    def load(filepath: str) -> "DataPreprocessor":
+        return joblib.load(filepath)
+
     def preprocess(self, df: pd.DataFrame, target_column: str = None, test_size: float = 0.2, random_state: int = 42) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         logger.info("Dinamik veri ön işleme başlıyor...")
         if target_column is None:
@@ -233,11 +432,10 @@ class DataPreprocessor:
             if target_column is None:
                 raise ValueError("Target sütunu tespit edilemedi. Lütfen target_column parametresini belirtin.")
             logger.info(f"Otomatik tespit edilen target sütun: {target_column}")
-        df_processed = df.copy()
-        column_types = self.analyze_column_types(df_processed.drop(columns=[target_column]))
-        logger.info(f"Sütun tipleri: {column_types}")
-        X = df_processed.drop(columns=[target_column])
-        y = df_processed[target_column]
+        self.target_column = target_column
+        # Bölme satır konumları üzerinden yapılır; X yalnızca train/test parçaları olarak bir kez kopyalanır
+        rows = np.arange(len(df))
+        y = df[target_column]
         task_type = self.detect_task_type(y)
         logger.info(f"Task tipi: {task_type}")
         # --- SINIF DAĞILIMI KONTROLÜ ---
@@ -248,42 +446,38 @@ class DataPreprocessor:
                 drop_classes = class_counts[class_counts < 2].index.tolist()
                 logger.warning(f"Aşağıdaki sınıflar sadece 1 örneğe sahip ve veri setinden çıkarıldı: {drop_classes}")
                 mask = ~y.isin(drop_classes)
-                X = X[mask]
+                rows = rows[mask.to_numpy()]
                 y = y[mask]
                 class_counts = pd.Series(y).value_counts()
                 if (class_counts < 2).any():
                     raise ValueError(f"Her sınıfta en az 2 örnek olmalı. Sınıf dağılımı: {class_counts.to_dict()}")
-        X = self.handle_datetime_features(X, column_types)
-        column_types = self.analyze_column_types(X)
-        X = self.handle_missing_values(X, column_types)
-        X = self.process_outliers(X, column_types)
-        # Train/test split öncesi ölçekleme için numeric sütunları belirle
-        numeric_cols = column_types['numeric']
-        # Train/test split
         if task_type == 'classification':
             self.target_encoder = LabelEncoder()
             y_encoded = self.target_encoder.fit_transform(y)
         else:
             y_encoded = y.values
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y_encoded, 
+        # Önce bölünür; tüm adımlar yalnızca train üzerinde fit edilir, test aynı dönüşümden geçer
+        train_rows, test_rows, y_train, y_test = train_test_split(
+            rows, y_encoded, 
             test_size=test_size, 
             random_state=random_state,
             stratify=y_encoded if task_type == 'classification' else None
         )
-        # Sadece sayısal sütunlara scale uygula
-        X_train_scaled, X_test_scaled = self.scale_features(X_train, X_test, numeric_cols)
-        # Tüm train/test'e encoding uygula
-        X_train_encoded = self.encode_categorical_variables(X_train_scaled, self.analyze_column_types(X_train_scaled))
-        X_test_encoded = self.encode_categorical_variables(X_test_scaled, self.analyze_column_types(X_test_scaled))
-        # Feature selection ve PCA
-        X_train_selected, X_test_selected = self.select_features(X_train_encoded.values, y_train, X_test_encoded.values, task_type)
-        X_train_final, X_test_final = self.apply_pca(X_train_selected, X_test_selected)
-        self.feature_names = X_train_encoded.columns.tolist()
+        X_train = self._split_features(df, train_rows)
+        X_train_final = self.fit_transform(X_train, y_train, task_type)
+        del X_train
+        logger.info(f"Sütun tipleri: {self.column_types}")
+        X_test_final = self._transform(self._split_features(df, test_rows))
         logger.info(f"Veri işlendi - Train: {X_train_final.shape}, Test: {X_test_final.shape}")
         logger.info(f"Uygulanan preprocessing adımları: {self.preprocessing_steps}")
         return X_train_final, X_test_final, y_train, y_test
 
+    def _split_features(self, df: pd.DataFrame, rows: np.ndarray) -> pd.DataFrame:
+        """Seçili satırların hedef hariç sütunları (take kopyası; hedef sütun kopyalanmadan silinir)"""
+        X = df.take(rows)
+        del X[self.target_column]
+        return X
+
     def get_preprocessing_info(self) -> Dict[str, Any]:
         return {
             'preprocessing_steps': self.preprocessing_steps,
@@ -292,7 +486,9 @@ class DataPreprocessor:
             'imputation_method': self.imputation_method,
             'encoding_method': self.encoding_method,
             'n_features_selected': self.feature_selector.k if self.feature_selector else None,
-            'pca_components': self.pca.n_components_ if self.pca else None,
+            'pca_components': self._n_components(),
+            'sparse_output': self.sparse_output,
+            'dtype': self.dtype.name,
             'target_encoder': self.target_encoder is not None
         }
     
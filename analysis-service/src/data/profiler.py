@@ -0,0 +1,471 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional
+from data.duplicates import DuplicateDetector
+from data.sketches import HyperLogLog, KLLSketch, Reservoir, combine_hashes, hash_values
+
+# Profil çıktısının biçimi değiştiğinde artırılır (önbelleğe alınmış profiller geçersiz olur)
+PROFILER_VERSION = 4
+
+
+def _combine_moments(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(adet, ortalama, M2) üçlülerini birleştir (Chan vd. paralel varyans formülü)"""
+    n = a[0] + b[0]
+    if n == 0:
+        return a
+    delta = b[1] - a[1]
+    return np.array([n, a[1] + delta * b[0] / n, a[2] + b[2] + delta ** 2 * a[0] * b[0] / n])
+
+
+class DataProfiler:
+    """
+    Sütun istatistiklerini tek geçişte hesaplar; analiz ve öneriler aynı profili paylaşır.
+    Her sütun parça başına bir kez value_counts ile taranır (eksik sayısı, farklı değerler ve frekanslar
+    aynı hash geçişinden çıkar), satırlar duplicate kontrolü için bir kez hash'lenir (bellek sınırı aşılırsa hash'ler diske taşar).
+    Tam DataFrame tek parça gibi işlenir; parça iterator'ında outlier kontrolü örneklem üzerinden yapılır.
+
+    approximate=True ile hash tabloları ve sıralama yerine sabit bellekli sketch'ler kullanılır:
+    farklı değer ve duplicate sayıları HyperLogLog, quantile/IQR kontrolleri KLL, değer önizlemeleri
+    reservoir örneklemi ile hesaplanır; analiz çıktısı error_bounds alanında hata sınırlarını taşır.
+
+    Tüm durum birleştirilebilir (sayaçlar, eksik sayıları, momentler, sketch'ler, örneklem): merge ile
+    sonradan gelen satırların profili mevcut profile eklenir, veri yeniden taranmaz.
+    """
+    def __init__(self, sample_size: int = 100000, random_state: int = 42, approximate: bool = False,
+                 hll_precision: int = 14, kll_k: int = 200, duplicate_memory_mb: int = 256, spill_dir: Optional[str] = None):
+        self.n_rows = 0
+        self.schema = None
+        self.missing = {}
+        # sütun -> değer frekansları (görülme sırasıyla); farklı değer sayısı sample_size'ı aşınca tutulmaz
+        self.value_counts = {}
+        self.distinct = {}
+        self.unique_capped = set()
+        self.unique_cap = sample_size
+        self.memory_usage = 0
+        self.duplicates = DuplicateDetector(duplicate_memory_mb, spill_dir=spill_dir)
+        self.reservoir = Reservoir(sample_size, random_state=random_state)
+        self._frame = None
+        self.approximate = approximate
+        self.hll_precision = hll_precision
+        self.kll_k = kll_k
+        self.random_state = random_state
+        # approximate modda sütun -> HyperLogLog / KLLSketch, satır hash'leri için tek HyperLogLog
+        self.hll = {}
+        self.kll = {}
+        # sayısal sütun -> (min, max) ve (adet, ortalama, M2); örneklemden bağımsız, tüm veri üzerinden
+        self.ranges = {}
+        self.moments = {}
+        self.row_hll = HyperLogLog(hll_precision)
+        self._outliers = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, sample_size: int = 100000, **kwargs) -> "DataProfiler":
+        """Bellekteki DataFrame'in profili (outlier kontrolü tüm veri üzerinde, kopya alınmadan)"""
+        profiler = cls(sample_size, **kwargs)
+        if profiler.approximate:
+            profiler.update(df)
+            return profiler
+        profiler._frame = df
+        profiler.update(df, sample=False)
+        return profiler
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame], sample_size: int = 100000, **kwargs) -> "DataProfiler":
+        """Parça parça okunan verinin profili (bellek kullanımı parça ve örneklem boyutuyla sınırlı)"""
+        profiler = cls(sample_size, **kwargs)
+        for chunk in chunks:
+            profiler.update(chunk)
+        return profiler
+
+    def update(self, chunk: pd.DataFrame, sample: bool = True):
+        self._outliers = None
+        # Parçalar arasında farklı çıkan tipler boş çerçeve birleştirmesiyle ortak tipe yükseltilir
+        self.schema = chunk.iloc[:0] if self.schema is None else pd.concat([self.schema, chunk.iloc[:0]])
+        row_hashes = self.update_columns(chunk)
+        self.memory_usage += int(chunk.index.memory_usage(deep=True))
+        self.add_rows(chunk, row_hashes, sample=sample)
+
+    def update_columns(self, chunk: pd.DataFrame, positions: Optional[List[int]] = None,
+                       row_hashes: bool = False) -> Optional[np.ndarray]:
+        """
+        Yalnızca sütun istatistiklerini güncelle (satır sayısı, duplicate ve örneklem hariç).
+        approximate modda ya da row_hashes=True ise sütun hash'lerinden satır hash'leri de döner;
+        positions sütunların tam tablodaki konumlarıdır, sütun grupları ayrı işlenip hash'leri toplanabilir.
+        """
+        positions = range(len(chunk.columns)) if positions is None else positions
+        accumulated = np.zeros(len(chunk), dtype=np.uint64) if self.approximate or row_hashes else None
+        for position, col in zip(positions, chunk.columns):
+            series = chunk[col]
+            self._update_numeric(col, series)
+            if not self.approximate:
+                self._update_column(col, series)
+                if accumulated is not None:
+                    combine_hashes(accumulated, hash_values(series), position)
+                continue
+            # Her sütun bir kez hash'lenir; aynı hash'ler hem HyperLogLog'a hem satır hash'ine girer
+            hashes = hash_values(series)
+            observed = series.notna().to_numpy()
+            self.missing[col] = self.missing.get(col, 0) + int(len(observed) - observed.sum())
+            self.hll.setdefault(col, HyperLogLog(self.hll_precision)).update_hashes(hashes[observed])
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                self.kll.setdefault(col, KLLSketch(self.kll_k, random_state=self.random_state)).update(series.to_numpy(dtype='float64', na_value=np.nan))
+            combine_hashes(accumulated, hashes, position)
+        if not self.approximate:
+            self.memory_usage += int(chunk.memory_usage(deep=True, index=False).sum())
+        return accumulated
+
+    def _update_numeric(self, col, series: pd.Series):
+        if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            return
+        values = series.to_numpy(dtype='float64', na_value=np.nan)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        mean = values.mean()
+        self._merge_numeric(col, (float(values.min()), float(values.max())),
+                            np.array([len(values), mean, np.square(values - mean).sum()]))
+
+    def _merge_numeric(self, col, bounds: tuple, moments: np.ndarray):
+        previous = self.ranges.get(col)
+        self.ranges[col] = bounds if previous is None else (min(previous[0], bounds[0]), max(previous[1], bounds[1]))
+        self.moments[col] = moments if col not in self.moments else _combine_moments(self.moments[col], moments)
+
+    def add_rows(self, chunk: pd.DataFrame, row_hashes: Optional[np.ndarray] = None, sample: bool = True):
+        """Satır düzeyindeki durumu güncelle: duplicate tespiti, örneklem ve satır sayısı"""
+        if self.approximate:
+            self.row_hll.update_hashes(row_hashes)
+        elif row_hashes is not None:
+            self.duplicates.add_hashes(row_hashes)
+        else:
+            self.duplicates.update(chunk)
+        if sample or self.approximate:
+            self.reservoir.update(chunk)
+        self.n_rows += len(chunk)
+
+    def merge_columns(self, other: "DataProfiler"):
+        """Aynı satırların başka sütunları üzerinde çıkarılmış profilin sütun istatistiklerini ekle"""
+        self._outliers = None
+        self.missing.update(other.missing)
+        self.value_counts.update(other.value_counts)
+        self.distinct.update(other.distinct)
+        self.unique_capped |= other.unique_capped
+        self.memory_usage += other.memory_usage
+        self.hll.update(other.hll)
+        self.kll.update(other.kll)
+        self.ranges.update(other.ranges)
+        self.moments.update(other.moments)
+
+    def merge(self, other: "DataProfiler"):
+        """
+        Aynı veri setinin sonraki satırlarından çıkarılmış profili ekle; maliyet yalnızca other'ın durumuyla orantılıdır.
+        Sketch'ler other'dan devralınır, other bundan sonra kullanılmamalıdır.
+        """
+        if other.approximate != self.approximate:
+            raise ValueError("Yaklaşık ve kesin profiller birleştirilemez")
+        self.release_frame()
+        other.release_frame()
+        if other.schema is not None:
+            self.schema = other.schema.iloc[:0] if self.schema is None else pd.concat([self.schema, other.schema.iloc[:0]])
+        for col, count in other.missing.items():
+            self.missing[col] = self.missing.get(col, 0) + count
+        for col, counts in other.value_counts.items():
+            self._merge_counts(col, counts)
+        for col in other.unique_capped:
+            self.unique_capped.add(col)
+            self.value_counts.pop(col, None)
+            self.distinct[col] = max(self.distinct.get(col, 0), other.distinct.get(col, 0))
+        self.memory_usage += other.memory_usage
+        for col, sketch in other.hll.items():
+            if col in self.hll:
+                self.hll[col].merge(sketch)
+            else:
+                self.hll[col] = sketch
+        for col, sketch in other.kll.items():
+            if col in self.kll:
+                self.kll[col].merge(sketch)
+            else:
+                self.kll[col] = sketch
+        for col, bounds in other.ranges.items():
+            self._merge_numeric(col, bounds, other.moments[col])
+        if self.approximate:
+            self.row_hll.merge(other.row_hll)
+        else:
+            self.duplicates.merge(other.duplicates)
+        self.reservoir.merge(other.reservoir)
+        self.n_rows += other.n_rows
+
+    def release_frame(self):
+        """Tam frame'i örnekleme aktarıp bırak; outlier kontrolü bundan sonra örneklem üzerinden yapılır"""
+        if self._frame is not None:
+            self.reservoir.update(self._frame)
+            self._frame = None
+            self._outliers = None
+
+    def __getstate__(self):
+        # Saklanan profil tam frame'i ve outlier önbelleğini taşımaz
+        self.release_frame()
+        state = self.__dict__.copy()
+        state['_outliers'] = None
+        return state
+
+    def _update_column(self, col, series: pd.Series):
+        if col in self.unique_capped:
+            self.missing[col] = self.missing.get(col, 0) + int(series.isna().sum())
+            return
+        counts = series.value_counts(dropna=False, sort=False)
+        nan_mask = counts.index.isna()
+        self.missing[col] = self.missing.get(col, 0) + int(counts[nan_mask].sum())
+        counts = counts[~nan_mask]
+        # category tipinde gözlenmeyen kategoriler 0 frekansla gelir
+        counts = counts[counts > 0]
+        self._merge_counts(col, counts)
+
+    def _merge_counts(self, col, counts: pd.Series):
+        if col in self.unique_capped:
+            # Farklı değer sayısı zaten alt sınır
+            self.distinct[col] = max(self.distinct.get(col, 0), len(counts))
+            return
+        previous = self.value_counts.get(col)
+        if previous is None:
+            merged = counts
+        else:
+            # Görülme sırası korunur: önceki değerler, ardından bu parçada ilk kez görülenler
+            order = previous.index.append(counts.index.difference(previous.index, sort=False))
+            merged = previous.add(counts, fill_value=0).reindex(order).astype('int64')
+        self.distinct[col] = max(self.distinct.get(col, 0), len(merged))
+        if len(merged) > self.unique_cap:
+            # Farklı değer sayısı bundan sonra alt sınırdır
+            self.unique_capped.add(col)
+            self.value_counts.pop(col, None)
+        else:
+            self.value_counts[col] = merged
+
+    def duplicated_rows(self) -> int:
+        if self.approximate:
+            return int(max(0, round(self.n_rows - self.row_hll.estimate())))
+        return self.duplicates.result().count
+
+    def _schema(self) -> pd.DataFrame:
+        return self.schema if self.schema is not None else pd.DataFrame()
+
+    def _distinct(self, col) -> int:
+        if self.approximate:
+            # Tahmin gözlenen (eksik olmayan) değer sayısını aşamaz
+            hll = self.hll.get(col)
+            return int(min(round(hll.estimate()), self.n_rows - self.missing.get(col, 0))) if hll is not None else 0
+        return int(self.distinct.get(col, 0))
+
+    def _memory_usage(self) -> int:
+        if not self.approximate:
+            return int(self.memory_usage)
+        # Örneklemin satır başı bellek kullanımı tüm satırlara ölçeklenir
+        sample = self.reservoir.frame()
+        if sample is None or not len(sample):
+            return 0
+        return int(sample.memory_usage(deep=True, index=False).sum() / len(sample) * self.n_rows)
+
+    def _preview_values(self, col) -> List[str]:
+        if not self.approximate:
+            return [str(val) for val in self.value_counts[col].index]
+        sample = self.reservoir.frame()
+        return [str(val) for val in sample[col].dropna().unique()] if sample is not None else []
+
+    def _duplicated_bounds(self) -> List[int]:
+        rows_low, rows_high = self.row_hll.bounds()
+        return [max(0, self.n_rows - min(rows_high, self.n_rows)), max(0, self.n_rows - rows_low)]
+
+    def error_bounds(self) -> Dict[str, Any]:
+        """approximate modda tahminlerin ~%95 güven aralıkları"""
+        schema = self._schema()
+        unique_bounds = {}
+        for col in schema.columns:
+            hll = self.hll.get(col)
+            low, high = hll.bounds() if hll is not None else (0, 0)
+            upper = self.n_rows - self.missing.get(col, 0)
+            unique_bounds[col] = [min(low, upper), min(high, upper)]
+        # Outlier oranı iki rank sorgusunun farkıdır; her biri en fazla rank_error kadar saptığından sayı ±2·rank_error·n içindedir
+        rank_error = KLLSketch(self.kll_k).rank_error
+        outlier_bounds = {}
+        for col, entry in self.outlier_stats().items():
+            margin = 2 * rank_error * self.kll[col].n
+            outlier_bounds[col] = [int(max(0, np.floor(entry['count'] - margin))),
+                                   int(min(self.kll[col].n, np.ceil(entry['count'] + margin)))]
+        return {
+            'confidence': 0.95,
+            'unique_values_relative_error': float(2 * self.row_hll.relative_error),
+            'unique_values': unique_bounds,
+            'duplicated_rows': self._duplicated_bounds(),
+            'quantile_rank_error': float(rank_error),
+            'outlier_counts': outlier_bounds,
+            'memory_usage': 'sample_estimate'
+        }
+
+    @property
+    def sampled(self) -> bool:
+        """Satır düzeyindeki istatistikler tam veri yerine örneklemden mi geliyor"""
+        return self._frame is None
+
+    def source_frame(self) -> Optional[pd.DataFrame]:
+        """Tam frame ya da (parçalı okumada) reservoir örneklemi"""
+        return self._frame if self._frame is not None else self.reservoir.frame()
+
+    def outlier_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Sayısal sütunlar için IQR outlier istatistikleri (boxplot değerleri, sınırlar ve outlier sayısı).
+        Quantile'lar tek bir quantile çağrısıyla, outlier sayıları ve çitler her sütunun kendi dizisi üzerinde NumPy maskeleriyle hesaplanır.
+        source: 'full' tüm veri, 'sample' reservoir örneklemi (sayılar tüm satırlara ölçeklenir), 'sketch' KLL tahmini.
+        """
+        if self._outliers is None:
+            self._outliers = self._sketch_outlier_stats() if self.approximate else self._frame_outlier_stats()
+        return self._outliers
+
+    def _frame_outlier_stats(self) -> Dict[str, Dict[str, Any]]:
+        source = self.source_frame()
+        numeric_cols = [col for col in self._schema().select_dtypes(include=[np.number]).columns if source is not None and col in source.columns]
+        if not numeric_cols or not len(source):
+            return {}
+        # Quantile'lar tek çağrıyla alınır (pandas ile aynı doğrusal interpolasyon); frame kopyalanıp sıralanmaz
+        quantiles = source[numeric_cols].quantile([0.25, 0.5, 0.75])
+        scale = self.n_rows / len(source) if self.sampled else 1.0
+        stats = {}
+        for col in numeric_cols:
+            q1, median, q3 = (float(value) for value in quantiles[col])
+            iqr = q3 - q1
+            lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+            # Sayılar sütunun kendi dizisi üzerinde maskeyle alınır (numpy tiplerinde kopya yok, int8/float32 korunur)
+            series = source[col]
+            values = series.to_numpy() if isinstance(series.dtype, np.dtype) else series.to_numpy(dtype='float64', na_value=np.nan)
+            valid = len(values) - (int(np.count_nonzero(np.isnan(values))) if values.dtype.kind == 'f' else 0)
+            below = int(np.count_nonzero(values < lower))
+            above = int(np.count_nonzero(values > upper))
+            minimum, maximum = (np.nanmin(values), np.nanmax(values)) if valid else (np.nan, np.nan)
+            if valid - below - above > 0:
+                # Çitler sınırlar içindeki en uç değerlerdir
+                inside = (values >= lower) & (values <= upper)
+                lower_fence = float(values.min(where=inside, initial=maximum))
+                upper_fence = float(values.max(where=inside, initial=minimum))
+                del inside
+            else:
+                lower_fence = upper_fence = np.nan
+            if self.sampled:
+                # Örneklemde uç değerler kaçabilir; min/max tüm veri üzerinden tutulanla değiştirilir
+                minimum, maximum = self.ranges.get(col, (np.nan, np.nan))
+            count = below + above
+            stats[col] = self._outlier_entry(q1, median, q3, lower_fence, upper_fence, float(minimum), float(maximum),
+                                             count * scale, count / len(source) * 100,
+                                             'full' if self._frame is not None else 'sample')
+        return stats
+
+    def _sketch_outlier_stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {}
+        for col, sketch in self.kll.items():
+            if sketch.n == 0:
+                continue
+            q1, median, q3 = sketch.quantile([0.25, 0.5, 0.75])
+            iqr = q3 - q1
+            lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+            fraction = sketch.rank(lower, inclusive=False) + 1 - sketch.rank(upper)
+            # Çitler sketch'te sınırlar içindeki en uç değerlere yaklaşık olarak eşittir
+            stats[col] = self._outlier_entry(q1, median, q3, max(lower, sketch.min), min(upper, sketch.max), sketch.min, sketch.max,
+                                             fraction * sketch.n, fraction * sketch.n / self.n_rows * 100 if self.n_rows else 0.0, 'sketch')
+        return stats
+
+    @staticmethod
+    def _outlier_entry(q1, median, q3, lower_fence, upper_fence, minimum, maximum, count, percentage, source) -> Dict[str, Any]:
+        def number(value):
+            return None if value is None or np.isnan(value) else float(value)
+        iqr = q3 - q1
+        return {
+            'q1': number(q1),
+            'median': number(median),
+            'q3': number(q3),
+            'iqr': number(iqr),
+            'lower_bound': number(q1 - 1.5 * iqr),
+            'upper_bound': number(q3 + 1.5 * iqr),
+            'lower_fence': number(lower_fence),
+            'upper_fence': number(upper_fence),
+            'min': number(minimum),
+            'max': number(maximum),
+            'count': int(round(count)),
+            'percentage': float(percentage),
+            'source': source
+        }
+
+    def numeric_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Sayısal sütunların tüm veri üzerinden adet, ortalama, standart sapma, min ve max değerleri"""
+        stats = {}
+        for col, (count, mean, m2) in self.moments.items():
+            stats[col] = {
+                'count': int(count),
+                'mean': float(mean),
+                'std': float(np.sqrt(m2 / (count - 1))) if count > 1 else None,
+                'min': self.ranges[col][0],
+                'max': self.ranges[col][1]
+            }
+        return stats
+
+    def to_analysis(self) -> Dict[str, Any]:
+        schema = self._schema()
+        n_rows = self.n_rows
+        analysis = {
+            'shape': (int(n_rows), int(len(schema.columns))),
+            'columns': list(schema.columns),
+            'data_types': {col: str(dtype) for col, dtype in schema.dtypes.items()},
+            'missing_values': {col: int(self.missing.get(col, 0)) for col in schema.columns},
+            'missing_percentage': {col: float(self.missing.get(col, 0) / n_rows * 100) if n_rows else 0.0 for col in schema.columns},
+            'numeric_columns': list(schema.select_dtypes(include=[np.number]).columns),
+            'categorical_columns': list(schema.select_dtypes(include=['object', 'category']).columns),
+            'datetime_columns': list(schema.select_dtypes(include=['datetime64']).columns),
+            'unique_values': {col: self._distinct(col) for col in schema.columns},
+            'memory_usage': self._memory_usage(),
+            'duplicated_rows': self.duplicated_rows(),
+            'duplicate_row_indices': [] if self.approximate else self.duplicates.result().sample_indices,
+            'unique_values_capped': sorted(self.unique_capped, key=str),
+            'approximate': self.approximate,
+            'outliers': self.outlier_stats(),
+            'numeric_statistics': self.numeric_statistics()
+        }
+        if self.approximate:
+            analysis['error_bounds'] = self.error_bounds()
+        potential_targets = []
+        for col in schema.columns:
+            unique_count = analysis['unique_values'][col]
+            # Binary veya az sayıda unique değere sahip sütunlar
+            if 2 <= unique_count <= 10:
+                potential_targets.append({
+                    'column': col,
+                    'unique_count': unique_count,
+                    'unique_values': self._preview_values(col)
+                })
+        analysis['potential_target_columns'] = potential_targets
+        return analysis
+
+    def to_suggestions(self) -> List[str]:
+        suggestions = []
+        schema = self._schema()
+        # Eksik değer kontrolü
+        if self.n_rows:
+            high_missing_cols = [col for col in schema.columns if self.missing.get(col, 0) / self.n_rows * 100 > 50]
+            if len(high_missing_cols) > 0:
+                suggestions.append(f"Yüksek eksik değerli sütunları kaldırın: {high_missing_cols}")
+        # Kategorik değişken kontrolü
+        categorical_cols = schema.select_dtypes(include=['object', 'category']).columns
+        high_cardinality_cols = [col for col in categorical_cols if self._distinct(col) > 50]
+        if len(high_cardinality_cols) > 0:
+            suggestions.append(f"Yüksek kardinaliteli kategorik sütunları işleyin: {high_cardinality_cols}")
+        # Sayısal değişken kontrolü
+        numeric_cols = schema.select_dtypes(include=[np.number]).columns
+        if len(numeric_cols) > 0:
+            suggestions.append("Sayısal sütunları standartlaştırın")
+        # Duplicate kontrolü
+        duplicated = self.duplicated_rows()
+        if self.approximate and self._duplicated_bounds()[0] == 0:
+            # Güven aralığı sıfırı içeriyorsa tahmin öneri için yeterli değil
+            duplicated = 0
+        if duplicated > 0:
+            suggestions.append(f"Duplicate satırları kaldırın: {duplicated} adet")
+        # Outlier kontrolü (parçalı okumada örneklem, approximate modda KLL sketch'i üzerinden)
+        for col, stats in self.outlier_stats().items():
+            if stats['percentage'] > 5:  # %5'ten fazla outlier varsa
+                suggestions.append(f"'{col}' sütununda outlier kontrolü yapın")
+        return suggestions
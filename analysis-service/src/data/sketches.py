@@ -0,0 +1,248 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple
+
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """
+    Sütun değerlerinin 64 bit hash'leri (eksikler dahil, satır sırasıyla).
+    Object sütunlarında factorize yapılmaz; hash tablosu kurulmadan doğrudan hash'lenir.
+    Sayısal değerler float64'e çevrilir; parçadan parçaya int/float değişse de aynı değer aynı hash'i alır.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Yalnızca kategoriler hash'lenir, satırlara kod üzerinden dağıtılır
+        category_hashes = pd.util.hash_array(series.cat.categories.to_numpy(dtype=object), categorize=False)
+        codes = series.cat.codes.to_numpy()
+        return np.where(codes >= 0, category_hashes[codes], pd.util.hash_array(np.array([None], dtype=object))[0])
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        values = series.to_numpy(dtype='float64', na_value=np.nan)
+    else:
+        values = series.to_numpy()
+    return pd.util.hash_array(values, categorize=False)
+
+
+def column_weight(position: int) -> np.uint64:
+    """Sütun konumuna özgü tek sayı çarpanı (splitmix64)"""
+    z = (position + 1) * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & 0xFFFFFFFFFFFFFFFF
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EB & 0xFFFFFFFFFFFFFFFF
+    return np.uint64((z ^ (z >> 31)) | 1)
+
+
+def combine_hashes(row_hashes: np.ndarray, column_hashes: np.ndarray, position: int) -> np.ndarray:
+    """
+    Sütun hash'ini konum ağırlığıyla satır hash'ine ekle (mod 2^64).
+    Toplama sıradan bağımsız olduğu için sütun grupları ayrı ayrı hesaplanıp toplanabilir.
+    """
+    row_hashes += column_hashes * column_weight(position)
+    return row_hashes
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """uint64 dizisinin bit uzunlukları (32 bitlik yarılar float64'te tam temsil edilir)"""
+    hi = (x >> np.uint64(32)).astype(np.float64)
+    lo = (x & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(hi > 0, 32 + np.frexp(hi)[1], np.frexp(lo)[1])
+
+
+class HyperLogLog:
+    """
+    Farklı değer sayısı tahmini (HyperLogLog, 64 bit hash).
+    Bellek 2^precision bayttır; göreli standart hata 1.04 / sqrt(2^precision) (p=14 için ~%0.8).
+    Küçük kardinalitelerde (tahmin < 2.5·m) linear counting kullanılır; standart hatası sqrt(m·(e^t − t − 1)) (t = n/m),
+    p=14'te n≈1500 için ~%0.6 (%95 aralık ~±%1.1). Sonuç kesin değildir; güven aralığı bounds() ile alınır.
+    """
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def update(self, series: pd.Series):
+        self.update_hashes(hash_values(series)[series.notna().to_numpy()])
+
+    def update_hashes(self, hashes: np.ndarray):
+        if len(hashes) == 0:
+            return
+        hashes = hashes.astype(np.uint64, copy=False)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        rest = hashes << np.uint64(self.precision)
+        rho = np.minimum(64 - _bit_length(rest) + 1, 64 - self.precision + 1).astype(np.uint8)
+        # Her register için en büyük rho, ek tablo ayırmadan yerinde
+        np.maximum.at(self.registers, index, rho)
+
+    def merge(self, other: "HyperLogLog"):
+        if other.precision != self.precision:
+            raise ValueError("Farklı hassasiyetteki HyperLogLog'lar birleştirilemez")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / np.sqrt(self.m)
+
+    def _estimate(self) -> Tuple[float, bool]:
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        raw = alpha * self.m ** 2 / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * self.m and zeros > 0:
+            return float(self.m * np.log(self.m / zeros)), True
+        return float(raw), False
+
+    def estimate(self) -> float:
+        return self._estimate()[0]
+
+    def bounds(self, z: float = 2.0) -> Tuple[int, int]:
+        """Yaklaşık %95 güven aralığı (z=2); linear counting bölgesinde aralık çok daha dardır"""
+        estimate, linear = self._estimate()
+        if linear:
+            load = estimate / self.m
+            error = z * np.sqrt(self.m * (np.exp(load) - load - 1))
+        else:
+            error = z * self.relative_error * estimate
+        # Kardinalite tamsayıdır: aralık içindeki tamsayılara daraltılır, tahmin her zaman aralıkta kalır
+        rounded = int(round(estimate))
+        return min(int(np.ceil(max(0.0, estimate - error))), rounded), max(int(np.floor(estimate + error)), rounded)
+
+
+class KLLSketch:
+    """
+    Sabit bellekli quantile sketch'i (KLL).
+    Seviye h'deki her öğe 2^h değeri temsil eder; dolan seviye sıralanıp her iki öğeden biri üst seviyeye taşınır.
+    Normalize rank hatası ~2.296 / k^0.9723 (k=200 için ~%1.3, %99 güven).
+    """
+    def __init__(self, k: int = 200, random_state: int = 42):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(random_state)
+
+    @property
+    def rank_error(self) -> float:
+        return 2.296 / self.k ** 0.9723
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(8, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            capacity = self._capacity(level)
+            if len(items) > capacity:
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                    capacity = self._capacity(level)
+                items = np.sort(items)
+                # Toplu eklemede seviye boşaltılmaz: en küçük öğeler çift sayıda sıkıştırılır, kapasitenin yarısı seviyede kalır
+                n_compact = (len(items) - capacity // 2) // 2 * 2
+                promoted = items[:n_compact][self._rng.integers(2)::2]
+                self.levels[level] = items[n_compact:]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def _weighted(self) -> Tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level, dtype=np.float64) for level, items in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+
+    def quantile(self, q) -> np.ndarray:
+        """q (0-1 arası, skaler ya da liste) için tahmini quantile değerleri"""
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if self.n == 0:
+            return np.full(len(q), np.nan)
+        items, weights = self._weighted()
+        cumulative = np.cumsum(weights)
+        positions = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        result = items[np.clip(positions, 0, len(items) - 1)]
+        result[q <= 0] = self.min
+        result[q >= 1] = self.max
+        return result
+
+    def rank(self, x: float, inclusive: bool = True) -> float:
+        """x'ten küçük (inclusive ise küçük-eşit) değerlerin tahmini oranı"""
+        if self.n == 0:
+            return 0.0
+        items, weights = self._weighted()
+        mask = items <= x if inclusive else items < x
+        return float(weights[mask].sum() / weights.sum())
+
+
+class Reservoir:
+    """Parça parça gelen satırlardan sabit boyutlu, düzgün dağılımlı örneklem (Algorithm R)"""
+    def __init__(self, size: int, random_state: int = 42):
+        self.size = size
+        self.seen = 0
+        self.sample = None
+        self._rng = np.random.default_rng(random_state)
+
+    def update(self, chunk: pd.DataFrame):
+        n = len(chunk)
+        if n == 0 or self.size <= 0:
+            return
+        positions = np.arange(self.seen, self.seen + n)
+        self.seen += n
+        # Örneklem dolana kadar satırlar doğrudan eklenir
+        fill = positions < self.size
+        if fill.any():
+            head = chunk.iloc[np.flatnonzero(fill)]
+            self.sample = head.reset_index(drop=True) if self.sample is None else pd.concat([self.sample, head], ignore_index=True)
+        rest = np.flatnonzero(~fill)
+        if len(rest) == 0:
+            return
+        slots = self._rng.integers(0, positions[rest] + 1)
+        accepted = slots < self.size
+        rows, slots = rest[accepted], slots[accepted]
+        if len(rows) == 0:
+            return
+        # Aynı slota birden fazla satır düşerse sıralı algoritmadaki gibi sonuncusu kalır
+        last_slots, last_pos = np.unique(slots[::-1], return_index=True)
+        last_rows = rows[::-1][last_pos]
+        replacement = chunk.iloc[last_rows].set_axis(last_slots)
+        self.sample = pd.concat([self.sample.drop(index=last_slots), replacement]).sort_index()
+
+    def merge(self, other: "Reservoir"):
+        """
+        Başka satırlardan alınmış örneklemi ekle; sonuç iki kaynağın birleşimi üzerinde yine düzgün dağılımlıdır.
+        Örneklemdeki satırların kaç tanesinin bu kaynaktan geleceği hipergeometrik dağılımdan çekilir.
+        """
+        if other.sample is None or other.seen == 0:
+            return
+        sample = self.sample if self.sample is not None else other.sample.iloc[:0]
+        seen = self.seen + other.seen
+        if len(sample) + len(other.sample) <= self.size:
+            self.sample = pd.concat([sample, other.sample], ignore_index=True)
+            self.seen = seen
+            return
+        from_self = int(self._rng.hypergeometric(self.seen, other.seen, self.size)) if self.seen else 0
+        from_self = min(max(from_self, self.size - len(other.sample)), len(sample))
+        keep = np.sort(self._rng.choice(len(sample), from_self, replace=False))
+        take = np.sort(self._rng.choice(len(other.sample), self.size - from_self, replace=False))
+        self.sample = pd.concat([sample.iloc[keep], other.sample.iloc[take]], ignore_index=True)
+        self.seen = seen
+
+    def frame(self) -> Optional[pd.DataFrame]:
+        return None if self.sample is None else self.sample.reset_index(drop=True)
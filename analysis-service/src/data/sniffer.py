@@ -0,0 +1,86 @@
+import codecs
+import csv
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable
+from utils.logger import logger
+from data.compression import read_decompressed_head
+
+SNIFF_SAMPLE_BYTES = 64 * 1024
+CSV_DELIMITERS = ',;\t|'
+TXT_DELIMITERS = ',;\t| '
+
+# dataset hash -> okuma ayarları; aynı dosya için örnek tekrar okunmaz
+_SNIFF_CACHE = OrderedDict()
+_SNIFF_CACHE_SIZE = 256
+
+
+def _detect_encoding(sample: bytes) -> str:
+    """Örnek baytlardan encoding tespiti (BOM, ardından UTF-8 denemesi, yoksa latin-1)"""
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if sample.startswith(codecs.BOM_UTF16_LE) or sample.startswith(codecs.BOM_UTF16_BE):
+        return 'utf-16'
+    # Örnek çok baytlı bir karakterin ortasında kesilmiş olabilir; final=False bunu hata saymaz
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+
+def _looks_numeric(value: str) -> bool:
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+def sniff_csv(file_path: str, content_hash: Optional[str] = None, delimiters: str = CSV_DELIMITERS,
+              sample_bytes: int = SNIFF_SAMPLE_BYTES, read_sample: Optional[Callable[[int], bytes]] = None,
+              compression: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Dosyanın yalnızca ilk sample_bytes baytını okuyarak encoding, delimiter, quotechar ve header tespit eder.
+    content_hash verilirse sonuç önbelleğe alınır. Dönen sözlük doğrudan pd.read_csv parametresidir.
+    read_sample verilirse (ör. nesne deposu) örnek dosya açmak yerine bu fonksiyonla okunur.
+    compression verilirse örnek, dosyanın açılmış halinin başından alınır.
+    """
+    cache_key = (content_hash, delimiters) if content_hash else None
+    if cache_key in _SNIFF_CACHE:
+        _SNIFF_CACHE.move_to_end(cache_key)
+        return dict(_SNIFF_CACHE[cache_key])
+
+    if read_sample is not None:
+        sample = read_sample(sample_bytes)
+    else:
+        with open(file_path, 'rb') as f:
+            sample = read_decompressed_head(f, compression, sample_bytes) if compression else f.read(sample_bytes)
+    encoding = _detect_encoding(sample)
+    text = sample.decode(encoding, errors='ignore')
+    # Kesilmiş son satır sniffer'ı yanıltmasın
+    if len(sample) == sample_bytes and '\n' in text:
+        text = text[:text.rindex('\n')]
+    lines = text.splitlines()
+
+    options = {'encoding': encoding, 'sep': ',', 'quotechar': '"', 'header': 0}
+    if lines:
+        try:
+            dialect = csv.Sniffer().sniff('\n'.join(lines[:100]), delimiters=delimiters)
+            options['sep'] = dialect.delimiter
+            options['quotechar'] = dialect.quotechar or '"'
+        except csv.Error:
+            # Sniffer karar veremezse ilk satırdaki en sık delimiter kullanılır
+            counts = {d: lines[0].count(d) for d in delimiters}
+            options['sep'] = max(counts, key=counts.get)
+        # İlk satırdaki tüm alanlar sayıysa başlık yoktur
+        first_row = next(csv.reader([lines[0]], delimiter=options['sep'], quotechar=options['quotechar']), [])
+        fields = [field.strip() for field in first_row if field.strip()]
+        if fields and all(_looks_numeric(field) for field in fields):
+            options['header'] = None
+    logger.info(f"CSV ayarları tespit edildi: {options}")
+
+    if cache_key:
+        _SNIFF_CACHE[cache_key] = dict(options)
+        if len(_SNIFF_CACHE) > _SNIFF_CACHE_SIZE:
+            _SNIFF_CACHE.popitem(last=False)
+    return options
@@ -16,11 +16,28 @@ except ImportError:
     LIGHTGBM_AVAILABLE = False
 
 import numpy as np
+import scipy.sparse as sp
 from typing import Dict, Any, Tuple
 from utils.logger import logger
 import joblib
 import os
 
+# CSR girdiyi doğrudan kabul eden modeller; diğerleri için seyrek matris yoğunlaştırılır
+SPARSE_MODEL_TYPES = {
+    "random_forest", "gradient_boosting", "logistic_regression", "svm", "knn", "decision_tree",
+    "xgboost", "lightgbm", "extra_trees",
+    "linear_regression", "ridge", "lasso", "elasticnet", "random_forest_regressor", "gradient_boosting_regressor",
+    "svr", "knn_regressor", "decision_tree_regressor", "xgboost_regressor", "lightgbm_regressor", "extra_trees_regressor"
+}
+
+# float32 girdiyi kopyalamadan kullanan modeller (ağaç tabanlılar içte zaten float32 çalışır);
+# logistic_regression (liblinear), svm ve svr girdiyi float64'e çevirir
+FLOAT32_MODEL_TYPES = {
+    "random_forest", "gradient_boosting", "decision_tree", "extra_trees", "xgboost", "lightgbm", "knn",
+    "random_forest_regressor", "gradient_boosting_regressor", "decision_tree_regressor", "extra_trees_regressor",
+    "xgboost_regressor", "lightgbm_regressor", "linear_regression", "ridge", "lasso", "elasticnet", "knn_regressor"
+}
+
 class ModelTrainer:
     def __init__(self, model_type: str = "random_forest"):
         self.model_type = model_type
@@ -79,10 +96,16 @@ class ModelTrainer:
     def train(self, X_train: np.ndarray, y_train: np.ndarray, 
               X_val: np.ndarray = None, y_val: np.ndarray = None,
               **kwargs) -> Dict[str, Any]:
-        """Modeli eğit"""
+        """Modeli eğit (X_train CSR matris olabilir)"""
         logger.info(f"{self.model_type} modeli eğitiliyor...")
         
         self.model = self.create_model()
+        if sp.issparse(X_train) and self.model_type not in SPARSE_MODEL_TYPES:
+            logger.warning(f"{self.model_type} seyrek girdiyi desteklemiyor, matris yoğunlaştırılıyor")
+            X_train = X_train.toarray()
+            X_val = X_val.toarray() if sp.issparse(X_val) else X_val
+        if X_train.dtype == np.float32 and self.model_type not in FLOAT32_MODEL_TYPES:
+            logger.info(f"{self.model_type} float32 girdiyi desteklemiyor, model eğitimde float64 kopyası oluşturur")
         
         # Model eğitimi
         if self.model_type in ["xgboost", "lightgbm"] and X_val is not None:
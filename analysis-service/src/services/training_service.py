@@ -11,14 +11,18 @@ from storage.minio_client import MinIOClient
 from utils.logger import logger
 import requests
 import numpy as np
+import pandas as pd
 
-def send_model_to_mlflow(model_path, model_name, model_type, metrics, problem_type, data_file_name, artifact_paths=None):
+def send_model_to_mlflow(model_path, model_name, model_type, metrics, problem_type, data_file_name, artifact_paths=None, preprocessor_path=None):
     mlflow_url = os.getenv("MLFLOW_SERVICE_URL", "http://ml-service:8001/api/mlflow/submit-model")
     logger.info(f"MLflow servisine model gönderiliyor: {mlflow_url}")
     logger.info(f"MLFLOW_SEND: data_file_name = {data_file_name}")
     files = {
         "file": (os.path.basename(model_path), open(model_path, "rb"), "application/octet-stream")
     }
+    # Fit edilmiş önişleme modelle aynı run'a artifact olarak yüklenir
+    if preprocessor_path:
+        files["preprocessor"] = (os.path.basename(preprocessor_path), open(preprocessor_path, "rb"), "application/octet-stream")
     data_file_name_no_ext = os.path.splitext(data_file_name)[0] if data_file_name else "unknown_data"
     payload = {
         "model_name": model_name,
@@ -42,7 +46,54 @@ def to_python_type(val):
         return val.tolist()
     return val
 
-def train_model_pipeline(data_path=None, model_name=None, model_type=None, test_size=None, random_state=None, target_column=None, problem_type=None, data_file_name=None):
+def load_training_frame(data_loader, config, streaming=None, load_options=None):
+    """
+    Eğitim verisini yükler ve veri özetini çıkarır.
+    Büyük dosyalarda veri parça parça okunur; özet parçalar üzerinden biriktirilir ve eğitim için
+    en fazla DATA_TRAIN_MAX_ROWS (varsayılan 1000000) satırlık örneklem alınır. DATA_TRAIN_MAX_ROWS=0 ile
+    tüm veri kullanılır; okunan parçalar DATA_TRAIN_MAX_MEMORY_MB'ı aşarsa yükleme hata ile durdurulur.
+    load_options DataLoader.load_data/iter_chunks'a aynen iletilir (ör. Excel sayfası).
+    """
+    load_options = load_options or {}
+    if streaming is None:
+        streaming = data_loader.should_stream()
+    if not streaming:
+        df = data_loader.load_data(**load_options)
+        if df is None:
+            return None, None
+        return df, {"shape": df.shape, "missing_values": df.isnull().sum().to_dict()}
+    logger.info("Veri parça parça yükleniyor...")
+    summary = {"n_rows": 0, "missing": None}
+
+    def _tracked_chunks():
+        for chunk in data_loader.iter_chunks(**load_options):
+            summary["n_rows"] += len(chunk)
+            missing = chunk.isnull().sum()
+            summary["missing"] = missing if summary["missing"] is None else summary["missing"].add(missing, fill_value=0)
+            yield chunk
+
+    if config.data.train_max_rows:
+        df = data_loader.sample_rows(_tracked_chunks(), config.data.train_max_rows, random_state=config.model.random_state)
+        if df is not None:
+            logger.info(f"Eğitim için {summary['n_rows']} satırdan {len(df)} satırlık örneklem alındı")
+    else:
+        # Birleştirme parçaların bir kopyasını daha oluşturur; sınır aşılmadan durulur
+        max_bytes = config.data.train_max_memory_mb * 1024 * 1024
+        chunks, loaded_bytes = [], 0
+        for chunk in _tracked_chunks():
+            loaded_bytes += int(chunk.memory_usage(deep=True).sum())
+            if max_bytes and loaded_bytes > max_bytes:
+                raise ValueError(f"Eğitim verisi {config.data.train_max_memory_mb} MB bellek sınırını aşıyor "
+                                 f"({summary['n_rows']} satırda); DATA_TRAIN_MAX_ROWS ile örneklem kullanın")
+            chunks.append(chunk)
+        df = pd.concat(chunks, ignore_index=True) if chunks else None
+        del chunks
+    if df is None:
+        return None, None
+    missing = summary["missing"].astype(int).to_dict() if summary["missing"] is not None else {}
+    return df, {"shape": (summary["n_rows"], df.shape[1]), "missing_values": missing}
+
+def train_model_pipeline(data_path=None, model_name=None, model_type=None, test_size=None, random_state=None, target_column=None, problem_type=None, data_file_name=None, streaming=None, content_hash=None, load_options=None):
     logger.info("Analysis Service API üzerinden model eğitimi başlatılıyor...")
     config = Config()
     if data_path is not None:
@@ -57,24 +108,28 @@ def train_model_pipeline(data_path=None, model_name=None, model_type=None, test_
         target_column = 'Type'
     model_types = model_type if isinstance(model_type, list) else [model_type]
     results = []
-    data_loader = DataLoader(config.data_path)
+    data_loader = DataLoader(config.data_path, config=config.data, content_hash=content_hash)
     logger.info("Veri yükleniyor...")
-    df = data_loader.load_data()
+    df, loaded_summary = load_training_frame(data_loader, config, streaming=streaming, load_options=load_options)
     if df is None:
         raise Exception("Veri yüklenemedi")
     data_file_name_no_ext = data_file_name if data_file_name else os.path.basename(config.data_path) if config.data_path else "unknown_data"
     data_file_name_no_ext = os.path.splitext(data_file_name_no_ext)[0]
     import json as _json
     data_summary = {
-        "shape": df.shape,
+        "shape": loaded_summary["shape"],
         "columns": list(df.columns),
         "data_types": {col: str(dtype) for col, dtype in df.dtypes.items()},
-        "missing_values": df.isnull().sum().to_dict()
+        "missing_values": loaded_summary["missing_values"]
     }
     data_summary_path = "/tmp/data_summary.json"
     with open(data_summary_path, "w", encoding="utf-8") as f:
         _json.dump(data_summary, f, ensure_ascii=False, indent=2)
-    preprocessor = DataPreprocessor()
+    preprocessor = DataPreprocessor({
+        'sparse_output': config.data.sparse_features,
+        'inplace': config.data.preprocess_inplace,
+        'dtype': config.data.feature_dtype
+    })
     logger.info("Veri ön işleniyor...")
     X_train, X_test, y_train, y_test = preprocessor.preprocess(
         df,
@@ -82,6 +137,8 @@ def train_model_pipeline(data_path=None, model_name=None, model_type=None, test_
         test_size=config.model.test_size,
         random_state=config.model.random_state
     )
+    # Tüm modeller aynı fit edilmiş önişlemeyi kullanır; bir kez kaydedilir
+    preprocessor_path = preprocessor.save(f"/tmp/{config.model.model_name}_preprocessor_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.joblib")
     # Model listelerini güncelle
     classification_models = [
         "random_forest", "gradient_boosting", "logistic_regression", "svm", "knn", "decision_tree",
@@ -121,7 +178,7 @@ def train_model_pipeline(data_path=None, model_name=None, model_type=None, test_
             mlflow_response = send_model_to_mlflow(model_path, config.model.model_name, mt, {
                 "training_info": training_info,
                 "evaluation_metrics": metrics
-            }, problem_type=_problem_type, data_file_name=data_file_name_no_ext)
+            }, problem_type=_problem_type, data_file_name=data_file_name_no_ext, preprocessor_path=preprocessor_path)
             result = {
                 "model_type": mt,
                 "model_filename": model_filename,
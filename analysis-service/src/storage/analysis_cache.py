@@ -0,0 +1,148 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from config.config import DataConfig
+from data.profiler import PROFILER_VERSION
+from storage.minio_client import MinIOClient, get_minio_client
+from utils.logger import logger
+
+
+class AnalysisCache:
+    """
+    /analyze sonuçları için iki katmanlı önbellek: bellekte LRU, arkasında MinIO.
+    Anahtar (içerik hash'i, okuma seçenekleri, profiler sürümü) üçlüsünden üretilir; veri ya da
+    profil biçimi değişince anahtar da değişir. Bellek katmanı kayıt sayısı, toplam boyut ve yaşa göre,
+    MinIO katmanı yalnızca yaşa göre geçersiz olur.
+    Nesne yapısı: analysis-cache/{key}.json
+    """
+    def __init__(self, minio_client: Optional[MinIOClient] = None, max_entries: int = 128, max_mb: int = 64,
+                 ttl_seconds: int = 86400, prefix: str = "analysis-cache"):
+        self.minio_client = minio_client
+        self.max_entries = max_entries
+        self.max_bytes = max_mb * 1024 * 1024
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "storage_hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "stores": 0}
+
+    @staticmethod
+    def make_key(content_hash: str, options: Dict[str, Any]) -> str:
+        payload = json.dumps({"content_hash": content_hash, "options": options, "profiler_version": PROFILER_VERSION},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _object_name(self, key: str) -> str:
+        return f"{self.prefix}/{key}.json"
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._expired(entry["created_at"]):
+                    self._remove(key)
+                    self._counters["expirations"] += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    return json.loads(entry["payload"])
+        stored = self._load(key)
+        with self._lock:
+            if stored is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["storage_hits"] += 1
+            self._insert(key, json.dumps(stored["value"]), stored["created_at"])
+        return stored["value"]
+
+    def put(self, key: str, value: Dict[str, Any]):
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Analiz sonucu önbelleğe alınamadı: {e}")
+            return
+        created_at = time.time()
+        with self._lock:
+            self._insert(key, payload, created_at)
+            self._counters["stores"] += 1
+        if self.minio_client is not None:
+            try:
+                self.minio_client.upload_json({"created_at": created_at, "value": value}, self._object_name(key))
+            except Exception as e:
+                # Kalıcı katman erişilemezse sonuç yalnızca bellekte tutulur
+                logger.warning(f"Analiz sonucu MinIO'ya yazılamadı: {e}")
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.minio_client is None:
+            return None
+        try:
+            if not self.minio_client.object_exists(self._object_name(key)):
+                return None
+            stored = self.minio_client.download_json(self._object_name(key))
+        except Exception as e:
+            logger.warning(f"Analiz önbelleği MinIO'dan okunamadı: {e}")
+            return None
+        if self._expired(stored.get("created_at", 0)):
+            with self._lock:
+                self._counters["expirations"] += 1
+            return None
+        return stored
+
+    def _insert(self, key: str, payload: str, created_at: float):
+        size = len(payload)
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            # Tek başına sınırı aşan sonuç bellekte tutulmaz (MinIO'da kalır)
+            return
+        self._entries[key] = {"payload": payload, "size": size, "created_at": created_at}
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._counters["evictions"] += 1
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._bytes -= entry["size"]
+
+    def clear(self):
+        """Bellek katmanını boşalt (MinIO'daki kayıtlar yaşlanarak geçersiz olur)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self._counters["memory_hits"] + self._counters["storage_hits"]
+            requests = hits + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_ratio": hits / requests if requests else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "profiler_version": PROFILER_VERSION
+            }
+
+
+_analysis_cache = None
+
+def get_analysis_cache() -> AnalysisCache:
+    """Uygulama genelinde tek AnalysisCache örneği"""
+    global _analysis_cache
+    if _analysis_cache is None:
+        config = DataConfig.from_env()
+        _analysis_cache = AnalysisCache(get_minio_client() if config.analysis_cache_persist else None,
+                                        max_entries=config.analysis_cache_entries,
+                                        max_mb=config.analysis_cache_max_mb,
+                                        ttl_seconds=config.analysis_cache_ttl_seconds)
+    return _analysis_cache
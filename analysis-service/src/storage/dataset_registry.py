@@ -0,0 +1,203 @@
+import datetime
+import os
+import re
+import tempfile
+from typing import Dict, Any, List, Optional
+from config.config import DataConfig
+from data.loader import DataLoader, PYARROW_AVAILABLE
+from data.compression import split_compression, full_suffix
+from data.sniffer import sniff_csv, CSV_DELIMITERS, TXT_DELIMITERS
+from storage.minio_client import MinIOClient, get_minio_client
+from utils.logger import logger
+from utils.hashing import file_sha256
+from utils import disk_cache
+
+DATASET_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+# Zaten kolon bazlı olan formatlar dönüştürülmeden saklanır.
+# Excel de olduğu gibi saklanır; sayfa seçimi ve kolon bazlı kopya DataLoader'ın Excel önbelleğindedir.
+PASSTHROUGH_FORMATS = {'.parquet', '.feather', '.arrow', '.ipc', '.xlsx', '.xls'}
+
+
+class DatasetRegistry:
+    """
+    Yüklenen veri setlerini içerik hash'i (sha256) ile MinIO'da bir kez saklar.
+    Aynı içerik tekrar yüklendiğinde yalnızca hash hesaplanır, veri yeniden parse edilmez.
+    Nesne yapısı: datasets/{dataset_id}/data{ext} ve datasets/{dataset_id}/metadata.json
+    Sonradan eklenen partiler: datasets/{dataset_id}/appends/{batch_hash}{ext}, sırası appends.json'da tutulur.
+    Yerel kopyalar (veri setleri ve partiler) cache_dir'de LRU olarak tutulur; boyut ya da yaş sınırını aşanlar
+    silinir ve gerektiğinde MinIO'dan yeniden indirilir.
+    """
+    def __init__(self, minio_client: MinIOClient, config: DataConfig = None, prefix: str = "datasets"):
+        self.minio_client = minio_client
+        self.config = config or DataConfig()
+        self.prefix = prefix
+        self.cache_dir = self.config.dataset_cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._evict()
+
+    @staticmethod
+    def compute_hash(file_path: str) -> str:
+        return file_sha256(file_path)
+
+    def _validate_id(self, dataset_id: str):
+        if not DATASET_ID_PATTERN.match(dataset_id or ""):
+            raise KeyError(f"Geçersiz dataset_id: {dataset_id}")
+
+    def _object_name(self, dataset_id: str, name: str) -> str:
+        return f"{self.prefix}/{dataset_id}/{name}"
+
+    def _local_path(self, dataset_id: str, ext: str) -> str:
+        return os.path.join(self.cache_dir, f"{dataset_id}{ext}")
+
+    def _evict(self):
+        disk_cache.evict(self.cache_dir, self.config.dataset_cache_max_mb, self.config.dataset_cache_ttl_seconds)
+
+    def _cached_download(self, object_name: str, local_path: str) -> str:
+        """Yerel kopya varsa son kullanım zamanını güncelle, yoksa MinIO'dan indir ve önbelleği sınırla"""
+        if os.path.exists(local_path):
+            disk_cache.touch(local_path)
+            return local_path
+        # Aynı veri seti için eşzamanlı istekler ayrı geçici dosyalara indirir; son os.replace kazanır
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{os.path.basename(local_path)}.", suffix=".part")
+        os.close(fd)
+        try:
+            self.minio_client.download_file(object_name, tmp_path)
+            os.replace(tmp_path, local_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._evict()
+        return local_path
+
+    def exists(self, dataset_id: str) -> bool:
+        self._validate_id(dataset_id)
+        return self.minio_client.object_exists(self._object_name(dataset_id, "metadata.json"))
+
+    def get_metadata(self, dataset_id: str) -> Dict[str, Any]:
+        """Kayıtlı veri setinin metadata'sını döndür"""
+        if not self.exists(dataset_id):
+            raise KeyError(f"Veri seti bulunamadı: {dataset_id}")
+        return self.minio_client.download_json(self._object_name(dataset_id, "metadata.json"))
+
+    def get_path(self, dataset_id: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Veri setinin yerel kopyasının yolunu döndür, yoksa MinIO'dan indir"""
+        metadata = metadata or self.get_metadata(dataset_id)
+        return self._cached_download(metadata["object_name"], self._local_path(dataset_id, metadata["storage_format"]))
+
+    def list_appends(self, dataset_id: str) -> List[Dict[str, Any]]:
+        """Veri setine eklenmiş partiler, eklenme sırasıyla"""
+        object_name = self._object_name(dataset_id, "appends.json")
+        if not self.minio_client.object_exists(object_name):
+            return []
+        return self.minio_client.download_json(object_name)["batches"]
+
+    def add_append(self, dataset_id: str, file_path: str, batch_hash: str, filename: str = None) -> List[Dict[str, Any]]:
+        """
+        Eklenen partiyi olduğu gibi sakla ve listeye ekle (aynı hash ikinci kez eklenmez).
+        Profil uyumsuzluk nedeniyle yeniden çıkarılırken partiler bu kayıtlardan tekrar uygulanır.
+        """
+        self._validate_id(dataset_id)
+        appends = self.list_appends(dataset_id)
+        if any(entry["batch_hash"] == batch_hash for entry in appends):
+            return appends
+        storage_format = full_suffix(file_path)
+        object_name = self._object_name(dataset_id, f"appends/{batch_hash}{storage_format}")
+        self.minio_client.upload_file(file_path, object_name)
+        appends.append({
+            "batch_hash": batch_hash,
+            "object_name": object_name,
+            "storage_format": storage_format,
+            "original_filename": filename,
+            "created_at": datetime.datetime.now().isoformat()
+        })
+        # Liste parti yüklendikten sonra yazılır; listedeki her parti okunabilir durumdadır
+        self.minio_client.upload_json({"batches": appends}, self._object_name(dataset_id, "appends.json"))
+        return appends
+
+    def get_append_path(self, dataset_id: str, entry: Dict[str, Any]) -> str:
+        """Eklenen partinin yerel kopyasının yolu, yoksa MinIO'dan indirilir"""
+        return self._cached_download(entry["object_name"], self._local_path(f"{dataset_id}_{entry['batch_hash']}", entry["storage_format"]))
+
+    def register(self, file_path: str, filename: str, content_hash: str = None) -> Dict[str, Any]:
+        """
+        Dosyayı kaydet ve metadata döndür.
+        Aynı içerik daha önce kaydedildiyse parse etmeden mevcut kaydı döndürür.
+        """
+        dataset_id = content_hash or self.compute_hash(file_path)
+        if self.exists(dataset_id):
+            logger.info(f"Veri seti zaten kayıtlı, yeniden işlenmiyor: {dataset_id}")
+            return self.get_metadata(dataset_id)
+        source_ext, compression = split_compression(file_path)
+        loader = DataLoader(file_path, config=self.config, content_hash=dataset_id)
+        local_path = None
+        n_rows, columns = None, None
+        csv_options = None
+        if source_ext in ('.csv', '.txt'):
+            # Tespit edilen ayarlar hash ile önbelleğe alınır; aşağıdaki okuma aynı sonucu kullanır
+            csv_options = sniff_csv(file_path, content_hash=dataset_id, delimiters=TXT_DELIMITERS if source_ext == '.txt' else CSV_DELIMITERS,
+                                    compression=compression)
+        if PYARROW_AVAILABLE and source_ext not in PASSTHROUGH_FORMATS and not loader.should_stream():
+            # Metin dosyaları bir kez parse edilip Parquet olarak saklanır
+            df = loader.load_data(optimize_memory=False)
+            if df is None:
+                raise ValueError("Veri yüklenemedi")
+            parquet_path = self._local_path(dataset_id, ".parquet")
+            if self._write_parquet(df, parquet_path):
+                local_path = parquet_path
+                n_rows, columns = int(len(df)), [str(col) for col in df.columns]
+            del df
+        if local_path is None:
+            # Kolon bazlı, Excel, parçalı okunacak kadar büyük ya da Parquet'e aynen yazılamayan dosyalar
+            # olduğu gibi (sıkıştırılmışsa sıkıştırılmış) saklanır
+            local_path = self._local_path(dataset_id, full_suffix(file_path))
+            with open(file_path, "rb") as src, open(local_path, "wb") as dst:
+                for block in iter(lambda: src.read(1024 * 1024), b""):
+                    dst.write(block)
+        storage_format = full_suffix(local_path)
+        object_name = self._object_name(dataset_id, f"data{storage_format}")
+        self.minio_client.upload_file(local_path, object_name)
+        metadata = {
+            "dataset_id": dataset_id,
+            "original_filename": filename,
+            "source_format": source_ext,
+            "compression": compression,
+            "storage_format": storage_format,
+            "object_name": object_name,
+            "size_bytes": os.path.getsize(file_path),
+            "n_rows": n_rows,
+            "columns": columns,
+            "csv_options": csv_options,
+            "sheets": loader.list_sheets() if source_ext in ('.xlsx', '.xls') else None,
+            "created_at": datetime.datetime.now().isoformat()
+        }
+        # metadata en son yazılır; varlığı kaydın tamamlandığını gösterir
+        self.minio_client.upload_json(metadata, self._object_name(dataset_id, "metadata.json"))
+        logger.info(f"Veri seti kaydedildi: {dataset_id} ({filename})")
+        self._evict()
+        return metadata
+
+    def _write_parquet(self, df, local_path: str) -> bool:
+        """
+        Frame'i Parquet olarak yaz. Karışık tipli object sütunları (ör. sayı + metin) Arrow'a yazılamaz;
+        saklanan veri yüklenenden farklı olmasın diye tip değiştirilmez, False dönülür ve orijinal dosya saklanır.
+        """
+        try:
+            df.to_parquet(local_path, index=False)
+            return True
+        except (TypeError, ValueError) as e:
+            mixed = [str(col) for col in df.select_dtypes(include=['object']).columns
+                     if df[col].dropna().map(type).nunique() > 1]
+            logger.warning(f"Parquet'e yazılamadı, orijinal dosya saklanıyor (karışık tipli sütunlar: {mixed}): {e}")
+            if os.path.exists(local_path):
+                os.unlink(local_path)
+            return False
+
+_registry = None
+
+def get_dataset_registry() -> DatasetRegistry:
+    """Uygulama genelinde tek DatasetRegistry örneği (MinIO bağlantısı ilk kullanımda kurulur)"""
+    global _registry
+    if _registry is None:
+        _registry = DatasetRegistry(get_minio_client(), config=DataConfig.from_env())
+    return _registry
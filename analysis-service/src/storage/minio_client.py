@@ -1,6 +1,7 @@
 from minio import Minio
 from minio.error import S3Error
 from io import BytesIO
+import json
 from config.config import MinIOConfig
 from src.utils.logger import logger
 
@@ -37,18 +38,7 @@ class MinIOClient:
         Dönüş: yüklenen dosyanın tam ismi, örn: "rapor_v3.pdf"
         """
         try:
-            objects = self.client.list_objects(self.config.bucket_name, prefix=f"{folder}/")
-            versions = []
-            for obj in objects:
-                name = obj.object_name  # örn: reports/dataset1/rapor_v1.pdf
-                prefix = f"{folder}/{base_name}_v"
-                suffix = f".{ext}"
-                if name.startswith(prefix) and name.endswith(suffix):
-                    v_str = name[len(prefix):-len(suffix)]
-                    if v_str.isdigit():
-                        versions.append(int(v_str))
-            next_version = max(versions) + 1 if versions else 1
-            object_name = f"{folder}/{base_name}_v{next_version}.{ext}"
+            object_name = self._next_report_object_name(base_name, ext, folder)
 
             self.client.put_object(
                 bucket_name=self.config.bucket_name,
@@ -64,6 +54,39 @@ class MinIOClient:
             raise
 
 
+    def upload_report_file(self, file_path: str, base_name: str, ext: str = "pdf", folder: str = "reports") -> str:
+        """
+        Diskteki dosyayı parça parça (belleğe almadan) yükler.
+        Versiyonlama upload_report_bytes ile aynıdır.
+        """
+        try:
+            object_name = self._next_report_object_name(base_name, ext, folder)
+            self.client.fput_object(
+                bucket_name=self.config.bucket_name,
+                object_name=object_name,
+                file_path=file_path,
+                content_type=f"application/{ext}",
+            )
+            logger.info(f"Dosyadan '{object_name}' başarıyla yüklendi")
+            return object_name
+        except S3Error as e:
+            logger.error(f"Dosyadan rapor yükleme hatası: {e}")
+            raise
+
+    def _next_report_object_name(self, base_name: str, ext: str, folder: str) -> str:
+        """Aynı isimdeki raporların son versiyonuna 1 ekleyerek nesne adını belirler"""
+        objects = self.client.list_objects(self.config.bucket_name, prefix=f"{folder}/")
+        versions = []
+        for obj in objects:
+            name = obj.object_name  # örn: reports/dataset1/rapor_v1.pdf
+            prefix = f"{folder}/{base_name}_v"
+            suffix = f".{ext}"
+            if name.startswith(prefix) and name.endswith(suffix):
+                v_str = name[len(prefix):-len(suffix)]
+                if v_str.isdigit():
+                    versions.append(int(v_str))
+        next_version = max(versions) + 1 if versions else 1
+        return f"{folder}/{base_name}_v{next_version}.{ext}"
         
     def download_report(self, object_name: str) -> bytes:
         """
@@ -112,3 +135,91 @@ class MinIOClient:
         except S3Error as e:
             logger.error(f"Rapor listesi hatası: {e}")
             return []
+
+    def object_exists(self, object_name: str) -> bool:
+        """Nesnenin bucket'ta olup olmadığını kontrol et"""
+        try:
+            self.client.stat_object(self.config.bucket_name, object_name)
+            return True
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchObject", "NotFound"):
+                return False
+            logger.error(f"Nesne kontrol hatası: {e}")
+            raise
+
+    def stat_object(self, object_name: str, bucket_name: str = None):
+        """Nesnenin boyut/etag bilgisini döndür (içerik okunmaz)"""
+        try:
+            return self.client.stat_object(bucket_name or self.config.bucket_name, object_name)
+        except S3Error as e:
+            logger.error(f"Nesne bilgisi alınamadı: {e}")
+            raise
+
+    def get_object_range(self, object_name: str, offset: int = 0, length: int = 0, bucket_name: str = None):
+        """
+        Nesnenin offset'ten başlayan length baytlık kısmını akış olarak aç (length=0: sonuna kadar).
+        Dönen yanıt çağıran tarafından close() ve release_conn() ile kapatılmalıdır.
+        """
+        try:
+            return self.client.get_object(bucket_name or self.config.bucket_name, object_name, offset=offset, length=length)
+        except S3Error as e:
+            logger.error(f"Nesne okuma hatası: {e}")
+            raise
+
+    def upload_file(self, file_path: str, object_name: str, content_type: str = "application/octet-stream") -> str:
+        """Yerel dosyayı parça parça (belleğe almadan) yükle"""
+        try:
+            self.client.fput_object(self.config.bucket_name, object_name, file_path, content_type=content_type)
+            logger.info(f"'{object_name}' yüklendi")
+            return object_name
+        except S3Error as e:
+            logger.error(f"Dosya yükleme hatası: {e}")
+            raise
+
+    def download_file(self, object_name: str, file_path: str) -> str:
+        """Nesneyi yerel dosyaya indir"""
+        try:
+            self.client.fget_object(self.config.bucket_name, object_name, file_path)
+            logger.info(f"'{object_name}' indirildi: {file_path}")
+            return file_path
+        except S3Error as e:
+            logger.error(f"Dosya indirme hatası: {e}")
+            raise
+
+    def upload_json(self, data: dict, object_name: str) -> str:
+        """Sözlüğü JSON nesnesi olarak yükle"""
+        payload = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+        try:
+            self.client.put_object(
+                bucket_name=self.config.bucket_name,
+                object_name=object_name,
+                data=BytesIO(payload),
+                length=len(payload),
+                content_type="application/json",
+            )
+            return object_name
+        except S3Error as e:
+            logger.error(f"JSON yükleme hatası: {e}")
+            raise
+
+    def download_json(self, object_name: str) -> dict:
+        """JSON nesnesini indirip sözlük olarak döndür"""
+        try:
+            response = self.client.get_object(self.config.bucket_name, object_name)
+            data = response.read()
+            response.close()
+            response.release_conn()
+            return json.loads(data.decode("utf-8"))
+        except S3Error as e:
+            logger.error(f"JSON indirme hatası: {e}")
+            raise
+
+
+_minio_client = None
+
+def get_minio_client() -> MinIOClient:
+    """Uygulama genelinde tek MinIOClient örneği (bağlantı ilk kullanımda kurulur)"""
+    global _minio_client
+    if _minio_client is None:
+        _minio_client = MinIOClient(MinIOConfig.from_env())
+    return _minio_client
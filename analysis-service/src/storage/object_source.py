@@ -0,0 +1,112 @@
+import io
+from typing import Tuple
+from urllib.parse import urlparse
+
+OBJECT_URI_SCHEMES = ('s3', 'minio')
+# Rastgele erişimde tek GET ile okunacak en küçük blok; küçük footer/metadata okumalarını birleştirir
+RANGE_BLOCK_SIZE = 1024 * 1024
+
+
+def is_object_uri(path) -> bool:
+    return isinstance(path, str) and urlparse(path).scheme in OBJECT_URI_SCHEMES
+
+
+def parse_object_uri(uri: str) -> Tuple[str, str]:
+    """s3://bucket/key biçimindeki adresi (bucket, key) olarak ayır"""
+    parsed = urlparse(uri)
+    bucket, key = parsed.netloc, parsed.path.lstrip('/')
+    if parsed.scheme not in OBJECT_URI_SCHEMES or not bucket or not key:
+        raise ValueError(f"Geçersiz nesne adresi: {uri}")
+    return bucket, key
+
+
+class MinIOObjectReader(io.RawIOBase):
+    """
+    MinIO nesnesi üzerinde okunabilir ve seek edilebilir dosya nesnesi.
+    sequential=True (CSV/JSON) iken nesne tek bir açık uçlu GET ile akış olarak okunur;
+    sequential=False (Parquet/Arrow/Excel) iken her konum için ranged GET yapılır,
+    böylece yalnızca footer ve istenen row group/sütun baytları indirilir.
+    """
+    def __init__(self, minio_client, bucket: str, key: str, size: int, sequential: bool = True,
+                 block_size: int = RANGE_BLOCK_SIZE):
+        super().__init__()
+        self.minio_client = minio_client
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.sequential = sequential
+        self.block_size = block_size
+        self.name = f"s3://{bucket}/{key}"
+        self._pos = 0
+        self._response = None
+        self._response_pos = 0
+        self._response_end = 0
+        self.bytes_read = 0
+        self.requests = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Geçersiz whence: {whence}")
+        if pos < 0:
+            raise ValueError("Negatif konuma seek edilemez")
+        self._pos = pos
+        return pos
+
+    def _open_response(self, n: int):
+        self._close_response()
+        length = 0 if self.sequential else min(max(n, self.block_size), self.size - self._pos)
+        self._response = self.minio_client.get_object_range(self.key, offset=self._pos, length=length, bucket_name=self.bucket)
+        self._response_pos = self._pos
+        self._response_end = self.size if length == 0 else self._pos + length
+        self.requests += 1
+
+    def _close_response(self):
+        if self._response is not None:
+            self._response.close()
+            self._response.release_conn()
+            self._response = None
+
+    def readinto(self, buffer) -> int:
+        """
+        Tampon dolana ya da nesne bitene kadar okur; pyarrow kısa okumayı hata sayar.
+        Açık yanıtın aralığı bitince sonraki aralık için yeni ranged GET açılır.
+        """
+        view = memoryview(buffer).cast('B')
+        total = 0
+        while total < len(view) and self._pos < self.size:
+            # Açık yanıt tam bu konumdaysa devam edilir, değilse yeni ranged GET açılır
+            if self._response is None or self._response_pos != self._pos or self._response_pos >= self._response_end:
+                self._open_response(len(view) - total)
+            n = min(len(view) - total, self._response_end - self._response_pos)
+            data = self._response.read(n)
+            if not data:
+                # Yanıt beklenenden erken bitti; bir sonraki turda yeniden açılır
+                self._close_response()
+                if total:
+                    break
+                raise IOError(f"Nesne beklenenden kısa: {self.name} ({self._pos}/{self.size} bayt)")
+            view[total:total + len(data)] = data
+            total += len(data)
+            self._pos += len(data)
+            self._response_pos += len(data)
+            self.bytes_read += len(data)
+        return total
+
+    def close(self):
+        self._close_response()
+        super().close()
@@ -0,0 +1,76 @@
+import os
+import pickle
+import tempfile
+from typing import Dict, Any, Optional
+from data.profiler import DataProfiler, PROFILER_VERSION
+from storage.minio_client import MinIOClient, get_minio_client
+from utils.logger import logger
+
+# Saklanan durumun uyumluluğunu belirleyen profil parametreleri
+STATE_OPTIONS = ('sample_size', 'hll_precision', 'kll_k')
+
+
+class ProfileStore:
+    """
+    Veri setlerinin append edilebilir profillerini MinIO'da saklar.
+    Profil approximate modda tutulur (tüm durumu birleştirilebilir sketch ve sayaçlardır) ve pickle edilir;
+    eklenen her parti içerik hash'iyle kaydedilir, aynı parti ikinci kez eklenmez.
+    Profiler sürümü ya da sketch parametreleri değişmişse kayıt yok sayılır.
+    Nesne yapısı: profiles/{dataset_id}.pkl
+    """
+    def __init__(self, minio_client: MinIOClient, prefix: str = "profiles"):
+        self.minio_client = minio_client
+        self.prefix = prefix
+
+    def _object_name(self, dataset_id: str) -> str:
+        return f"{self.prefix}/{dataset_id}.pkl"
+
+    @staticmethod
+    def _state_options(options: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: options[key] for key in STATE_OPTIONS}
+
+    def load(self, dataset_id: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Kayıtlı profil: {"profile": DataProfiler, "batches": [...], ...}; yoksa ya da uyumsuzsa None"""
+        object_name = self._object_name(dataset_id)
+        if not self.minio_client.object_exists(object_name):
+            return None
+        fd, tmp_path = tempfile.mkstemp(suffix=".pkl")
+        os.close(fd)
+        try:
+            self.minio_client.download_file(object_name, tmp_path)
+            with open(tmp_path, "rb") as f:
+                record = pickle.load(f)
+        finally:
+            os.unlink(tmp_path)
+        if record.get("profiler_version") != PROFILER_VERSION or record.get("options") != self._state_options(options):
+            logger.info(f"Kayıtlı profil güncel ayarlarla uyumsuz, yeniden çıkarılacak: {dataset_id}")
+            return None
+        return record
+
+    def save(self, dataset_id: str, profile: DataProfiler, batches: list, options: Dict[str, Any]) -> Dict[str, Any]:
+        if not profile.approximate:
+            raise ValueError("Yalnızca approximate profiller saklanabilir")
+        record = {
+            "profile": profile,
+            "batches": batches,
+            "options": self._state_options(options),
+            "profiler_version": PROFILER_VERSION
+        }
+        fd, tmp_path = tempfile.mkstemp(suffix=".pkl")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self.minio_client.upload_file(tmp_path, self._object_name(dataset_id))
+        finally:
+            os.unlink(tmp_path)
+        return record
+
+
+_profile_store = None
+
+def get_profile_store() -> ProfileStore:
+    """Uygulama genelinde tek ProfileStore örneği"""
+    global _profile_store
+    if _profile_store is None:
+        _profile_store = ProfileStore(get_minio_client())
+    return _profile_store
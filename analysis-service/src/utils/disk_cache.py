@@ -0,0 +1,61 @@
+import os
+import time
+from utils.logger import logger
+
+# Yeni kullanılan dosyalar silinmez; get_path ile dönen yol açılmadan önce silinmesin
+MIN_IDLE_SECONDS = 300
+
+
+def touch(path: str):
+    """Önbellek dosyasının son kullanım zamanını güncelle (LRU sırası mtime'a göre tutulur)"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def evict(directory: str, max_mb: int = 0, ttl_seconds: int = 0, min_idle_seconds: int = MIN_IDLE_SECONDS) -> int:
+    """
+    Yerel önbellek klasörünü boyut ve yaşa göre temizle.
+    ttl_seconds'tan uzun süredir kullanılmayan dosyalar silinir; toplam boyut max_mb'ı aşıyorsa en uzun
+    süredir kullanılmayanlardan başlanarak silinir (0 = sınırsız). Silinen dosya sayısını döndürür.
+    """
+    if max_mb <= 0 and ttl_seconds <= 0:
+        return 0
+    entries = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                except OSError:
+                    continue
+    except FileNotFoundError:
+        return 0
+    now = time.time()
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    max_bytes = max_mb * 1024 * 1024
+    removed = 0
+    for mtime, size, path in entries:
+        idle = now - mtime
+        expired = ttl_seconds > 0 and idle > ttl_seconds
+        over_size = max_bytes > 0 and total > max_bytes
+        if not (expired or over_size):
+            break
+        if idle < min_idle_seconds:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Önbellek dosyası silinemedi: {path} ({e})")
+            continue
+        total -= size
+        removed += 1
+    if removed:
+        logger.info(f"Yerel önbellek temizlendi: {directory} ({removed} dosya)")
+    return removed
@@ -0,0 +1,12 @@
+import hashlib
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Dosyanın sha256 hash'ini sabit boyutlu bloklar halinde hesapla"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,44 @@
+import hashlib
+import os
+import tempfile
+from typing import Tuple
+from fastapi import UploadFile
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+COMPRESSED_SUFFIXES = ('.gz', '.bz2', '.zst')
+
+
+def upload_suffix(filename: str, default: str = "") -> str:
+    """
+    Yüklenen dosyanın uzantısı (DataLoader formatı buna göre seçer).
+    Sıkıştırılmış dosyalarda çift uzantı korunur: data.csv.gz -> .csv.gz
+    """
+    base, ext = os.path.splitext(filename or "")
+    if ext.lower() in COMPRESSED_SUFFIXES:
+        ext = os.path.splitext(base)[1] + ext
+    return ext or default
+
+
+async def save_upload_to_tempfile(upload: UploadFile, suffix: str = None, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Tuple[str, str, int]:
+    """
+    UploadFile'ı sabit boyutlu bloklar halinde geçici dosyaya yazar ve yol boyunca sha256 hesaplar.
+    İstek gövdesi hiçbir zaman tamamen belleğe alınmaz. Dönüş: (dosya yolu, sha256, boyut)
+    """
+    if suffix is None:
+        suffix = upload_suffix(upload.filename)
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        try:
+            while True:
+                block = await upload.read(chunk_size)
+                if not block:
+                    break
+                digest.update(block)
+                tmp.write(block)
+                size += len(block)
+        except Exception:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    return tmp.name, digest.hexdigest(), size
@@ -6,6 +6,8 @@ from datetime import datetime
 from services.mlflow_client import MLflowService
 from config.config import Config
 from utils.logger import setup_logger
+from utils.upload import save_upload_to_tempfile
+import os
 from mlflow.tracking import MlflowClient
 
 logger = setup_logger()
@@ -31,14 +33,20 @@ async def submit_model(
     data_file_name: str = Form(None),
     metrics: str = Form(None),
     run_name: str = Form(None),
-    description: str = Form(None)
+    description: str = Form(None),
+    preprocessor: UploadFile = File(None)
 ):
     """
     Analysis service'ten model ve metrikleri al, MLflow'a kaydet
-    Sadece model dosyası ve metrikler işlenir, artifact dosyaları loglanmaz.
+    Model dosyası ve metrikler işlenir; fit edilmiş önişleme gönderildiyse aynı run'a artifact olarak eklenir.
     """
+    model_path = None
+    preprocessor_path = None
     try:
-        model_data = await file.read()
+        # Model dosyası belleğe alınmadan geçici dosyaya akıtılır
+        model_path, _, _ = await save_upload_to_tempfile(file, suffix=".pkl")
+        if preprocessor is not None:
+            preprocessor_path, _, _ = await save_upload_to_tempfile(preprocessor, suffix=".joblib")
         # Metrics'i parse et
         if metrics:
             try:
@@ -62,13 +70,15 @@ async def submit_model(
         logger.info(f"MLFLOW_API: data_file_name = {data_file_name}")
         # MLflow'a kaydet
         run_id = mlflow_service.log_model_and_metrics(
-            model_data=model_data,
+            model_data=None,
+            model_path=model_path,
             metrics=metrics_dict,
             model_name=model_name,
             model_type=model_type,
             problem_type=problem_type,
             data_file_name=data_file_name,
-            run_name=run_name
+            run_name=run_name,
+            preprocessor_path=preprocessor_path
         )
         # Model versiyonunu bul
         client = MlflowClient()
@@ -94,6 +104,10 @@ async def submit_model(
     except Exception as e:
         logger.error(f"Model kaydetme hatası: {e}")
         raise HTTPException(status_code=500, detail=f"Model kaydetme hatası: {str(e)}")
+    finally:
+        for path in (model_path, preprocessor_path):
+            if path and os.path.exists(path):
+                os.unlink(path)
     
     
 
@@ -4,6 +4,7 @@ from mlflow.tracking import MlflowClient
 from typing import Dict, Any, Optional, List
 import joblib
 import tempfile
+import shutil
 import os
 from config.config import MLflowConfig
 from utils.logger import setup_logger
@@ -41,14 +42,19 @@ class MLflowService:
             raise
     
     def log_model_and_metrics(self, 
-                            model_data: bytes,
+                            model_data: Optional[bytes],
                             metrics: Dict[str, Any],
                             model_name: str,
                             model_type: str,
                             problem_type: str,
                             data_file_name: str,
-                            run_name: Optional[str] = None) -> str:
-        """Model ve metrikleri MLflow'a kaydet"""
+                            run_name: Optional[str] = None,
+                            model_path: Optional[str] = None,
+                            preprocessor_path: Optional[str] = None) -> str:
+        """
+        Model ve metrikleri MLflow'a kaydet (model byte olarak ya da diskteki dosya yolu olarak verilebilir).
+        preprocessor_path: fit edilmiş önişleme dosyası; run'a preprocessing/preprocessor.joblib olarak eklenir.
+        """
         logger.info(f"MLFLOW_CLIENT: data_file_name = {data_file_name}")
         data_file_name_no_ext = os.path.splitext(data_file_name)[0] if data_file_name else "unknown_data"
         experiment_name = f"{problem_type}_{data_file_name_no_ext}" if problem_type and data_file_name_no_ext else (self.config.experiment_name or "default")
@@ -61,10 +67,13 @@ class MLflowService:
         mlflow.set_experiment(experiment_name)
         with mlflow.start_run(run_name=run_name) as run:
             try:
-                # Temporary file'a model'i kaydet
-                with tempfile.NamedTemporaryFile(suffix='.pkl', delete=False) as tmp_file:
-                    tmp_file.write(model_data)
-                    tmp_model_path = tmp_file.name
+                # Model diskte değilse temporary file'a kaydet
+                if model_path is None:
+                    with tempfile.NamedTemporaryFile(suffix='.pkl', delete=False) as tmp_file:
+                        tmp_file.write(model_data)
+                        tmp_model_path = tmp_file.name
+                else:
+                    tmp_model_path = model_path
                 # Model'i yükle
                 model = joblib.load(tmp_model_path)
                 # Model parametrelerini log et
@@ -104,6 +113,13 @@ class MLflowService:
                     artifact_path=self.config.artifact_path,
                     registered_model_name=model_name
                 )
+                # Çıkarımda aynı dönüşüm için önişleme modelin yanında saklanır
+                if preprocessor_path:
+                    preprocessor_dir = tempfile.mkdtemp()
+                    preprocessor_file = os.path.join(preprocessor_dir, "preprocessor.joblib")
+                    shutil.copyfile(preprocessor_path, preprocessor_file)
+                    mlflow.log_artifact(preprocessor_file, "preprocessing")
+                    shutil.rmtree(preprocessor_dir)
                 # Confusion matrix'i artifact olarak kaydet
                 if "evaluation_metrics" in metrics and "confusion_matrix" in metrics["evaluation_metrics"]:
                     import json
@@ -116,7 +132,8 @@ class MLflowService:
                     mlflow.log_artifact(tmp_cm_path, "evaluation")
                     os.unlink(tmp_cm_path)
                 # Temporary model file'ı temizle
-                os.unlink(tmp_model_path)
+                if model_path is None:
+                    os.unlink(tmp_model_path)
                 run_id = run.info.run_id
                 logger.info(f"Model ve metrikler MLflow'a kaydedildi. Run ID: {run_id}")
                 return run_id
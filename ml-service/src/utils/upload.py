@@ -0,0 +1,32 @@
+import hashlib
+import os
+import tempfile
+from typing import Tuple
+from fastapi import UploadFile
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def save_upload_to_tempfile(upload: UploadFile, suffix: str = None, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Tuple[str, str, int]:
+    """
+    UploadFile'ı sabit boyutlu bloklar halinde geçici dosyaya yazar ve yol boyunca sha256 hesaplar.
+    İstek gövdesi hiçbir zaman tamamen belleğe alınmaz. Dönüş: (dosya yolu, sha256, boyut)
+    """
+    if suffix is None:
+        suffix = os.path.splitext(upload.filename or "")[1]
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        try:
+            while True:
+                block = await upload.read(chunk_size)
+                if not block:
+                    break
+                digest.update(block)
+                tmp.write(block)
+                size += len(block)
+        except Exception:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    return tmp.name, digest.hexdigest(), size
@@ -1,11 +1,18 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import requests
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 
+ANALYSIS_API = "http://analysis-service:8000/api/data"
+# Bu sayıdan fazla sayısal sütunda tam matris yerine en güçlü çiftler gösterilir
+MAX_HEATMAP_COLUMNS = 30
+# Hücre değerleri yalnızca küçük matrislerde yazılır
+MAX_ANNOTATED_COLUMNS = 15
+
 BADGE_STYLE = """
     background-color: #f0f2f6;
     border-radius: 12px;
@@ -22,6 +29,7 @@ def show_data_analysis(backend_result, df: pd.DataFrame):
     """Tüm veri analizi sekmelerini ve yönlendirmesini yönetir."""
     data = backend_result.get("data_analysis", {})
     suggestions = backend_result.get("preprocessing_suggestions", [])
+    aggregates = fetch_chart_aggregates(backend_result.get("dataset_id"))
 
     tab_titles = [
         "Özet",
@@ -44,13 +52,13 @@ def show_data_analysis(backend_result, df: pd.DataFrame):
     with tabs[3]:
         show_suggestions_tab(suggestions)
     with tabs[4]:
-        show_histograms_tab(data, df)
+        show_histograms_tab(data, df, aggregates)
     with tabs[5]:
         show_boxplot_tab(data, df)
     with tabs[6]:
-        show_categorical_tab(data, df)
+        show_categorical_tab(data, df, aggregates)
     with tabs[7]:
-        show_correlation_tab(df)
+        show_correlation_tab(df, aggregates, backend_result.get("dataset_id"))
 
 
 # --- Sekme Fonksiyonları ---
@@ -96,7 +104,7 @@ def show_suggestions_tab(suggestions):
     for sug in suggestions:
         st.warning(sug)
 
-def show_histograms_tab(data, df):
+def show_histograms_tab(data, df, aggregates=None):
     """Sayısal sütunlar için histogram sekmesi."""
     st.markdown("<h2 style='color:#1976d2; font-weight:700; margin-bottom:0.2em;'>Sayısal Sütunlar - Histogramlar 📊</h2>", unsafe_allow_html=True)
     st.info("Sayısal sütunların dağılımını inceleyin. Birden fazla sütun seçebilirsiniz.")
@@ -112,12 +120,25 @@ def show_histograms_tab(data, df):
                 if idx < len(selected):
                     col = selected[idx]
                     with cols[j]:
-                        fig = px.histogram(
-                            df, x=col, nbins=30, title=f"{col} Dağılımı",
-                            template="plotly_white",
-                            color_discrete_sequence=["#636EFA"],
-                            opacity=0.85
-                        )
+                        hist = (aggregates or {}).get("histograms", {}).get(col)
+                        if hist:
+                            # Kutu kenarları ve sayıları backend'den gelir; ham veri yeniden taranmaz
+                            edges = hist["edges"]
+                            fig = go.Figure(go.Bar(
+                                x=[(low + high) / 2 for low, high in zip(edges[:-1], edges[1:])],
+                                y=hist["counts"],
+                                width=[high - low for low, high in zip(edges[:-1], edges[1:])],
+                                marker_color="#636EFA",
+                                opacity=0.85
+                            ))
+                            fig.update_layout(title_text=f"{col} Dağılımı", template="plotly_white")
+                        else:
+                            fig = px.histogram(
+                                df, x=col, nbins=30, title=f"{col} Dağılımı",
+                                template="plotly_white",
+                                color_discrete_sequence=["#636EFA"],
+                                opacity=0.85
+                            )
                         fig.update_layout(
                             title_font_size=18,
                             xaxis_title=col,
@@ -132,26 +153,30 @@ def show_histograms_tab(data, df):
         st.info("Sayısal sütun yok.")
 
 def show_boxplot_tab(data, df):
-    """Sayısal sütunlar için boxplot sekmesi."""
+    """Sayısal sütunlar için boxplot sekmesi (kutu değerleri backend'in outlier istatistiklerinden gelir)."""
     st.markdown("<h2 style='color:#1976d2; font-weight:700; margin-bottom:0.2em;'>Sayısal Sütunlar - Boxplot (Plotly) 📦</h2>", unsafe_allow_html=True)
     st.info("Sayısal sütunların dağılımını ve aykırı değerlerini boxplot ile inceleyin.")
     num_cols = data.get("numeric_columns", [])
+    outliers = data.get("outliers", {})
     if num_cols:
         selected = st.multiselect("Boxplot görmek istediğiniz sütunlar", num_cols, default=num_cols[:3])
         fig = go.Figure()
         palette = px.colors.qualitative.Plotly
         for i, col in enumerate(selected):
+            stats = outliers.get(col)
+            if stats and stats.get("q1") is not None:
+                # Veri yeniden taranmaz; kutu ve çitler hazır istatistiklerden çizilir
+                box = dict(x=[col], q1=[stats["q1"]], median=[stats["median"]], q3=[stats["q3"]],
+                           lowerfence=[stats["lower_fence"]], upperfence=[stats["upper_fence"]])
+            else:
+                box = dict(y=df[col], boxmean='sd', boxpoints='all', jitter=0.5, pointpos=0)
             fig.add_trace(go.Box(
-                y=df[col],
                 name=col,
-                boxmean='sd',
                 marker_color=palette[i % len(palette)],
-                boxpoints='all',
-                jitter=0.5,
-                pointpos=0,
                 line=dict(width=2),
                 fillcolor=palette[i % len(palette)],
-                opacity=0.7
+                opacity=0.7,
+                **box
             ))
         fig.update_layout(
             boxmode='group',
@@ -162,12 +187,18 @@ def show_boxplot_tab(data, df):
             title_text="Seçili Sütunlar için Boxplot",
             title_font_size=20
         )
-        fig.update_traces(hovertemplate="Değer: %{y}")
         st.plotly_chart(fig, use_container_width=True)
+        table = {col: outliers[col] for col in selected if col in outliers}
+        if table:
+            with st.expander("Aykırı Değer İstatistikleri", expanded=False):
+                st.dataframe(pd.DataFrame(table).T[["count", "percentage", "lower_bound", "upper_bound", "min", "max", "source"]]
+                             .rename(columns={"count": "Aykırı Adet", "percentage": "Aykırı %", "lower_bound": "Alt Sınır",
+                                              "upper_bound": "Üst Sınır", "min": "Min", "max": "Maks", "source": "Kaynak"}),
+                             use_container_width=True)
     else:
         st.info("Sayısal sütun yok.")
 
-def show_categorical_tab(data, df):
+def show_categorical_tab(data, df, aggregates=None):
     """Kategorik sütunlar için grafik sekmesi."""
     st.markdown("<h2 style='color:#1976d2; font-weight:700; margin-bottom:0.2em;'>Kategorik Sütunlar - Grafikler 🥧📊</h2>", unsafe_allow_html=True)
     st.info("Kategorik sütunların dağılımını pie veya bar chart ile inceleyin. Birden fazla sütun seçebilirsiniz.")
@@ -181,8 +212,14 @@ def show_categorical_tab(data, df):
             cols = st.columns(n_cols)
             for j, col in enumerate(selected[i:i+n_cols]):
                 with cols[j]:
-                    vc_full = df[col].value_counts()
-                    n_classes = len(vc_full)
+                    top = (aggregates or {}).get("top_values", {}).get(col)
+                    if top:
+                        # Backend en sık değerleri ve geri kalanların toplamını gönderir
+                        vc_full = pd.Series(top["counts"], index=top["values"])
+                        if top["other"]:
+                            vc_full = pd.concat([vc_full, pd.Series({'Diğer': top["other"]})])
+                    else:
+                        vc_full = df[col].value_counts()
                     vc = vc_full.copy()
                     if chart_type == "Pie Grafikler":
                         max_pie_cats = 6
@@ -240,13 +277,69 @@ def show_categorical_tab(data, df):
     else:
         st.info("Kategorik sütun yok.")
 
-def show_correlation_tab(df):
-    """Korelasyon matrisi sekmesi."""
+def show_correlation_tab(df, aggregates=None, dataset_id=None):
+    """Korelasyon matrisi sekmesi (geniş verilerde en güçlü sütun çiftleri)."""
     st.markdown("<h2 style='color:#1976d2; font-weight:700; margin-bottom:0.2em;'>Korelasyon Matrisi 🔗</h2>", unsafe_allow_html=True)
     st.info("Sayısal sütunlar arasındaki korelasyonları inceleyin.")
-    show_correlation_heatmap(df)
+    method = st.radio("Korelasyon Yöntemi", ["Pearson", "Spearman"], horizontal=True).lower()
+    correlation = (aggregates or {}).get("correlation")
+    n_numeric = len(correlation["columns"]) if correlation else df.select_dtypes(include=['number']).shape[1]
+    if n_numeric > MAX_HEATMAP_COLUMNS:
+        c1, c2 = st.columns(2)
+        top_k = c1.slider("Gösterilecek çift sayısı", 5, 100, 20)
+        threshold = c2.slider("Minimum mutlak korelasyon", 0.0, 1.0, 0.5, 0.05)
+        result = fetch_analysis_json(f"correlation/{dataset_id}", method=method, top_k=top_k, threshold=threshold) if dataset_id else None
+        if result is None:
+            st.warning("Korelasyonlar backend'den alınamadı.")
+            return
+        show_correlation_pairs(result, threshold)
+        return
+    if method == "pearson" and correlation:
+        corr = pd.DataFrame(correlation["matrix"], index=correlation["columns"], columns=correlation["columns"], dtype=float)
+    else:
+        result = fetch_analysis_json(f"correlation/{dataset_id}", method=method) if dataset_id else None
+        if result is not None:
+            corr = pd.DataFrame(result["matrix"], index=result["columns"], columns=result["columns"], dtype=float)
+        else:
+            corr = df.select_dtypes(include=['number']).corr(method=method)
+    show_correlation_heatmap(corr=corr)
 
 # --- Yardımcı Fonksiyonlar ---
+def fetch_analysis_json(path, **params):
+    """analysis-service GET isteği; aynı istek oturumda bir kez yapılır, hata olursa None döner."""
+    cache = st.session_state.setdefault('analysis_requests', {})
+    key = (path, tuple(sorted(params.items())))
+    if key not in cache:
+        try:
+            response = requests.get(f"{ANALYSIS_API}/{path}", params=params)
+            cache[key] = response.json() if response.status_code == 200 else None
+        except requests.RequestException:
+            cache[key] = None
+    return cache[key]
+
+def fetch_chart_aggregates(dataset_id):
+    """Grafik özetlerini backend'den al; her veri seti için oturumda bir kez istenir."""
+    return fetch_analysis_json(f"profile/{dataset_id}") if dataset_id else None
+
+def show_correlation_pairs(result, threshold):
+    pairs = result.get("pairs", [])
+    st.caption(f"{len(result.get('columns', []))} sayısal sütun, {result.get('sampled_rows')} / {result.get('n_rows')} satır üzerinden")
+    if not pairs:
+        st.info(f"Mutlak korelasyonu {threshold:.2f} üzerinde olan sütun çifti yok.")
+        return
+    table = pd.DataFrame(pairs)
+    table["Çift"] = table["column_1"] + " ~ " + table["column_2"]
+    fig = px.bar(
+        table.iloc[::-1], x="correlation", y="Çift", orientation="h",
+        color="correlation", color_continuous_scale="RdBu_r", range_color=[-1, 1],
+        title="En Güçlü Korelasyonlar", template="plotly_white"
+    )
+    fig.update_layout(height=max(350, 22 * len(table)), margin=dict(l=10, r=10, t=40, b=10), title_font_size=18)
+    st.plotly_chart(fig, use_container_width=True)
+    with st.expander("Korelasyon Çiftleri", expanded=False):
+        st.dataframe(table.rename(columns={"column_1": "Sütun 1", "column_2": "Sütun 2", "correlation": "Korelasyon"})
+                     [["Sütun 1", "Sütun 2", "Korelasyon"]], use_container_width=True)
+
 def show_dtype_pie(df):
     dtype_map = {
         'int64': 'Sayısal',
@@ -263,15 +356,16 @@ def show_dtype_pie(df):
     fig.update_layout(margin=dict(l=10, r=10, t=40, b=10), height=350, title_font_size=18)
     st.plotly_chart(fig, use_container_width=True)
 
-def show_correlation_heatmap(df):
-    num_df = df.select_dtypes(include=['number'])
-    if num_df.shape[1] < 2:
+def show_correlation_heatmap(df=None, corr=None):
+    if corr is None:
+        corr = df.select_dtypes(include=['number']).corr()
+    if corr.shape[1] < 2:
         st.info("Korelasyon matrisi için en az iki sayısal sütun olmalı.")
         return
-    corr = num_df.corr()
     n = corr.shape[0]
     size = min(max(120 * n, 400), 800)
-    fig = px.imshow(corr, text_auto=True, aspect="auto", title="Korelasyon Matrisi")
+    fig = px.imshow(corr, text_auto=".2f" if n <= MAX_ANNOTATED_COLUMNS else False, aspect="auto",
+                    zmin=-1, zmax=1, color_continuous_scale="RdBu_r", title="Korelasyon Matrisi")
     fig.update_layout(
         margin=dict(l=10, r=10, t=40, b=10),
         width=size,
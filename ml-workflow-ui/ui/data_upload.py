@@ -1,6 +1,61 @@
 import streamlit as st
 import pandas as pd
 import requests
+from ui.upload_utils import gzip_bytes, compression_of, iter_sse
+
+ANALYZE_STREAM_URL = "http://analysis-service:8000/api/data/analyze/stream"
+# Olay -> (ilerleme oranı, mesaj)
+ANALYSIS_STAGES = {
+    "schema": (0.15, "Şema okundu"),
+    "missing": (0.4, "Eksik değerler hesaplandı"),
+    "distributions": (0.75, "Dağılımlar ve öneriler hazır"),
+    "correlations": (0.95, "Korelasyonlar hesaplandı"),
+}
+
+
+def stream_analysis(**request_kwargs):
+    """
+    Analizi /analyze/stream üzerinden çalıştırır; aşamalar geldikçe ilerleme çubuğunu ve erken sonuçları
+    (şema, eksik değerler) gösterir. Dönüş: (analiz sonucu, hata mesajı)
+    """
+    progress = st.progress(0.0, text="Analiz başlatılıyor...")
+    preview = st.empty()
+    result, error = None, None
+    with requests.post(ANALYZE_STREAM_URL, stream=True, **request_kwargs) as response:
+        if response.status_code != 200:
+            progress.empty()
+            return None, response.text
+        schema = {}
+        for event, payload in iter_sse(response):
+            if event == "schema":
+                schema = payload
+                with preview.container():
+                    st.dataframe(pd.DataFrame({"Sütun": payload["columns"], "Tip": list(payload["data_types"].values())}),
+                                 use_container_width=True, hide_index=True)
+            elif event == "progress":
+                correlation = payload["stage"] == "correlation"
+                stage = "Korelasyonlar hesaplanıyor" if correlation else "Profil çıkarılıyor"
+                rows = payload.get("rows_processed")
+                progress.progress(0.8 if correlation else 0.2, text=f"{stage}... ({rows} satır işlendi)" if rows else f"{stage}...")
+            elif event == "missing":
+                missing = payload["missing_values"]
+                types = schema.get("data_types", {})
+                with preview.container():
+                    st.dataframe(pd.DataFrame({"Sütun": list(missing), "Tip": [types.get(col, "") for col in missing],
+                                               "Eksik Adet": list(missing.values())}),
+                                 use_container_width=True, hide_index=True)
+            elif event == "result":
+                result = payload
+            elif event == "error":
+                error = payload.get("error")
+            if event in ANALYSIS_STAGES:
+                progress.progress(*ANALYSIS_STAGES[event])
+    progress.empty()
+    preview.empty()
+    if result is None and error is None:
+        error = "Analiz akışı sonuç dönmeden kapandı"
+    return result, error
+
 
 def upload_data():
     st.markdown("""
@@ -9,11 +64,11 @@ def upload_data():
             <span style='font-size:1.6em;font-weight:bold;color:#1565c0;'>1. Adım: Veri Yükleme</span>
         </div>
         <div style='background:#F5FAFF;border-radius:12px;padding:18px 20px 10px 20px;margin-bottom:18px;box-shadow:0 2px 8px rgba(21,101,192,0.06);font-size:1.1em;color:#222;border:1px solid #1976d2;'>
-            <span style='font-weight:500;'>Analiz ve modelleme için <b>CSV veya XLSX formatında</b> veri dosyanızı yükleyin.</span><br>
+            <span style='font-weight:500;'>Analiz ve modelleme için <b>CSV (.gz/.bz2/.zst sıkıştırılmış olabilir), XLSX, Parquet, Feather veya Arrow formatında</b> veri dosyanızı yükleyin.</span><br>
             <span style='color:#1976d2;font-weight:500;'>Veriniz güvenli bir şekilde işlenecektir.</span>
         </div>
     """, unsafe_allow_html=True)
-    uploaded_file = st.file_uploader("Veri dosyanızı seçin (CSV veya XLSX)", type=["csv", "xlsx"])
+    uploaded_file = st.file_uploader("Veri dosyanızı seçin (CSV, XLSX, Parquet, Feather, Arrow)", type=["csv", "gz", "bz2", "zst", "xlsx", "parquet", "feather", "arrow"])
     if uploaded_file is not None:
         try:
             st.markdown("""
@@ -22,29 +77,51 @@ def upload_data():
                 </div>
             """, unsafe_allow_html=True)
             st.session_state['original_file_name'] = uploaded_file.name
+            compression = compression_of(uploaded_file.name)
+            upload_name, upload_body = uploaded_file.name, uploaded_file
             # Content type belirle
-            if uploaded_file.name.endswith('.csv'):
-                content_type = "text/csv"
+            if compression:
+                content_type = "application/octet-stream"
+            elif uploaded_file.name.endswith('.csv'):
+                # Düz CSV gönderimden önce sıkıştırılır; sunucu .csv.gz dosyasını akış halinde açar
+                upload_name, upload_body = f"{uploaded_file.name}.gz", gzip_bytes(uploaded_file.getvalue())
+                content_type = "application/gzip"
             elif uploaded_file.name.endswith('.xlsx'):
                 content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            elif uploaded_file.name.endswith('.parquet'):
+                content_type = "application/vnd.apache.parquet"
+            elif uploaded_file.name.endswith(('.feather', '.arrow')):
+                content_type = "application/vnd.apache.arrow.file"
             else:
                 content_type = "application/octet-stream"
-            files = {"file": (uploaded_file.name, uploaded_file, content_type)}
-            response = requests.post(
-                "http://analysis-service:8000/api/data/analyze",
-                files=files
-            )
-            if response.status_code == 200:
-                result = response.json()
+            upload_key = (uploaded_file.name, uploaded_file.size)
+            if st.session_state.get('analysis_upload_key') == upload_key and st.session_state.get('dataset_id'):
+                # Streamlit her etkileşimde betiği yeniden çalıştırır; aynı dosya tekrar gönderilmez,
+                # kayıtlı veri seti dataset_id ile yeniden istenir (sonuç sunucu önbelleğinden döner)
+                result, error = stream_analysis(data={"dataset_id": st.session_state['dataset_id'], "optimize_memory": "true"})
+            else:
+                # Sonuçlar aşama aşama akar; büyük dosyalarda sayfa yanıt beklerken donmaz
+                files = {"file": (upload_name, upload_body, content_type)}
+                result, error = stream_analysis(files=files, data={"optimize_memory": "true"})
+            if result is not None:
+                st.session_state['analysis_upload_key'] = upload_key
+                # Sonraki adımlar veriyi yeniden yüklemek yerine dataset_id ile referans verir
+                st.session_state['dataset_id'] = result.get('dataset_id')
                 st.success("Veri başarıyla analiz edildi!")
                 st.markdown("<span style='font-size:1.1em;font-weight:700;color:#1976d2;'>Veri Önizlemesi (ilk 10 satır):</span>", unsafe_allow_html=True)
                 uploaded_file.seek(0)
-                if uploaded_file.name.endswith('.csv'):
+                if compression:
+                    df = pd.read_csv(uploaded_file, compression=compression)
+                elif uploaded_file.name.endswith('.csv'):
                     df = pd.read_csv(uploaded_file)
                 elif uploaded_file.name.endswith('.xlsx'):
                     df = pd.read_excel(uploaded_file)
+                elif uploaded_file.name.endswith('.parquet'):
+                    df = pd.read_parquet(uploaded_file)
+                elif uploaded_file.name.endswith(('.feather', '.arrow')):
+                    df = pd.read_feather(uploaded_file)
                 else:
-                    st.error("Sadece CSV veya XLSX dosyaları destekleniyor.")
+                    st.error("Sadece CSV, XLSX, Parquet, Feather veya Arrow dosyaları destekleniyor.")
                     return None, None
                 target_col = df.columns[-1] if len(df.columns) > 0 else None
                 if target_col:
@@ -52,11 +129,11 @@ def upload_data():
                 st.dataframe(df.head(10), use_container_width=True, hide_index=True)
                 return result, df
             else:
-                st.error(f"Backend hata döndürdü: {response.text}")
+                st.error(f"Backend hata döndürdü: {error}")
                 return None, None
         except Exception as e:
             st.error(f"Veri gönderilirken hata oluştu: {e}")
             return None, None
     else:
-        st.info("Lütfen analiz için bir CSV veya XLSX dosyası yükleyin.")
+        st.info("Lütfen analiz için bir CSV, XLSX, Parquet, Feather veya Arrow dosyası yükleyin.")
         return None, None 
\ No newline at end of file
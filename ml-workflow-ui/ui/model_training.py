@@ -4,6 +4,7 @@ import requests
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+from ui.upload_utils import csv_upload
 
 def safe_float(val):
     try:
@@ -381,9 +382,8 @@ def model_training_step(df: pd.DataFrame, target_column: str, original_file_name
     if st.button("Model(leri) Eğit ve MLflow'a Kaydet"):
         if not allow_train:
             st.stop()
-        csv_buffer = df.to_csv(index=False).encode("utf-8")
         file_name = original_file_name if original_file_name else "data.csv"
-        files = {"data_file": (file_name, csv_buffer, "text/csv")}
+        files = {"data_file": csv_upload(df, file_name)}
         data = {
             "model_name": model_name,
             "model_type": model_types,
@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import requests
 import json
+from ui.upload_utils import csv_upload
 
 def preprocessing_step(df: pd.DataFrame):
     st.markdown("""
@@ -58,12 +59,19 @@ def preprocessing_step(df: pd.DataFrame):
         apply = st.button("Önişlemeyi Uygula")
 
     if apply:
-        csv_buffer = df_proc.to_csv(index=False).encode("utf-8")
-        files = {"file": ("data.csv", csv_buffer, "text/csv")}
         data = {
             "config": json.dumps(config),
             "target_column": target_column
         }
+        dataset_id = st.session_state.get('dataset_id')
+        if dataset_id:
+            # Veri analysis-service'te zaten kayıtlı, yeniden yüklenmez; kaldırılan sütunlar sunucuda hiç okunmaz
+            files = None
+            data["dataset_id"] = dataset_id
+            if drop_cols:
+                data["drop_columns"] = json.dumps(drop_cols)
+        else:
+            files = {"file": csv_upload(df_proc)}
         with st.spinner("Önişleme uygulanıyor, lütfen bekleyin..."):
             response = requests.post(
                 "http://analysis-service:8000/api/data/preprocess",
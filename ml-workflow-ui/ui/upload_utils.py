@@ -0,0 +1,42 @@
+import gzip
+import json
+import pandas as pd
+
+COMPRESSED_SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.zst': 'zstd'}
+
+
+def gzip_bytes(data: bytes) -> bytes:
+    """Yükleme öncesi hızlı gzip sıkıştırma (mtime=0: aynı içerik aynı baytları, dolayısıyla aynı dataset_id'yi üretir)"""
+    return gzip.compress(data, compresslevel=1, mtime=0)
+
+
+def csv_upload(df: pd.DataFrame, file_name: str = "data.csv"):
+    """DataFrame'i gzip'li CSV olarak multipart dosya alanına hazırla (analysis-service .csv.gz dosyalarını akış halinde açar)"""
+    if compression_of(file_name):
+        file_name = file_name.rsplit('.', 1)[0]
+    base_name = file_name.rsplit('.', 1)[0] if '.' in file_name else file_name
+    return (f"{base_name}.csv.gz", gzip_bytes(df.to_csv(index=False).encode("utf-8")), "application/gzip")
+
+
+def compression_of(file_name: str):
+    """Dosya adından pandas compression parametresi (sıkıştırılmamışsa None)"""
+    for suffix, compression in COMPRESSED_SUFFIXES.items():
+        if file_name.endswith(suffix):
+            return compression
+    return None
+
+
+def iter_sse(response):
+    """requests akış yanıtındaki Server-Sent Events olaylarını (olay adı, JSON veri) olarak üret"""
+    event, data = "message", []
+    for line in response.iter_lines(decode_unicode=True):
+        if not line:
+            if data:
+                yield event, json.loads("\n".join(data))
+            event, data = "message", []
+        elif line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            data.append(line[5:].strip())
+    if data:
+        yield event, json.loads("\n".join(data))